@@ -12,8 +12,30 @@ class Config:
     # configurações de segurança
     SECRET_KEY = os.getenv("SECRET_KEY")
 
-    # caching básico
+    # caching básico das respostas GET ('simple' = LRU em memória; 'null' desabilita)
     CACHE_TYPE = 'simple'
+    CACHE_THRESHOLD = 500
+    CACHE_MAX_BYTES = 32 * 1024 * 1024        # total guardado (corpo e variantes comprimidas)
+    CACHE_MAX_ENTRY_BYTES = 1024 * 1024       # respostas maiores não são guardadas
+
+    # base de livros servida pela API
+    CATALOG_PATH = os.path.join(BASE_DIR, "data", "base_livros.csv")
+
+    # mesma base no formato colunar (mapeado em memória), gerado pela ingestão; sem ele, usa o CSV
+    CATALOG_COLUMNAR_PATH = os.path.join(BASE_DIR, "data", "base_livros.columns")
+
+    # intervalo (em segundos) de verificação dos arquivos da base para recarga automática (0 desabilita)
+    CATALOG_WATCH_INTERVAL = 5
+
+    # token das rotas de administração (header X-Admin-Token); sem ele, as rotas ficam desabilitadas
+    ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+    # maior quantidade de livros por página nas rotas de listagem (parâmetro limit)
+    PAGINATION_MAX_LIMIT = 1000
+
+    # cache de tokens JWT já verificados (evita checar a assinatura a cada requisição)
+    JWT_VERIFIED_CACHE_SIZE = 1024
+    JWT_VERIFIED_CACHE_TTL = 300              # segundos (nunca ultrapassa o exp do token)
 
     # título e versão da doc interativa
     SWAGGER = {
@@ -25,3 +47,29 @@ class Config:
     SUPABASE_URL = os.getenv("SUPABASE_URL")
     SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 
+    # cache das consultas de usuários no login (username -> id e hash da senha)
+    USER_CACHE_TTL = 300                      # segundos
+    USER_NEGATIVE_CACHE_TTL = 10              # segundos (usernames inexistentes)
+
+    # métricas das requisições (rota /metrics no formato do Prometheus) e cabeçalho Server-Timing
+    METRICS_ENABLED = True
+    METRICS_SERVER_TIMING = True
+
+    # perfil (cProfile) de requisições: header X-Profile: 1 com X-Admin-Token ou amostragem aleatória
+    PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "0") == "1"
+    PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+    PROFILING_DIR = os.path.join(BASE_DIR, "logs", "profiles")
+    PROFILING_MAX_FILES = 50
+
+    # intervalo (em segundos) entre verificações do banco de dados feitas em segundo plano
+    HEALTH_PROBE_INTERVAL = 30
+
+    # envio dos logs de requisições ao supabase (fila em memória, enviada em lotes)
+    REQUEST_LOG_QUEUE_SIZE = 10000
+    REQUEST_LOG_BATCH_SIZE = 100
+    REQUEST_LOG_FLUSH_INTERVAL = 2.0          # segundos
+    REQUEST_LOG_OVERFLOW = 'spill'            # 'spill' grava o excedente em arquivo; 'drop' descarta
+    REQUEST_LOG_SPILL_FILE = os.path.join(BASE_DIR, "logs", "request_logs_spill.jsonl")
+    REQUEST_LOG_SPILL_MAX_BYTES = 10 * 1024 * 1024    # rotaciona para <arquivo>.1 (0 desabilita)
+    REQUEST_LOG_REPLAY_INTERVAL = 60.0                # segundos entre reenvios dos excedentes
+
@@ -0,0 +1,36 @@
+# ----------------------------------------------------------------------------------------------- #
+# Configuração do gunicorn (lida automaticamente quando o gunicorn roda na raiz do projeto)
+# ----------------------------------------------------------------------------------------------- #
+#
+#   gunicorn main:app --workers 4
+#
+# A aplicação é carregada uma única vez no master (preload_app) e os workers são criados por fork,
+# herdando o catálogo e seus índices já construídos: a memória total fica praticamente estável ao
+# adicionar workers e cada worker sobe sem ler a base. A quantidade de workers vem de --workers ou
+# da variável WEB_CONCURRENCY.
+
+import os
+import signal
+
+# GUNICORN_PRELOAD=0 volta a carregar a aplicação separadamente em cada worker
+preload_app = os.getenv("GUNICORN_PRELOAD", "1") != "0"
+
+def when_ready(server):
+    from src.instances import catalog
+
+    # master, antes do fork dos workers: gera o arquivo colunar da base se ele não existir (não é versionado)
+    catalog.ensure_columnar()
+
+    # aquece o catálogo e congela os objetos (ver CatalogStore.preload)
+    if not server.cfg.preload_app:
+        return
+
+    snapshot = catalog.preload()
+    server.log.info(f"Catálogo pré-carregado no master: versão {snapshot.version} ({len(snapshot)} livros)")
+
+def post_worker_init(worker):
+    # o worker restaura os handlers padrão de sinais após o fork: SIGHUP volta a recarregar o catálogo
+    if worker.cfg.preload_app and hasattr(signal, "SIGHUP"):
+        from src.instances import catalog
+
+        signal.signal(signal.SIGHUP, lambda signum, frame: catalog.reload_async())
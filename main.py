@@ -2,37 +2,104 @@
 # Imports
 # ----------------------------------------------------------------------------------------------- #
 
+import time
+IMPORT_START = time.perf_counter()
+
 from dotenv import load_dotenv
 load_dotenv()
 
+from contextlib import contextmanager
 from flask import Flask
 import os
+import signal
+import threading
 
-from src.api import api_endpoints, home_layout, login_routes
-from src.instances import bp, swagger, jwt, supabase
+from src.api import admin_routes, api_endpoints, home_layout, login_routes, metrics_routes
+from src.instances import bp, swagger, jwt, supabase, catalog, response_cache, metrics, profiler
 from src.logging_config import setup_logging, register_request_logging
+from src.jwt_cache import token_cache
 
 from config import Config, BASE_DIR
 
+IMPORTS_MS = (time.perf_counter() - IMPORT_START) * 1000
+
+# ----------------------------------------------------------------------------------------------- #
+# Medição das fases de inicialização
+# ----------------------------------------------------------------------------------------------- #
+
+@contextmanager
+def startup_phase(timings: dict, name: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+
 # ----------------------------------------------------------------------------------------------- #
-# Inicializações
+# Criação da aplicação
 # ----------------------------------------------------------------------------------------------- #
 
-# iniciar aplicação
-app = Flask(__name__,
-            template_folder = os.path.join(BASE_DIR, "src", "templates"),
-            static_folder = os.path.join(BASE_DIR, "src", "static"))
+def create_app(config_object = Config) -> Flask:
+    """
+    Cria e configura a aplicação Flask.
+
+    Apenas o necessário para atender a primeira requisição é feito aqui: o
+    cliente do Supabase é criado no primeiro acesso ao banco e o Plotly é
+    importado na primeira renderização da página inicial. A duração de cada fase
+    da inicialização fica em `app.extensions["startup_timings"]` (em ms) e é
+    registrada no log.
+
+    Args:
+        config_object: Classe (ou objeto) com as configurações da aplicação.
+
+    Returns:
+        Flask: Aplicação pronta para receber requisições.
+    """
+    start = time.perf_counter()
+    timings = {"imports": round(IMPORTS_MS, 1)}
+
+    # iniciar aplicação
+    with startup_phase(timings, "app"):
+        app = Flask(__name__,
+                    template_folder = os.path.join(BASE_DIR, "src", "templates"),
+                    static_folder = os.path.join(BASE_DIR, "src", "static"))
+
+        app.config.from_object(config_object)
+
+    # inicializar as instâncias no app
+    with startup_phase(timings, "extensions"):
+        swagger.init_app(app)
+        jwt.init_app(app)
+        token_cache.init_app(app)
+        response_cache.init_app(app)
+        catalog.init_app(app)
+        metrics.init_app(app)
+        profiler.init_app(app)
+
+    with startup_phase(timings, "logging"):
+        setup_logging(app)
+        register_request_logging(app, supabase)
+
+    # carregar o catálogo de livros uma única vez por processo
+    with startup_phase(timings, "catalog"):
+        catalog.load()
+
+    # registrar as rotas
+    with startup_phase(timings, "routes"):
+        app.register_blueprint(bp)
+
+    # SIGHUP recarrega o catálogo em segundo plano (o sinal só pode ser registrado na thread principal)
+    if hasattr(signal, "SIGHUP") and threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGHUP, lambda signum, frame: catalog.reload_async())
 
-app.config.from_object(Config)
+    timings["create_app"] = round((time.perf_counter() - start) * 1000, 1)
+    timings["total"] = round((time.perf_counter() - IMPORT_START) * 1000, 1)
+    app.extensions["startup_timings"] = timings
 
-# inicializar as instâncias no app
-swagger.init_app(app)
-jwt.init_app(app)
-setup_logging(app)
-register_request_logging(app, supabase)
+    app.logger.info("Inicialização (ms): " + ", ".join(f"{name}={ms}" for name, ms in timings.items()))
+    return app
 
-# registrar as rotas
-app.register_blueprint(bp)
+app = create_app()
 
 # ----------------------------------------------------------------------------------------------- #
 # Executar o app localmente
@@ -41,4 +108,3 @@ app.register_blueprint(bp)
 if __name__ == '__main__':
     with app.app_context():
         app.run(debug = True)
-    
\ No newline at end of file
@@ -0,0 +1,199 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import hmac
+from functools import wraps
+
+from flask import Response, current_app, jsonify, request, send_file
+
+from ..instances import bp, catalog, profiler
+
+# ----------------------------------------------------------------------------------------------- #
+# Autorização das rotas de administração
+# ----------------------------------------------------------------------------------------------- #
+
+def is_admin_request() -> bool:
+    """Indica se a requisição traz o token de admin configurado (header X-Admin-Token)."""
+    token = current_app.config.get("ADMIN_TOKEN")
+    given = request.headers.get("X-Admin-Token", "")
+    return bool(token) and hmac.compare_digest(given.encode("utf-8"), token.encode("utf-8"))
+
+def admin_required(fn):
+    """Restringe a rota a requisições com o token de admin (rota desabilitada sem ADMIN_TOKEN)."""
+    @wraps(fn)
+    def decorator(*args, **kwargs):
+        if not current_app.config.get("ADMIN_TOKEN"):
+            return jsonify({"error": "Rotas de administração desabilitadas (ADMIN_TOKEN não configurado)"}), 403
+        if not is_admin_request():
+            return jsonify({"error": "Token de admin inválido"}), 401
+        return fn(*args, **kwargs)
+
+    return decorator
+
+# ----------------------------------------------------------------------------------------------- #
+# Recarregar o catálogo
+# ----------------------------------------------------------------------------------------------- #
+
+@bp.route('/api/v1/admin/reload', methods = ['POST'])
+@admin_required
+def reload_catalog():
+    """
+    Recarrega o catálogo de livros a partir dos arquivos de dados, sem reiniciar a API.
+
+    O novo snapshot é construído por completo antes de substituir o atual;
+    requisições em andamento terminam com a versão anterior. Com vários workers,
+    apenas o worker que atendeu a requisição recarrega na hora (os demais
+    recarregam pelo watcher de arquivos).
+    ---
+    tags:
+      - Administração
+    parameters:
+      - name: X-Admin-Token
+        in: header
+        type: string
+        required: true
+        description: Token de administração (ADMIN_TOKEN)
+      - name: force
+        in: query
+        type: boolean
+        required: false
+        description: Troca o snapshot mesmo que a versão dos dados seja a mesma
+    responses:
+      200:
+        description: Catálogo recarregado (ou já na versão mais recente)
+      401:
+        description: Token de admin inválido
+      403:
+        description: Rotas de administração desabilitadas
+      500:
+        description: Erro ao ler os arquivos de dados (versão anterior mantida)
+    """
+    force = request.args.get("force", "").lower() in ("1", "true")
+
+    try:
+        previous_version, version = catalog.reload(force = force)
+    except Exception as e:
+        current_app.logger.error(f"Erro ao recarregar o catálogo: {e}")
+        return jsonify({"error": "Erro ao recarregar o catálogo", "version": catalog.version}), 500
+
+    return jsonify({
+        "previous_version": previous_version,
+        "version": version,
+        "reloaded": version != previous_version or force,
+        "rows": len(catalog.snapshot)
+    }), 200
+
+# ----------------------------------------------------------------------------------------------- #
+# Memória ocupada pelo catálogo
+# ----------------------------------------------------------------------------------------------- #
+
+@bp.route('/api/v1/admin/memory', methods = ['GET'])
+@admin_required
+def catalog_memory():
+    """
+    Relatório de memória do catálogo carregado neste worker.
+
+    Compara, coluna a coluna, a representação compacta em uso (inteiros estreitos,
+    colunas de dicionário e imagens sem o prefixo da URL) com a representação original.
+    ---
+    tags:
+      - Administração
+    parameters:
+      - name: X-Admin-Token
+        in: header
+        type: string
+        required: true
+        description: Token de administração (ADMIN_TOKEN)
+    responses:
+      200:
+        description: Bytes por coluna, totais e economia
+      401:
+        description: Token de admin inválido
+      403:
+        description: Rotas de administração desabilitadas
+    """
+    snap = catalog.snapshot
+
+    return jsonify({"version": snap.version, **snap.memory_report()}), 200
+
+# ----------------------------------------------------------------------------------------------- #
+# Perfis de requisições (cProfile)
+# ----------------------------------------------------------------------------------------------- #
+
+@bp.route('/api/v1/admin/profiles', methods = ['GET'])
+@admin_required
+def list_profiles():
+    """
+    Lista os perfis de requisições gravados (do mais recente para o mais antigo).
+
+    Um perfil é gravado quando o profiler está habilitado (PROFILING_ENABLED) e a
+    requisição traz o header `X-Profile: 1` com o token de admin, ou por amostragem
+    (PROFILING_SAMPLE_RATE). O id do perfil vem no header `X-Profile-Id` da resposta.
+    ---
+    tags:
+      - Administração
+    parameters:
+      - name: X-Admin-Token
+        in: header
+        type: string
+        required: true
+        description: Token de administração (ADMIN_TOKEN)
+    responses:
+      200:
+        description: Perfis gravados (id, rota, status e duração da requisição)
+      401:
+        description: Token de admin inválido
+      403:
+        description: Rotas de administração desabilitadas
+    """
+    return jsonify({"enabled": profiler.enabled, "profiles": profiler.list()}), 200
+
+@bp.route('/api/v1/admin/profiles/<profile_id>', methods = ['GET'])
+@admin_required
+def download_profile(profile_id):
+    """
+    Baixa um perfil de requisição no formato do pstats (ou o resumo em texto, com format=text).
+
+    O arquivo .prof pode ser aberto com `python -m pstats`, snakeviz ou similares.
+    ---
+    tags:
+      - Administração
+    parameters:
+      - name: X-Admin-Token
+        in: header
+        type: string
+        required: true
+        description: Token de administração (ADMIN_TOKEN)
+      - name: profile_id
+        in: path
+        type: string
+        required: true
+        description: Id do perfil (header X-Profile-Id)
+      - name: format
+        in: query
+        type: string
+        required: false
+        description: "'text' para o resumo das funções mais custosas (tempo acumulado)"
+    responses:
+      200:
+        description: Perfil (arquivo .prof ou texto)
+      401:
+        description: Token de admin inválido
+      403:
+        description: Rotas de administração desabilitadas
+      404:
+        description: Perfil não encontrado
+    """
+    if request.args.get("format") == "text":
+        text = profiler.text(profile_id)
+        if text is None:
+            return jsonify({"error": "Perfil não encontrado"}), 404
+        return Response(text, mimetype = "text/plain"), 200
+
+    path = profiler.path(profile_id)
+    if path is None:
+        return jsonify({"error": "Perfil não encontrado"}), 404
+
+    return send_file(path, mimetype = "application/octet-stream", as_attachment = True,
+                     download_name = f"{profile_id}.prof")
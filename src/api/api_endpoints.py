@@ -2,18 +2,54 @@
 # Imports
 # ----------------------------------------------------------------------------------------------- #
 
-from flask import request, jsonify
-from flask_jwt_extended import jwt_required
-import pandas as pd
+from flask import request, jsonify, current_app
 from datetime import datetime
+from urllib.parse import urlencode
 from zoneinfo import ZoneInfo
-from ..instances import bp, supabase
+from ..instances import bp, catalog, response_cache, health
+from ..catalog.pagination import paginate, PaginationError, PAGINATION_ARGS
+from ..catalog.serialization import json_response
+from ..jwt_cache import jwt_required
+from ..metrics import phase
 
 # ----------------------------------------------------------------------------------------------- #
-# Ler a base de dados
+# Paginar e projetar as rotas de listagem
 # ----------------------------------------------------------------------------------------------- #
 
-df = pd.read_csv('data/base_livros.csv')
+def get_page(snap, positions):
+    """Aplica limit/cursor/offset/fields da requisição corrente sobre uma listagem."""
+    return paginate(
+        positions, request.args, request.path, snap.version,
+        current_app.config['PAGINATION_MAX_LIMIT']
+    )
+
+def set_page_headers(response, page):
+    """Adiciona os cabeçalhos de paginação (total, próximo cursor e link da próxima página)."""
+    response.headers['X-Total-Count'] = str(page.total)
+
+    if page.next_cursor:
+        args = {k: v for k, v in request.args.items() if k not in ('cursor', 'offset')}
+        args['cursor'] = page.next_cursor
+        response.headers['X-Next-Cursor'] = page.next_cursor
+        response.headers['Link'] = f'<{request.path}?{urlencode(args)}>; rel="next"'
+
+    return response
+
+def list_response(snap, positions):
+    """
+    Responde uma rota de listagem com a página solicitada dos livros em `positions`.
+
+    O corpo é montado a partir do JSON pré-serializado de cada livro (ou dos
+    fragmentos por campo, quando há projeção), sem converter o DataFrame em registros.
+    """
+    try:
+        page = get_page(snap, positions)
+    except PaginationError as e:
+        return jsonify({'message': str(e)}), 400
+
+    with phase('serialize'):
+        response = json_response(snap.json_list(page.positions, page.fields))
+    return set_page_headers(response, page), 200
 
 # ----------------------------------------------------------------------------------------------- #
 # Listar os livros disponíveis na base de dados
@@ -21,6 +57,7 @@ df = pd.read_csv('data/base_livros.csv')
 
 @bp.route('/api/v1/books', methods = ['GET'])
 @jwt_required()
+@response_cache.cached(args = PAGINATION_ARGS)
 def get_books():
     """
     Lista de livros disponíveis na base
@@ -29,26 +66,68 @@ def get_books():
       - Informações dos livros
     security:
       - BearerAuth: []
+    parameters:
+      - in: query
+        name: limit
+        required: false
+        schema:
+          type: integer
+        description: Quantidade máxima de livros retornados
+      - in: query
+        name: cursor
+        required: false
+        schema:
+          type: string
+        description: Cursor da próxima página (cabeçalho X-Next-Cursor da resposta anterior)
+      - in: query
+        name: fields
+        required: false
+        schema:
+          type: string
+        description: Campos retornados, separados por vírgula (ex. id,title,price)
     responses:
       200:
-        description: Dicionário id-título
+        description: >
+          Objeto com os livros indexados pelo id (em texto), na ordem do catálogo. O valor
+          é o título do livro ou, quando `fields` é informado, um objeto com os campos pedidos.
+          Com `limit`/`cursor`, o objeto contém apenas os livros da página.
         schema:
           type: object
           additionalProperties:
-            type: string
+            oneOf:
+              - type: string
+              - type: object
+        examples:
+          application/json: {"1": "It's Only the Himalayas", "2": "Full Moon over Noah’s Ark"}
+      400:
+        description: Parâmetros de paginação inválidos
       401:
         description: Token não fornecido ou inválido
     """
-    dict_books = df.set_index('id')['title'].to_dict()
+    snap = catalog.snapshot
+    positions = range(len(snap))
 
-    return jsonify(dict_books), 200
+    # catálogo completo: payload serializado e comprimido uma vez por versão dos dados
+    if not PAGINATION_ARGS.intersection(request.args):
+        return snap.books_payload
+
+    try:
+        page = get_page(snap, positions)
+    except PaginationError as e:
+        return jsonify({'message': str(e)}), 400
+
+    # mesmo formato (id -> título ou id -> campos) e mesmo serializador do catálogo completo
+    with phase('serialize'):
+        response = json_response(snap.json_map(page.positions, page.fields))
+
+    return set_page_headers(response, page), 200
 
 # ----------------------------------------------------------------------------------------------- #
 # Listar todas as categorias de livros disponíveis
 # ----------------------------------------------------------------------------------------------- #
 
 @bp.route('/api/v1/categories', methods = ['GET'])
-
+@response_cache.cached()
 def get_categories():
     """
     Lista categorias únicas de livros
@@ -66,16 +145,14 @@ def get_categories():
               items:
                 type: string
     """
-    categories = {'categories': list(df['category'].unique())}
-    
-    return jsonify(categories), 200
+    return catalog.snapshot.categories_payload
 
 # ----------------------------------------------------------------------------------------------- #
 # Retornar detalhes completos de um livro específico pelo ID
 # ----------------------------------------------------------------------------------------------- #
 
 @bp.route('/api/v1/books/<int:id>', methods = ['GET'])
-
+@response_cache.cached()
 def get_book_info(id):
     """
     Retorna detalhes do livro especificado pelo ID
@@ -95,20 +172,30 @@ def get_book_info(id):
       404:
         description: Livro não encontrado
     """
+    with phase('index'):
+        livro = catalog.snapshot.get_json(id)
 
-    livro = df[df['id'] == id].to_dict(orient = 'records')
+    if livro is None:
+        return jsonify({'message': 'Livro não encontrado'}), 404
 
-    return jsonify(livro), 200
+    # mantém o formato de lista da resposta original
+    return json_response(b'[' + livro + b']'), 200
 
 # ----------------------------------------------------------------------------------------------- #
 # Buscar livro por título e/ou categoria
 # ----------------------------------------------------------------------------------------------- #
 
 @bp.route('/api/v1/books/search', methods = ['GET'])
-
+@response_cache.cached(args = PAGINATION_ARGS | {'title', 'category'})
 def get_books_search():
     """
     Busca livros por título ou categoria
+
+    A busca é por palavras (tokens), sem diferenciar maiúsculas e acentos: cada
+    palavra informada deve aparecer no campo correspondente, por inteiro ou como
+    prefixo (palavras de 2 letras) e também como trecho (a partir de 3 letras).
+    Textos sem palavras (ex.: "-") ou com palavras de uma letra (ex.: "'s") são
+    buscados como trecho literal do campo. Os resultados são ordenados por relevância.
     ---
     tags:
       - Informações dos livros
@@ -125,31 +212,49 @@ def get_books_search():
         schema:
           type: string
         description: Categoria de livros
+      - in: query
+        name: limit
+        required: false
+        schema:
+          type: integer
+        description: Quantidade máxima de livros retornados
+      - in: query
+        name: cursor
+        required: false
+        schema:
+          type: string
+        description: Cursor da próxima página (cabeçalho X-Next-Cursor da resposta anterior)
+      - in: query
+        name: fields
+        required: false
+        schema:
+          type: string
+        description: Campos retornados, separados por vírgula (ex. id,title,price)
     responses:
       200:
         description: Lista de livros encontrados
-      404:
-        description: Não foram encontrados resultados
+      400:
+        description: Parâmetros de paginação inválidos
     """
     title = request.args.get('title')
     category = request.args.get('category')
 
-    df_query = df.copy()
-
-    if title:
-        df_query = df_query[df_query['title'].str.lower().str.contains(title.lower())]
+    snap = catalog.snapshot
+    with phase('index'):
+        positions = snap.search.search(title = title, category = category)
 
-    if category:
-        df_query = df_query[df_query['category'].str.lower().str.contains(category.lower())]
+    # sem title nem category: retorna o catálogo completo
+    if positions is None:
+        positions = range(len(snap))
 
-    return jsonify(df_query.to_dict(orient = 'records')), 200
+    return list_response(snap, positions)
 
 # ----------------------------------------------------------------------------------------------- #
 # Estatísticas gerais da coleção
 # ----------------------------------------------------------------------------------------------- #
 
 @bp.route('/api/v1/stats/overview', methods = ['GET'])
-
+@response_cache.cached()
 def get_overview():
     """
     Estatísticas gerais da coleção
@@ -160,20 +265,14 @@ def get_overview():
       200:
         description: Estatísticas gerais da coleção
     """
-    dict_overview = {
-        'total_books': df.shape[0],
-        'mean_price': round(df['price'].mean(), 2),
-        'ratings_distribution': df['rating'].value_counts().to_dict()
-    }
-    
-    return jsonify(dict_overview), 200
+    return catalog.snapshot.aggregates.overview_payload
 
 # ----------------------------------------------------------------------------------------------- #
 # Estatísticas por categoria
 # ----------------------------------------------------------------------------------------------- #
 
 @bp.route('/api/v1/stats/categories', methods = ['GET'])
-
+@response_cache.cached()
 def get_category_stats():
     """
     Estatísticas de livros agregadas por categoria
@@ -185,49 +284,55 @@ def get_category_stats():
         description: Estatísticas por categoria
 
     """
-    lista_stats_cats = (
-        df.groupby('category')
-        .agg(
-            n_books = ('title', 'count'),
-            price_min = ('price', 'min'),
-            price_max = ('price', 'max'),
-            price_mean = ('price', 'mean'),
-            rating_mean = ('rating', 'mean')
-        )
-        .round(2)
-        .to_dict(orient='index')
-    )
-
-    return jsonify(lista_stats_cats), 200
+    return catalog.snapshot.aggregates.category_stats_payload
 
 # ----------------------------------------------------------------------------------------------- #
 # Livros com maior avaliação
 # ----------------------------------------------------------------------------------------------- #
 
 @bp.route('/api/v1/books/top-rated', methods = ['GET'])
-
+@response_cache.cached(args = PAGINATION_ARGS)
 def get_top_rated():
     """
     Livros com maior avaliação
     ---
     tags:
       - Informações dos livros
+    parameters:
+      - in: query
+        name: limit
+        required: false
+        schema:
+          type: integer
+        description: Quantidade máxima de livros retornados
+      - in: query
+        name: cursor
+        required: false
+        schema:
+          type: string
+        description: Cursor da próxima página (cabeçalho X-Next-Cursor da resposta anterior)
+      - in: query
+        name: fields
+        required: false
+        schema:
+          type: string
+        description: Campos retornados, separados por vírgula (ex. id,title,price)
     responses:
       200:
         description: Lista de livros encontrados
-      404:
-        description: Não foram encontrados resultados
+      400:
+        description: Parâmetros de paginação inválidos
     """
-    books_top_rated = df[df['rating'] == df['rating'].max()].to_dict(orient = 'records')
+    snap = catalog.snapshot
 
-    return jsonify(books_top_rated), 200
+    return list_response(snap, snap.aggregates.top_rated)
 
 # ----------------------------------------------------------------------------------------------- #
 # Filtrar livros dentro de uma faixa de preço específica
 # ----------------------------------------------------------------------------------------------- #
 
 @bp.route('/api/v1/books/price-range', methods = ['GET'])
-
+@response_cache.cached(args = PAGINATION_ARGS | {'min', 'max'})
 def get_books_price_range():
     """
     Filtra livros dentro de uma faixa de preço
@@ -247,9 +352,35 @@ def get_books_price_range():
         schema:
           type: float
         description: Preço máximo
+      - in: query
+        name: limit
+        required: false
+        schema:
+          type: integer
+        description: Quantidade máxima de livros retornados
+      - in: query
+        name: cursor
+        required: false
+        schema:
+          type: string
+        description: Cursor da próxima página (cabeçalho X-Next-Cursor da resposta anterior)
+      - in: query
+        name: fields
+        required: false
+        schema:
+          type: string
+        description: Campos retornados, separados por vírgula (ex. id,title,price)
+      - in: query
+        name: offset
+        required: false
+        schema:
+          type: integer
+        description: Quantidade de livros a pular (a partir do mais barato)
     responses:
       200:
         description: Lista de livros encontrados
+      400:
+        description: Parâmetros de paginação inválidos
       404:
         description: Não foram encontrados resultados
       500:
@@ -266,42 +397,33 @@ def get_books_price_range():
       except (ValueError, TypeError):
           return False
 
-    df_query = df.copy()
-
-    if min_price:
-        if is_float(min_price):
-          df_query = df_query[df_query['price'] >= float(min_price.replace(',', '.'))]
-        else:
+    for valor in (min_price, max_price):
+        if valor and not is_float(valor):
             return jsonify({'message': 'Formato de valor inválido'}), 500
 
-    if max_price:
-        if is_float(max_price):
-          df_query = df_query[df_query['price'] <= float(max_price.replace(',', '.'))]
-        else:
-            return jsonify({'message': 'Formato de valor inválido'}), 500
-    
-    df_query = df_query.sort_values('price')
+    snap = catalog.snapshot
+    with phase('index'):
+        positions = snap.price_range(
+            float(min_price.replace(',', '.')) if min_price else None,
+            float(max_price.replace(',', '.')) if max_price else None
+        )
 
-    if df_query.shape[0] == 0:
+    if len(positions) == 0:
         return jsonify({'message': 'Nenhum livro encontrado'}), 404
-    
-    return jsonify(df_query.to_dict(orient = 'records')), 200
+
+    return list_response(snap, positions)
 
 # ----------------------------------------------------------------------------------------------- #
 # Verificar status da API e conectividade com os dados
 # ----------------------------------------------------------------------------------------------- #
 
-def check_database(supabase):
-    try:
-        supabase.table("api_request_logs").select("id").limit(1).execute()
-        return True
-    except Exception:
-        return False
-    
 @bp.route('/api/v1/health', methods=['GET'])
 def get_api_health():
     """
     Verifica o status da API e de suas dependências.
+
+    O status do banco de dados vem da última verificação feita em segundo plano
+    (com horário e latência), sem consultar o banco a cada chamada.
     ---
     tags:
       - API Health
@@ -312,31 +434,78 @@ def get_api_health():
         description: API indisponível ou com dependências falhando
     """
     tz_sp = ZoneInfo("America/Sao_Paulo")
+    probe = health.last()
 
     health_status = {
         "status": "ok",
         "api": "running",
-        "database": "ok",
+        "database": probe["database"]["status"],
         "data_loaded": False,
         "rows": 0,
         "checked_at": datetime.now(tz_sp).isoformat(),
         "version": "1.0.0",
-        "environment": "development"
+        "environment": "development",
+        "dependencies": probe
     }
 
     http_status = 200
 
     # 🔹 Dados em memória
-    if df is not None and not df.empty:
+    snap = catalog.snapshot
+    if len(snap) > 0:
         health_status["data_loaded"] = True
-        health_status["rows"] = df.shape[0]
+        health_status["rows"] = len(snap)
+        health_status["catalog_version"] = snap.version
     else:
         health_status["status"] = "degraded"
 
+    # 🔹 Fila de logs de requisições
+    log_queue = current_app.extensions.get("request_log_queue")
+    if log_queue is not None:
+        health_status["request_logs"] = log_queue.stats()
+
     # 🔹 Supabase
-    if not check_database(supabase):
-        health_status["database"] = "error"
+    if probe["database"]["status"] != "ok":
         health_status["status"] = "degraded"
         http_status = 503
 
-    return jsonify(health_status), http_status
\ No newline at end of file
+    return jsonify(health_status), http_status
+
+@bp.route('/api/v1/health/live', methods=['GET'])
+def get_api_liveness():
+    """
+    Liveness: indica apenas que o processo está respondendo (sem verificar dependências).
+    ---
+    tags:
+      - API Health
+    responses:
+      200:
+        description: Processo ativo
+    """
+    return jsonify({"status": "alive"}), 200
+
+@bp.route('/api/v1/health/ready', methods=['GET'])
+def get_api_readiness():
+    """
+    Readiness: indica se a API está pronta para receber tráfego.
+
+    Exige o catálogo carregado e a última verificação do banco bem-sucedida e recente.
+    ---
+    tags:
+      - API Health
+    responses:
+      200:
+        description: API pronta
+      503:
+        description: Catálogo não carregado ou banco de dados indisponível
+    """
+    probe = health.last()
+
+    checks = {
+        "catalog": len(catalog.snapshot) > 0,
+        "database": probe["database"]["status"] == "ok",
+        "probe_fresh": not health.is_stale()
+    }
+    ready = all(checks.values())
+
+    return jsonify({"status": "ready" if ready else "not_ready", "checks": checks}), 200 if ready else 503
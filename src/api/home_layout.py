@@ -2,19 +2,42 @@
 # Imports
 # ----------------------------------------------------------------------------------------------- #
 
-from flask import render_template
+import hashlib
+import importlib.util
+import os
+from functools import lru_cache
+from typing import Tuple
+
+from flask import render_template, request, send_file, abort, url_for, make_response
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import plotly.io as pio
-from plotly.subplots import make_subplots
-from ..instances import bp
+from ..instances import bp, catalog
+from ..metrics import phase
 
 # ----------------------------------------------------------------------------------------------- #
-# Ler a base de dados
+# plotly.js servido uma única vez como arquivo estático (com fingerprint)
 # ----------------------------------------------------------------------------------------------- #
 
-df = pd.read_csv('data/base_livros.csv')
+# localizado sem importar o plotly (o import só acontece na primeira renderização da página)
+PLOTLY_JS_PATH = os.path.join(
+    importlib.util.find_spec('plotly').submodule_search_locations[0], 'package_data', 'plotly.min.js'
+)
+
+@lru_cache(maxsize = 1)
+def plotly_js_fingerprint() -> str:
+    """Hash do conteúdo do plotly.min.js instalado (muda a URL quando a biblioteca é atualizada)."""
+    with open(PLOTLY_JS_PATH, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()[:12]
+
+@bp.route("/assets/plotly.<fingerprint>.min.js")
+def plotly_js(fingerprint):
+    if fingerprint != plotly_js_fingerprint():
+        abort(404)
+
+    # a URL muda junto com o conteúdo, então o navegador pode guardar o arquivo indefinidamente
+    response = send_file(PLOTLY_JS_PATH, mimetype = 'application/javascript', max_age = 31536000)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
 
 # ----------------------------------------------------------------------------------------------- #
 # Página inicial
@@ -22,6 +45,46 @@ df = pd.read_csv('data/base_livros.csv')
 
 @bp.route("/")
 def home():
+    snap = catalog.snapshot
+    fingerprint = plotly_js_fingerprint()
+
+    # a página só muda quando muda a versão dos dados ou do plotly.js
+    etag = f"home-{snap.version}-{fingerprint}"
+
+    if request.if_none_match.contains(etag):
+        response = make_response('', 304)
+    else:
+        plotly_js_url = url_for('main.plotly_js', fingerprint = fingerprint)
+        with phase('render'):
+            page = render_home_page(snap, plotly_js_url)
+        response = make_response(page)
+
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
+
+@lru_cache(maxsize = 1)
+def render_home_page(snap, plotly_js_url: str) -> str:
+    """
+    Renderiza a página inicial (big numbers e gráficos) de uma versão do catálogo.
+
+    O resultado fica em cache por snapshot: os gráficos do Plotly (incluindo o
+    cálculo dos scores por decil) são gerados uma única vez por versão dos dados.
+
+    Args:
+        snap (CatalogSnapshot): Snapshot do catálogo a ser exibido.
+        plotly_js_url (str): URL do plotly.js estático, referenciado uma vez no <head>.
+
+    Returns:
+        str: HTML completo da página.
+    """
+    # o plotly é importado apenas aqui: fora do caminho de inicialização da API
+    import plotly.express as px
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    from plotly.subplots import make_subplots
+
+    df = snap.df
 
     # ----------------------------------------------------------------------------------------------- #
     # Big numbers
@@ -56,7 +119,7 @@ def home():
     fig_rating.update_xaxes(title = '', tickfont = dict(size = 10, color = '#4d4d4d'), range = (0, 250), showgrid = False)
     fig_rating.update_yaxes(title = '', tickfont = dict(size = 10, color = '#d4d4d4'), showgrid = False)
 
-    rating_chart = pio.to_html(fig_rating, full_html=False)
+    rating_chart = pio.to_html(fig_rating, full_html=False, include_plotlyjs=False)
 
     # ----------------------------------------------------------------------------------------------- #
     # Distribuição de preços
@@ -79,7 +142,7 @@ def home():
     fig_price.update_traces(marker_color = 'white', hovertemplate = '<extra></extra>')
     fig_price.add_hline(y = 0, line_width = 1)
 
-    price_chart = pio.to_html(fig_price, full_html=False)
+    price_chart = pio.to_html(fig_price, full_html=False, include_plotlyjs=False)
 
     # ----------------------------------------------------------------------------------------------- #
     # Top categorias
@@ -90,8 +153,9 @@ def home():
     preco_min = df['price'].min().round(2)
     preco_max = df['price'].max().round(2)
 
-    df_categorias = df.groupby('category').agg({'title':'count', 'price':'mean', 'rating': 'mean'}).round(2).reset_index()
+    df_categorias = df.groupby('category', observed = True).agg({'title':'count', 'price':'mean', 'rating': 'mean'}).round(2).reset_index()
     df_categorias.columns = ['category', 'n_books', 'mean_price', 'mean_rating']
+    df_categorias['category'] = df_categorias['category'].astype(object)  # categórica no snapshot
 
     max_books = df_categorias['n_books'].max()
     price_range = preco_max - preco_min
@@ -219,7 +283,7 @@ def home():
         ),
     )
 
-    top_categories_chart = pio.to_html(fig, full_html = False)
+    top_categories_chart = pio.to_html(fig, full_html = False, include_plotlyjs = False)
 
     # ----------------------------------------------------------------------------------------------- #
     # Renderizar os gráficos na página inicial
@@ -227,6 +291,7 @@ def home():
 
     return render_template(
         "home.html",
+        plotly_js_url = plotly_js_url,
         total_books = total_books,
         total_categories = total_categories,
         mean_price = str(f"{round(mean_price, 2):.2f}"),
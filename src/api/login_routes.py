@@ -3,11 +3,13 @@
 # ----------------------------------------------------------------------------------------------- #
 
 from flask import request, jsonify, g
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
+from flask_jwt_extended import create_access_token, get_jwt_identity
 from werkzeug.security import generate_password_hash, check_password_hash
 from functools import wraps
 
-from ..instances import bp, supabase
+from ..instances import bp, users
+from ..jwt_cache import jwt_required
+from ..metrics import phase
 
 # ----------------------------------------------------------------------------------------------- #
 # Registrar usuário
@@ -48,29 +50,15 @@ def register_user():
     if not username or not password:
         return jsonify({"error": "Username e senha são obrigatórios"}), 400
 
-    # Verifica se usuário já existe
-    existing_user = (
-        supabase
-        .table("users")
-        .select("id")
-        .eq("username", username)
-        .execute()
-    )
+    with phase('hash'):
+        password_hash = generate_password_hash(password)
 
-    if existing_user.data:
-        return jsonify({"error": "Nome de usuário já está em uso"}), 409
-
-    password_hash = generate_password_hash(password)
+    # INSERT único: a restrição UNIQUE de users.username indica se o usuário já existe
+    with phase('db'):
+        created = users.create(username, password_hash)
 
-    result = (
-        supabase
-        .table("users")
-        .insert({
-            "username": username,
-            "password_hash": password_hash
-        })
-        .execute()
-    )
+    if not created:
+        return jsonify({"error": "Nome de usuário já está em uso"}), 409
 
     return jsonify({"message": "Usuário criado com sucesso"}), 201
 
@@ -101,6 +89,8 @@ def login():
         201:
             description: Login bem sucedido, retorna JWT
         400:
+            description: Username ou senha não informados
+        401:
             description: Credenciais inválidas
     """
     data = request.json
@@ -111,22 +101,19 @@ def login():
     if not username or not password:
         return jsonify({"error": "Username e senha são obrigatórios"}), 400
 
-    user = (
-        supabase
-        .table("users")
-        .select("id, password_hash")
-        .eq("username", username)
-        .single()
-        .execute()
-    )
+    with phase('db'):
+        user = users.find(username)
 
-    if not user.data:
+    if user is None:
         return jsonify({"error": "Usuário ou senha inválidos"}), 401
 
-    if not check_password_hash(user.data["password_hash"], password):
+    with phase('hash'):
+        valid = check_password_hash(user["password_hash"], password)
+
+    if not valid:
         return jsonify({"error": "Usuário ou senha inválidos"}), 401
 
-    token = create_access_token(identity = str(user.data["id"]))
+    token = create_access_token(identity = str(user["id"]))
 
     return jsonify({"access_token": token}), 200
 
@@ -0,0 +1,33 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+from flask import Response, abort
+
+from ..instances import bp, metrics
+
+# ----------------------------------------------------------------------------------------------- #
+# Métricas no formato do Prometheus
+# ----------------------------------------------------------------------------------------------- #
+
+@bp.route('/metrics', methods = ['GET'])
+def get_metrics():
+    """
+    Métricas das requisições no formato de texto do Prometheus.
+
+    Contadores de requisições e de erros e histogramas de latência por rota, além
+    da duração das fases internas (ex.: index, serialize, db). Com vários workers,
+    cada worker responde com as próprias métricas.
+    ---
+    tags:
+      - API Health
+    responses:
+      200:
+        description: Métricas no formato de texto do Prometheus
+      404:
+        description: Métricas desabilitadas (METRICS_ENABLED)
+    """
+    if not metrics.enabled:
+        abort(404)
+
+    return Response(metrics.render(), content_type = 'text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,128 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import threading
+from typing import Optional
+
+from cachetools import TTLCache
+
+# ----------------------------------------------------------------------------------------------- #
+# Código de erro do PostgreSQL para violação de restrição UNIQUE
+# ----------------------------------------------------------------------------------------------- #
+
+UNIQUE_VIOLATION = "23505"
+
+# ----------------------------------------------------------------------------------------------- #
+# Repositório de usuários (tabela users no Supabase)
+# ----------------------------------------------------------------------------------------------- #
+
+class UserRepository:
+    """
+    Acesso à tabela `users` do Supabase com cache em memória das consultas por username.
+
+    Usuários encontrados ficam em cache por `ttl` segundos ({"id", "password_hash"}) e
+    usernames inexistentes ficam em cache negativo por `negative_ttl` segundos, de
+    modo que logins repetidos (válidos ou não) não consultam o banco a cada tentativa.
+
+    Em implantações com vários workers, o cache negativo de um worker só enxerga
+    cadastros feitos por outro worker depois de expirar, por isso `negative_ttl`
+    deve ser curto.
+
+    O cadastro é feito com um único INSERT: a unicidade do username é garantida pela
+    restrição UNIQUE da coluna `users.username`, e a violação dessa restrição é
+    tratada como "usuário já existe" (sem SELECT prévio e sem condição de corrida).
+
+    Args:
+        supabase: Cliente do Supabase.
+        ttl (float): Tempo (em segundos) de cache de usuários encontrados.
+        negative_ttl (float): Tempo (em segundos) de cache de usernames inexistentes.
+        max_entries (int): Quantidade máxima de usernames em cada cache.
+    """
+
+    def __init__(self, supabase, ttl: float = 300, negative_ttl: float = 10, max_entries: int = 4096):
+        self.supabase = supabase
+        self._users = TTLCache(maxsize = max_entries, ttl = ttl)
+        self._unknown = TTLCache(maxsize = max_entries, ttl = negative_ttl)
+        self._lock = threading.Lock()
+
+    def find(self, username: str) -> Optional[dict]:
+        """
+        Busca um usuário pelo username.
+
+        Args:
+            username (str): Nome de usuário.
+
+        Returns:
+            Optional[dict]: Dicionário com "id" e "password_hash", ou None se o
+                usuário não existir.
+        """
+        with self._lock:
+            user = self._users.get(username)
+            if user is not None:
+                return user
+            if username in self._unknown:
+                return None
+
+        result = (
+            self.supabase
+            .table("users")
+            .select("id, password_hash")
+            .eq("username", username)
+            .limit(1)
+            .execute()
+        )
+
+        user = result.data[0] if result.data else None
+
+        with self._lock:
+            if user is None:
+                self._unknown[username] = True
+            else:
+                self._users[username] = user
+
+        return user
+
+    def create(self, username: str, password_hash: str) -> bool:
+        """
+        Cadastra um usuário com um único INSERT.
+
+        Args:
+            username (str): Nome de usuário.
+            password_hash (str): Hash da senha.
+
+        Returns:
+            bool: True se o usuário foi criado; False se o username já estava em uso.
+
+        Raises:
+            postgrest.exceptions.APIError: Para erros do banco que não sejam de unicidade.
+        """
+        try:
+            result = (
+                self.supabase
+                .table("users")
+                .insert({
+                    "username": username,
+                    "password_hash": password_hash
+                })
+                .execute()
+            )
+        except Exception as e:
+            # import tardio: o postgrest vem junto com o cliente do Supabase (ver LazySupabaseClient)
+            from postgrest.exceptions import APIError
+
+            if isinstance(e, APIError) and e.code == UNIQUE_VIOLATION:
+                with self._lock:
+                    self._unknown.pop(username, None)
+                return False
+            raise
+
+        with self._lock:
+            self._unknown.pop(username, None)
+            if result.data:
+                self._users[username] = {
+                    "id": result.data[0]["id"],
+                    "password_hash": password_hash
+                }
+
+        return True
@@ -0,0 +1,66 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from .serialization import Payload
+
+# ----------------------------------------------------------------------------------------------- #
+# Agregados do catálogo (calculados uma vez por versão dos dados)
+# ----------------------------------------------------------------------------------------------- #
+
+class CatalogAggregates:
+    """
+    Estatísticas do catálogo pré-calculadas para as rotas de stats e top-rated.
+
+    Os agregados são derivados de um snapshot imutável, portanto são calculados uma
+    única vez por versão dos dados e recalculados automaticamente quando um novo
+    snapshot é carregado. Os resultados ficam guardados já serializados em JSON.
+
+    Args:
+        df (pd.DataFrame): Base de livros do snapshot.
+        by_rating (Dict[int, np.ndarray]): Índice rating -> posições do snapshot.
+    """
+
+    def __init__(self, df: pd.DataFrame, by_rating: Dict[int, np.ndarray]):
+        ratings_distribution = df['rating'].value_counts()
+
+        self.overview = {
+            'total_books': int(df.shape[0]),
+            'mean_price': round(float(df['price'].mean()), 2),
+            'ratings_distribution': {int(k): int(v) for k, v in ratings_distribution.items()}
+        }
+
+        stats = (
+            df.groupby('category', observed = True)
+            .agg(
+                n_books = ('title', 'count'),
+                price_min = ('price', 'min'),
+                price_max = ('price', 'max'),
+                price_mean = ('price', 'mean'),
+                rating_mean = ('rating', 'mean')
+            )
+            .round(2)
+        )
+
+        self.category_stats = {
+            category: {
+                'n_books': int(row.n_books),
+                'price_min': float(row.price_min),
+                'price_max': float(row.price_max),
+                'price_mean': float(row.price_mean),
+                'rating_mean': float(row.rating_mean)
+            }
+            for category, row in stats.iterrows()
+        }
+
+        # posições dos livros com a maior nota do catálogo
+        self.top_rated: np.ndarray = by_rating[max(by_rating)] if by_rating else np.array([], dtype = np.int64)
+
+        # respostas já serializadas (e comprimidas)
+        self.overview_payload = Payload.json(self.overview)
+        self.category_stats_payload = Payload.json(self.category_stats)
@@ -0,0 +1,276 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import hashlib
+import io
+import json
+import os
+import struct
+import tempfile
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# ----------------------------------------------------------------------------------------------- #
+# Tipos das colunas da base de livros
+# ----------------------------------------------------------------------------------------------- #
+
+CATALOG_DTYPES = {
+    'id': 'int32',
+    'title': 'str',
+    'price': 'float64',
+    'rating': 'int8',
+    'availability': 'category',
+    'category': 'category',
+    'image': 'str'
+}
+
+# ----------------------------------------------------------------------------------------------- #
+# Layout do arquivo colunar
+# ----------------------------------------------------------------------------------------------- #
+#
+#   MAGIC (8 bytes) | tamanho do cabeçalho (uint64, little-endian) | cabeçalho JSON | seções
+#
+# Cada seção começa alinhada em ALIGNMENT bytes e é lida como uma view do arquivo mapeado em
+# memória (sem cópia). Colunas numéricas ocupam uma seção com os valores little-endian. Colunas
+# de texto são uma tabela de strings: offsets (int64, n + 1) e os bytes UTF-8 de cada valor,
+# terminados por NUL (o que permite decodificar a coluna inteira com um único split). Colunas de
+# texto com poucos valores distintos (ex.: categoria) são gravadas como dicionário: a tabela de
+# strings dos valores distintos e os códigos (int32) de cada linha, com -1 para valores ausentes.
+# Numa coluna de texto com valores ausentes, eles são gravados como texto vazio e marcados numa
+# seção extra, logo após a tabela de strings: uma máscara com um byte (0 ou 1) por linha.
+#
+# O cabeçalho guarda a versão do catálogo (hash do CSV de origem, a mesma usada pelo
+# CatalogStore) e o tamanho/mtime do CSV, usados para detectar um arquivo desatualizado.
+
+MAGIC = b'BKCOL001'
+ALIGNMENT = 64
+
+# colunas de texto com até rows * DICT_MAX_RATIO valores distintos são gravadas como dicionário
+DICT_MAX_RATIO = 0.25
+
+def csv_version(raw: bytes) -> str:
+    """Versão do catálogo derivada do conteúdo do CSV (o mesmo arquivo sempre gera a mesma versão)."""
+    return hashlib.sha1(raw).hexdigest()[:12]
+
+def _padding(offset: int) -> int:
+    return -offset % ALIGNMENT
+
+def _string_table(values: list) -> list:
+    try:
+        encoded = [value.encode('utf-8') for value in values]
+    except AttributeError:
+        invalid = next(value for value in values if not isinstance(value, str))
+        raise ValueError(f"Tabela de strings aceita apenas texto (valor {invalid!r})") from None
+
+    offsets = np.zeros(len(encoded) + 1, dtype = '<i8')
+    np.cumsum([len(value) + 1 for value in encoded], out = offsets[1:])
+    return [offsets.tobytes(), b''.join(value + b'\0' for value in encoded)]
+
+def _read_strings(mm: np.memmap, sections, rows: int) -> np.ndarray:
+    next(sections)  # offsets: acesso a um valor isolado; a coluna inteira sai do split abaixo
+    start, size = next(sections)
+
+    values = mm[start:start + size].tobytes().decode('utf-8').split('\0')[:-1]
+    if len(values) != rows:
+        raise ValueError("Tabela de strings corrompida")
+
+    array = np.empty(rows, dtype = object)
+    array[:] = values
+    return array
+
+# ----------------------------------------------------------------------------------------------- #
+# Gravação
+# ----------------------------------------------------------------------------------------------- #
+
+def write_columnar(df: pd.DataFrame, path: str, version: str, source: Optional[dict] = None) -> None:
+    """
+    Grava a base de livros no formato colunar (escrita atômica).
+
+    Args:
+        df (pd.DataFrame): Base de livros tipada (ver CATALOG_DTYPES).
+        path (str): Caminho do arquivo de saída.
+        version (str): Versão do catálogo (ver csv_version).
+        source (Optional[dict]): Tamanho e mtime do CSV de origem ({"size", "mtime_ns"}).
+    """
+    sections = []
+    columns = []
+
+    for name, dtype in CATALOG_DTYPES.items():
+        if dtype in ('str', 'category'):
+            codes, uniques = pd.factorize(df[name])
+
+            if len(uniques) <= DICT_MAX_RATIO * len(codes):
+                columns.append({'name': name, 'kind': 'dict', 'rows': len(codes), 'values': len(uniques)})
+                sections += _string_table(list(uniques)) + [codes.astype('<i4').tobytes()]
+            else:
+                nulls = df[name].isna().to_numpy()
+                column = {'name': name, 'kind': 'str', 'rows': len(codes)}
+                sections += _string_table(df[name].where(~nulls, '').tolist())
+
+                if nulls.any():
+                    column['nulls'] = True
+                    sections.append(nulls.astype('u1').tobytes())
+                columns.append(column)
+        else:
+            values = np.ascontiguousarray(df[name].to_numpy(), dtype = np.dtype(dtype).newbyteorder('<'))
+
+            columns.append({'name': name, 'kind': 'numeric', 'dtype': values.dtype.str, 'rows': len(values)})
+            sections.append(values.tobytes())
+
+    # posições das seções: o cabeçalho é serializado até os offsets estabilizarem
+    header = {'version': version, 'source': source, 'rows': int(df.shape[0]), 'columns': columns}
+    header_size = 0
+    while True:
+        offset = len(MAGIC) + 8 + header_size
+        offset += _padding(offset)
+        positions = []
+        for section in sections:
+            positions.append([offset, len(section)])
+            offset += len(section) + _padding(len(section))
+
+        header['sections'] = positions
+        encoded_header = json.dumps(header).encode('utf-8')
+        if len(encoded_header) == header_size:
+            break
+        header_size = len(encoded_header)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir = directory, prefix = f'.{os.path.basename(path)}.', suffix = '.tmp')
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(MAGIC + struct.pack('<Q', header_size) + encoded_header)
+            for (start, _), section in zip(positions, sections):
+                f.write(b'\0' * (start - f.tell()))
+                f.write(section)
+        os.chmod(tmp_path, 0o644)  # mkstemp cria o arquivo com 0o600
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def write_columnar_from_csv(csv_path: str, path: str) -> str:
+    """
+    Converte o CSV da base de livros para o formato colunar.
+
+    Args:
+        csv_path (str): Caminho do CSV da base de livros.
+        path (str): Caminho do arquivo colunar de saída.
+
+    Returns:
+        str: Versão do catálogo gravada no arquivo.
+    """
+    with open(csv_path, 'rb') as f:
+        raw = f.read()
+
+    stat = os.stat(csv_path)
+    version = csv_version(raw)
+    df = pd.read_csv(io.BytesIO(raw), dtype = CATALOG_DTYPES)
+
+    write_columnar(df, path, version, source = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns})
+    return version
+
+# ----------------------------------------------------------------------------------------------- #
+# Leitura (mapeada em memória)
+# ----------------------------------------------------------------------------------------------- #
+
+def read_header(path: str) -> dict:
+    """
+    Lê apenas o cabeçalho do arquivo colunar.
+
+    Raises:
+        OSError: Se o arquivo não puder ser lido.
+        ValueError: Se o arquivo não estiver no formato colunar.
+    """
+    with open(path, 'rb') as f:
+        prefix = f.read(len(MAGIC) + 8)
+        if len(prefix) < len(MAGIC) + 8 or prefix[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"Arquivo colunar inválido: {path}")
+
+        (header_size,) = struct.unpack('<Q', prefix[len(MAGIC):])
+        return json.loads(f.read(header_size))
+
+def read_columnar(path: str) -> Tuple[pd.DataFrame, dict]:
+    """
+    Carrega a base de livros do arquivo colunar, mapeando-o em memória.
+
+    As colunas numéricas são views do arquivo mapeado (sem leitura nem cópia até
+    serem acessadas); as colunas de texto são decodificadas da tabela de strings
+    (de uma vez só por coluna) e as de dicionário viram categóricas (sem expandir
+    os valores por linha).
+
+    Args:
+        path (str): Caminho do arquivo colunar.
+
+    Returns:
+        Tuple[pd.DataFrame, dict]: Base de livros tipada e o cabeçalho do arquivo.
+
+    Raises:
+        OSError: Se o arquivo não puder ser lido.
+        ValueError: Se o arquivo não estiver no formato colunar.
+    """
+    header = read_header(path)
+    mm = np.memmap(path, dtype = np.uint8, mode = 'r')
+    sections = iter(header['sections'])
+    data = {}
+
+    for column in header['columns']:
+        if column['kind'] == 'str':
+            values = _read_strings(mm, sections, column['rows'])
+            if column.get('nulls'):
+                start, size = next(sections)
+                values[mm[start:start + size].view(np.bool_)] = np.nan
+                data[column['name']] = pd.array(values, dtype = object)
+            else:
+                data[column['name']] = pd.array(values, dtype = 'str')
+        elif column['kind'] == 'dict':
+            uniques = _read_strings(mm, sections, column['values'])
+            start, size = next(sections)
+            codes = mm[start:start + size].view('<i4')
+            data[column['name']] = pd.Categorical.from_codes(codes, categories = uniques)
+        else:
+            start, size = next(sections)
+            data[column['name']] = mm[start:start + size].view(column['dtype'])
+
+    return pd.DataFrame(data), header
+
+def is_current(header: dict, csv_path: str, check_content: bool = True) -> bool:
+    """
+    Indica se o arquivo colunar corresponde ao CSV atual da base.
+
+    Sem o CSV, o arquivo colunar é considerado válido. Se tamanho e mtime do CSV
+    forem os registrados na conversão, não há leitura; caso contrário (ex.: cópia
+    do arquivo), a versão é conferida pelo hash do conteúdo, a menos que
+    `check_content` seja False.
+    """
+    try:
+        stat = os.stat(csv_path)
+    except FileNotFoundError:
+        return True
+
+    source = header.get('source') or {}
+    if source.get('size') == stat.st_size and source.get('mtime_ns') == stat.st_mtime_ns:
+        return True
+
+    if not check_content or source.get('size') != stat.st_size:
+        return False
+
+    with open(csv_path, 'rb') as f:
+        return csv_version(f.read()) == header.get('version')
+
+# ----------------------------------------------------------------------------------------------- #
+# Geração no deploy
+# ----------------------------------------------------------------------------------------------- #
+
+if __name__ == '__main__':
+    # python -m src.catalog.columnar [csv] [arquivo colunar] (padrão: caminhos do config.py)
+    import sys
+    from config import Config
+
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else Config.CATALOG_PATH
+    output_path = sys.argv[2] if len(sys.argv) > 2 else Config.CATALOG_COLUMNAR_PATH
+
+    print(f"{output_path}: versão {write_columnar_from_csv(csv_path, output_path)}")
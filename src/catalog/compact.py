@@ -0,0 +1,153 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+# ----------------------------------------------------------------------------------------------- #
+# Representação compacta do catálogo em memória
+# ----------------------------------------------------------------------------------------------- #
+#
+# - id e rating: o menor tipo inteiro que comporta os valores (int16 e int8 na base atual);
+# - availability e category: dicionário (pd.Categorical, com códigos int8 e cada valor guardado
+#   uma única vez), com as categorias em ordem alfabética, como no groupby sobre texto;
+# - image: caminho sem o prefixo comum das URLs (IMAGE_PREFIX), restaurado na serialização.
+#
+# O preço continua float64: em float32 os valores com centavos não são representados exatamente
+# e as médias das rotas de stats mudariam. As respostas da API são idênticas às da base original.
+
+DICTIONARY_COLUMNS = ('availability', 'category')
+INTEGER_COLUMNS = ('id', 'rating')
+
+# prefixo das URLs das imagens (o mesmo para todos os livros do site)
+IMAGE_PREFIX = 'https://books.toscrape.com/media/cache/'
+
+def compact_catalog(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converte a base de livros para a representação compacta (ver acima).
+
+    Aceita tanto a base lida do CSV quanto a do arquivo colunar; colunas que já
+    estão no formato compacto são mantidas sem cópia.
+
+    Args:
+        df (pd.DataFrame): Base de livros tipada (ver CATALOG_DTYPES).
+
+    Returns:
+        pd.DataFrame: Base de livros compacta, com as mesmas colunas e linhas.
+    """
+    data = {}
+
+    for name in df.columns:
+        column = df[name]
+
+        if name in DICTIONARY_COLUMNS:
+            if not isinstance(column.dtype, pd.CategoricalDtype):
+                column = column.astype('category')
+            column = column.cat.remove_unused_categories()
+            if not column.cat.categories.is_monotonic_increasing:
+                column = column.cat.reorder_categories(sorted(column.cat.categories))
+        elif name in INTEGER_COLUMNS:
+            column = pd.to_numeric(column, downcast = 'integer')
+        elif name == 'image':
+            column = column.map(strip_image_prefix)
+
+        data[name] = column.reset_index(drop = True)
+
+    return pd.DataFrame(data)
+
+def expand_catalog(df: pd.DataFrame) -> pd.DataFrame:
+    """Converte a base compacta de volta para a representação original (int64, float64 e textos)."""
+    data = {}
+
+    for name in df.columns:
+        if name == 'image':
+            data[name] = pd.Series(image_urls(df[name].tolist()), dtype = object)
+        elif isinstance(df[name].dtype, pd.CategoricalDtype):
+            data[name] = pd.Series(df[name].tolist(), dtype = object)
+        elif name in INTEGER_COLUMNS:
+            data[name] = df[name].astype('int64')
+        else:
+            data[name] = df[name].copy()
+
+    return pd.DataFrame(data)
+
+# ----------------------------------------------------------------------------------------------- #
+# URLs das imagens
+# ----------------------------------------------------------------------------------------------- #
+
+def strip_image_prefix(value):
+    """Remove o prefixo comum da URL da imagem (URLs com outro prefixo são mantidas inteiras)."""
+    if isinstance(value, str) and value.startswith(IMAGE_PREFIX):
+        return value[len(IMAGE_PREFIX):]
+    return value
+
+def image_urls(values: List) -> List:
+    """Restaura as URLs completas a partir dos valores guardados na coluna `image`."""
+    return [
+        IMAGE_PREFIX + value if isinstance(value, str) and '://' not in value else value
+        for value in values
+    ]
+
+# ----------------------------------------------------------------------------------------------- #
+# Grupos das colunas de dicionário
+# ----------------------------------------------------------------------------------------------- #
+
+def dictionary_groups(column: pd.Series) -> Dict[str, np.ndarray]:
+    """
+    Agrupa as posições de uma coluna de dicionário por valor, direto dos códigos.
+
+    Args:
+        column (pd.Series): Coluna categórica (ex.: `category`).
+
+    Returns:
+        Dict[str, np.ndarray]: Valor -> posições (crescentes), com os valores na
+            ordem em que aparecem na base. Valores ausentes não formam grupo.
+    """
+    codes = column.cat.codes.to_numpy()
+    categories = column.cat.categories
+
+    order = np.argsort(codes, kind = 'stable')
+    bounds = np.searchsorted(codes[order], np.arange(len(categories) + 1))
+
+    present = [code for code in range(len(categories)) if bounds[code + 1] > bounds[code]]
+    present.sort(key = lambda code: order[bounds[code]])
+
+    return {categories[code]: order[bounds[code]:bounds[code + 1]] for code in present}
+
+# ----------------------------------------------------------------------------------------------- #
+# Relatório de memória
+# ----------------------------------------------------------------------------------------------- #
+
+def memory_report(df: pd.DataFrame) -> dict:
+    """
+    Compara a memória ocupada pela base compacta com a da representação original.
+
+    Os tamanhos incluem os objetos Python das colunas de texto (`deep=True`).
+
+    Args:
+        df (pd.DataFrame): Base de livros compacta (ver compact_catalog).
+
+    Returns:
+        dict: Bytes por coluna (compacto e original), totais e economia.
+    """
+    compact = df.memory_usage(index = False, deep = True)
+    original = expand_catalog(df).memory_usage(index = False, deep = True)
+
+    columns = {
+        name: {'dtype': str(df[name].dtype), 'bytes': int(compact[name]), 'original_bytes': int(original[name])}
+        for name in df.columns
+    }
+
+    total, original_total = int(compact.sum()), int(original.sum())
+
+    return {
+        'rows': int(df.shape[0]),
+        'columns': columns,
+        'bytes': total,
+        'original_bytes': original_total,
+        'saved_bytes': original_total - total,
+        'saved_ratio': round(1 - total / original_total, 4) if original_total else 0.0
+    }
@@ -0,0 +1,187 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import base64
+import binascii
+import json
+import zlib
+from typing import Mapping, Optional, Sequence, Tuple
+
+# ----------------------------------------------------------------------------------------------- #
+# Parâmetros aceitos pelas rotas de listagem
+# ----------------------------------------------------------------------------------------------- #
+
+# campos disponíveis para projeção (fields=id,title,price)
+FIELDS = ('id', 'title', 'price', 'rating', 'availability', 'category', 'image')
+
+# parâmetros que controlam a paginação (não fazem parte da identidade da consulta)
+PAGINATION_ARGS = {'limit', 'offset', 'cursor', 'fields'}
+
+# ----------------------------------------------------------------------------------------------- #
+# Erros de paginação
+# ----------------------------------------------------------------------------------------------- #
+
+class PaginationError(ValueError):
+    """Parâmetro de paginação ou projeção inválido (resulta em HTTP 400)."""
+
+# ----------------------------------------------------------------------------------------------- #
+# Validação dos parâmetros
+# ----------------------------------------------------------------------------------------------- #
+
+def parse_non_negative_int(valor: Optional[str], nome: str, default: Optional[int] = None) -> Optional[int]:
+    """
+    Converte um parâmetro da query string em inteiro não negativo.
+
+    Args:
+        valor (Optional[str]): Valor recebido na query string.
+        nome (str): Nome do parâmetro (usado na mensagem de erro).
+        default (Optional[int]): Valor retornado quando o parâmetro não é informado.
+
+    Returns:
+        Optional[int]: O inteiro convertido ou `default`, se o parâmetro estiver ausente.
+
+    Raises:
+        PaginationError: Se o valor não for um inteiro não negativo.
+    """
+    if valor is None or valor == '':
+        return default
+
+    try:
+        numero = int(valor)
+    except ValueError:
+        numero = -1
+
+    if numero < 0:
+        raise PaginationError(f"Parâmetro '{nome}' deve ser um inteiro não negativo")
+
+    return numero
+
+def parse_fields(valor: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Valida a projeção de campos (ex.: 'id,title,price').
+
+    Args:
+        valor (Optional[str]): Lista de campos separados por vírgula.
+
+    Returns:
+        Optional[Tuple[str, ...]]: Campos solicitados, sem repetição, ou None se a
+            projeção não foi informada (todos os campos).
+
+    Raises:
+        PaginationError: Se algum campo não existir.
+    """
+    if not valor:
+        return None
+
+    fields = tuple(dict.fromkeys(f.strip() for f in valor.split(',') if f.strip()))
+    invalidos = [f for f in fields if f not in FIELDS]
+
+    if not fields or invalidos:
+        raise PaginationError(f"Campos inválidos: {', '.join(invalidos) or valor}. Disponíveis: {', '.join(FIELDS)}")
+
+    return fields
+
+# ----------------------------------------------------------------------------------------------- #
+# Cursores opacos
+# ----------------------------------------------------------------------------------------------- #
+
+def query_fingerprint(path: str, args: Mapping[str, str]) -> int:
+    """Identifica a consulta (rota + filtros), ignorando os parâmetros de paginação."""
+    filtros = sorted((k, v) for k, v in args.items() if k not in PAGINATION_ARGS)
+    return zlib.crc32(json.dumps([path, filtros]).encode('utf-8'))
+
+def encode_cursor(version: str, query: int, offset: int) -> str:
+    """Gera um cursor opaco apontando para a posição `offset` de uma consulta."""
+    payload = json.dumps({'v': version, 'q': query, 'o': offset}, separators = (',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(token: str, version: str, query: int) -> int:
+    """
+    Decodifica um cursor e retorna a posição em que a próxima página começa.
+
+    Args:
+        token (str): Cursor recebido do cliente.
+        version (str): Versão corrente do catálogo.
+        query (int): Identificador da consulta corrente (ver query_fingerprint).
+
+    Returns:
+        int: Posição inicial da página.
+
+    Raises:
+        PaginationError: Se o cursor for malformado, de outra consulta ou de outra
+            versão do catálogo (nesse caso a listagem deve ser reiniciada).
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        offset = int(payload['o'])
+        cursor_version, cursor_query = payload['v'], payload['q']
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+        raise PaginationError('Cursor inválido')
+
+    if cursor_version != version or cursor_query != query or offset < 0:
+        raise PaginationError('Cursor expirado ou de outra consulta; reinicie a listagem')
+
+    return offset
+
+# ----------------------------------------------------------------------------------------------- #
+# Paginação
+# ----------------------------------------------------------------------------------------------- #
+
+class Page:
+    """
+    Página de uma listagem: posições da página, total de resultados e próximo cursor.
+
+    Args:
+        positions (Sequence[int]): Posições (no catálogo) dos itens da página.
+        total (int): Quantidade total de resultados da consulta.
+        next_cursor (Optional[str]): Cursor da próxima página, ou None se esta for a última.
+        fields (Optional[Tuple[str, ...]]): Projeção de campos solicitada.
+    """
+
+    def __init__(self, positions: Sequence[int], total: int, next_cursor: Optional[str], fields: Optional[Tuple[str, ...]]):
+        self.positions = positions
+        self.total = total
+        self.next_cursor = next_cursor
+        self.fields = fields
+
+def paginate(positions: Sequence[int], args: Mapping[str, str], path: str, version: str, max_limit: int) -> Page:
+    """
+    Recorta uma listagem de acordo com os parâmetros `limit`, `cursor`, `offset` e `fields`.
+
+    Sem `limit`, a página contém todos os resultados a partir da posição inicial
+    (comportamento original das rotas). O cursor, quando informado, tem precedência
+    sobre `offset`. O próximo cursor só é gerado quando a página avança a listagem.
+
+    Args:
+        positions (Sequence[int]): Resultado completo da consulta, já ordenado.
+        args (Mapping[str, str]): Parâmetros da query string.
+        path (str): Rota da requisição (faz parte da identidade do cursor).
+        version (str): Versão do catálogo que produziu `positions`.
+        max_limit (int): Maior `limit` aceito; valores acima são reduzidos a ele.
+
+    Returns:
+        Page: A página solicitada.
+
+    Raises:
+        PaginationError: Se algum parâmetro for inválido (inclusive `limit` igual a 0).
+    """
+    fields = parse_fields(args.get('fields'))
+    limit = parse_non_negative_int(args.get('limit'), 'limit')
+
+    # uma página vazia com cursor para a mesma posição faria o cliente repetir a requisição para sempre
+    if limit == 0:
+        raise PaginationError("Parâmetro 'limit' deve ser um inteiro positivo")
+    query = query_fingerprint(path, args)
+
+    if args.get('cursor'):
+        start = decode_cursor(args['cursor'], version, query)
+    else:
+        start = parse_non_negative_int(args.get('offset'), 'offset', default = 0)
+
+    total = len(positions)
+    stop = total if limit is None else min(total, start + min(limit, max_limit))
+    next_cursor = encode_cursor(version, query, stop) if start < stop < total else None
+
+    return Page(positions[start:stop], total, next_cursor, fields)
@@ -0,0 +1,267 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+# ----------------------------------------------------------------------------------------------- #
+# Pesos de cada tipo de correspondência (termo da busca x token indexado)
+# ----------------------------------------------------------------------------------------------- #
+
+SCORE_EXACT = 3
+SCORE_PREFIX = 2
+SCORE_SUBSTRING = 1
+
+# termos mais curtos que o n-grama só casam por prefixo
+NGRAM = 3
+
+# textos com termos mais curtos que isso (ex.: "'s", 'a light') são buscados como trecho literal
+MIN_TERM = 2
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# ----------------------------------------------------------------------------------------------- #
+# Tokenização
+# ----------------------------------------------------------------------------------------------- #
+
+def normalize(text: str) -> str:
+    """Converte o texto para minúsculas e remove acentos."""
+    text = text.casefold()
+    if text.isascii():
+        return text
+
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in text if not unicodedata.combining(c))
+
+def tokenize(text: str) -> List[str]:
+    """
+    Quebra um texto em tokens normalizados (minúsculos, sem acentos e sem pontuação).
+
+    Args:
+        text (str): Texto a ser tokenizado.
+
+    Returns:
+        List[str]: Lista de tokens na ordem em que aparecem no texto.
+    """
+    return TOKEN_PATTERN.findall(normalize(text))
+
+def intersect(scores: Optional[Dict[int, int]], matches: Dict[int, int]) -> Dict[int, int]:
+    """Interseção (E lógico) de dois resultados, somando as pontuações (None é o conjunto universo)."""
+    if scores is None:
+        return matches
+
+    # itera sobre o menor conjunto
+    small, large = (scores, matches) if len(scores) <= len(matches) else (matches, scores)
+    return {pos: score + large[pos] for pos, score in small.items() if pos in large}
+
+# ----------------------------------------------------------------------------------------------- #
+# Índice invertido de um campo
+# ----------------------------------------------------------------------------------------------- #
+
+class FieldIndex:
+    """
+    Índice invertido de um campo textual (ex.: título ou categoria).
+
+    Guarda, para cada token, as posições dos livros que o contêm. O vocabulário é
+    mantido ordenado (para buscas por prefixo com bisect) e indexado por n-gramas
+    (para buscas por substring), de modo que o custo de uma consulta depende do
+    tamanho do vocabulário casado e das listas de posições, e não do catálogo.
+
+    Args:
+        values (Iterable[str]): Valores do campo, na ordem das posições do catálogo.
+    """
+
+    def __init__(self, values: Iterable[str]):
+        self.values: List[str] = list(values)
+
+        postings: Dict[str, Set[int]] = defaultdict(set)
+        for pos, value in enumerate(self.values):
+            for token in tokenize(value):
+                postings[token].add(pos)
+
+        self.postings: Dict[str, List[int]] = {token: sorted(positions) for token, positions in postings.items()}
+        self.vocabulary: List[str] = sorted(self.postings)
+
+        self.ngrams: Dict[str, Set[str]] = defaultdict(set)
+        for token in self.vocabulary:
+            for i in range(len(token) - NGRAM + 1):
+                self.ngrams[token[i:i + NGRAM]].add(token)
+
+    def _prefixed(self, term: str) -> Iterable[str]:
+        for i in range(bisect_left(self.vocabulary, term), len(self.vocabulary)):
+            token = self.vocabulary[i]
+            if not token.startswith(term):
+                break
+            yield token
+
+    def _containing(self, term: str) -> Iterable[str]:
+        grams = sorted(
+            (self.ngrams.get(term[i:i + NGRAM], set()) for i in range(len(term) - NGRAM + 1)),
+            key = len
+        )
+        candidates = set.intersection(*grams) if grams else set()
+        return (token for token in candidates if term in token)
+
+    def scan(self, text: str) -> Dict[int, int]:
+        """
+        Retorna as posições cujo valor contém o texto como trecho literal (sem diferenciar maiúsculas).
+
+        Percorre o catálogo inteiro: usado apenas para os textos sem nenhum termo
+        indexável (ex.: '-', "'s"); ver `literal`.
+
+        Args:
+            text (str): Texto buscado, como informado na consulta.
+
+        Returns:
+            Dict[int, int]: Dicionário posição -> pontuação (de substring).
+        """
+        text = text.lower()
+        return {
+            pos: SCORE_SUBSTRING for pos, value in enumerate(self.values)
+            if isinstance(value, str) and text in value.lower()
+        }
+
+    def literal(self, text: str) -> Dict[int, int]:
+        """
+        Retorna as posições cujo valor contém o texto como trecho literal, a partir dos candidatos do índice.
+
+        Todo valor que contém o trecho contém também suas palavras: as do meio do
+        trecho como palavras inteiras, a última como início de uma palavra e a primeira
+        como fim de uma (trecho, a partir de NGRAM letras). Os candidatos são a interseção
+        dessas correspondências e só eles passam pela verificação do trecho, de modo que
+        o custo depende das correspondências, e não do catálogo. Sem nenhuma palavra
+        utilizável (ex.: '-', "'s"), o campo inteiro é percorrido (ver `scan`).
+
+        Args:
+            text (str): Texto buscado, como informado na consulta.
+
+        Returns:
+            Dict[int, int]: Dicionário posição -> soma das pontuações das palavras.
+        """
+        terms = tokenize(text)
+
+        lookups = []
+        for i, term in enumerate(terms):
+            if 0 < i < len(terms) - 1:
+                lookups.append(partial(self.exact, term))
+            elif i > 0 and len(term) >= MIN_TERM:
+                lookups.append(partial(self.match, term, prefix_only = True))
+            elif len(term) >= NGRAM:
+                lookups.append(partial(self.match, term))
+
+        if not lookups:
+            return self.scan(text)
+
+        scores: Optional[Dict[int, int]] = None
+        for lookup in lookups:
+            scores = intersect(scores, lookup())
+            if not scores:
+                return {}
+
+        text = text.lower()
+        return {pos: score for pos, score in scores.items() if text in self.values[pos].lower()}
+
+    def exact(self, term: str) -> Dict[int, int]:
+        """Retorna as posições que contêm o termo como palavra inteira."""
+        return dict.fromkeys(self.postings.get(term, ()), SCORE_EXACT)
+
+    def match(self, term: str, prefix_only: bool = False) -> Dict[int, int]:
+        """
+        Retorna as posições que casam com um termo, com a pontuação da melhor correspondência.
+
+        Args:
+            term (str): Termo já normalizado.
+            prefix_only (bool): Considera apenas as palavras que começam com o termo.
+
+        Returns:
+            Dict[int, int]: Dicionário posição -> pontuação (exato > prefixo > substring).
+        """
+        scores: Dict[int, int] = {}
+
+        tokens = self._prefixed(term) if prefix_only or len(term) < NGRAM else self._containing(term)
+        for token in tokens:
+            if token == term:
+                score = SCORE_EXACT
+            elif token.startswith(term):
+                score = SCORE_PREFIX
+            else:
+                score = SCORE_SUBSTRING
+
+            for pos in self.postings[token]:
+                if scores.get(pos, 0) < score:
+                    scores[pos] = score
+
+        return scores
+
+# ----------------------------------------------------------------------------------------------- #
+# Motor de busca do catálogo
+# ----------------------------------------------------------------------------------------------- #
+
+class SearchIndex:
+    """
+    Busca textual sobre título e categoria dos livros, construída uma vez por snapshot.
+
+    Cada termo da consulta precisa casar (E lógico) com algum token do campo
+    correspondente, por igualdade, prefixo ou substring. Os resultados são
+    ordenados pela soma das pontuações e, em caso de empate, pela posição no catálogo.
+
+    Um texto com algum termo mais curto que MIN_TERM (ex.: 'a light in the attic',
+    'vol. 1') é buscado como trecho literal do campo, como antes do índice, mas só
+    entre os candidatos que o índice encontra para as demais palavras (ver
+    FieldIndex.literal); apenas textos sem nenhuma palavra utilizável (ex.: '-',
+    "'s", 'é') percorrem o campo inteiro. Um filtro informado nunca amplia o
+    resultado para o catálogo inteiro.
+
+    Args:
+        titles (Sequence[str]): Títulos dos livros, na ordem das posições do catálogo.
+        categories (Sequence[str]): Categorias dos livros, na mesma ordem.
+    """
+
+    def __init__(self, titles: Sequence[str], categories: Sequence[str]):
+        self.fields = {
+            'title': FieldIndex(titles),
+            'category': FieldIndex(categories)
+        }
+
+    def search(self, title: Optional[str] = None, category: Optional[str] = None) -> Optional[List[int]]:
+        """
+        Executa uma busca por título e/ou categoria.
+
+        Args:
+            title (Optional[str]): Texto buscado no título.
+            category (Optional[str]): Texto buscado na categoria.
+
+        Returns:
+            Optional[List[int]]: Posições dos livros encontrados, da mais para a menos
+                relevante, ou None quando nenhum texto de busca foi informado.
+        """
+        lookups = []
+        for field, text in (('title', title), ('category', category)):
+            if not text:
+                continue
+
+            index = self.fields[field]
+            terms = list(dict.fromkeys(tokenize(text)))
+
+            if terms and all(len(term) >= MIN_TERM for term in terms):
+                lookups += [partial(index.match, term) for term in terms]
+                continue
+
+            lookups.append(partial(index.literal, text))
+
+        if not lookups:
+            return None
+
+        scores: Optional[Dict[int, int]] = None
+
+        for lookup in lookups:
+            scores = intersect(scores, lookup())
+            if not scores:
+                return []
+
+        return sorted(scores, key = lambda pos: (-scores[pos], pos))
@@ -0,0 +1,172 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import gzip
+import hashlib
+import json
+from array import array
+from typing import Any, Dict, Iterable
+
+from flask import Response, request
+
+# encoder JSON rápido (opcional): sem ele, usa o módulo json da biblioteca padrão
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# compressão brotli (opcional): sem ela, as respostas são comprimidas apenas com gzip
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# ----------------------------------------------------------------------------------------------- #
+# Parâmetros de compressão
+# ----------------------------------------------------------------------------------------------- #
+
+# corpos menores que isso não compensam a compressão
+COMPRESS_MIN_SIZE = 1024
+
+# ----------------------------------------------------------------------------------------------- #
+# Serialização JSON
+# ----------------------------------------------------------------------------------------------- #
+
+def dumps(obj: Any, sort_keys: bool = True) -> bytes:
+    """
+    Serializa um objeto em JSON (bytes UTF-8) no formato compacto usado pela API.
+
+    Usa o orjson quando instalado e, caso contrário, o módulo json com opções
+    equivalentes, de modo que os dois caminhos produzem os mesmos bytes.
+
+    Args:
+        obj (Any): Objeto serializável em JSON.
+        sort_keys (bool): Ordena as chaves dos dicionários (como o `jsonify` do Flask).
+            Com False, a ordem de inserção é preservada.
+
+    Returns:
+        bytes: Representação JSON do objeto, codificada em UTF-8.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option = option)
+
+    return json.dumps(obj, sort_keys = sort_keys, separators = (',', ':'), ensure_ascii = False).encode('utf-8')
+
+def json_response(body: bytes, status: int = 200) -> Response:
+    """Monta uma resposta HTTP a partir de um corpo JSON já serializado."""
+    return Response(body + b'\n', status = status, mimetype = 'application/json')
+
+# ----------------------------------------------------------------------------------------------- #
+# Sequência de fragmentos JSON num buffer contíguo
+# ----------------------------------------------------------------------------------------------- #
+
+class PackedBytes:
+    """
+    Sequência imutável de valores bytes guardados num único buffer contíguo.
+
+    Em vez de um objeto bytes por valor, há um buffer com todos os valores e um
+    array de offsets. Com a aplicação pré-carregada no master do gunicorn, os
+    workers leem essas páginas sem copiá-las (o contador de referências alterado
+    a cada acesso é só o do buffer, e não o de cada valor).
+
+    Args:
+        values (Iterable[bytes]): Valores, na ordem das posições.
+    """
+
+    def __init__(self, values: Iterable[bytes]):
+        values = list(values)
+
+        self.offsets = array('q', [0])
+        for value in values:
+            self.offsets.append(self.offsets[-1] + len(value))
+
+        self.buffer = b''.join(values)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, pos: int) -> bytes:
+        if pos < 0:
+            pos += len(self)
+        return self.buffer[self.offsets[pos]:self.offsets[pos + 1]]
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.buffer) + self.offsets.itemsize * len(self.offsets)
+
+# ----------------------------------------------------------------------------------------------- #
+# Payloads pré-serializados e pré-comprimidos
+# ----------------------------------------------------------------------------------------------- #
+
+class Payload:
+    """
+    Corpo de resposta pronto para envio, com variantes comprimidas calculadas uma única vez.
+
+    A variante enviada é escolhida pelo cabeçalho `Accept-Encoding` da requisição
+    (brotli, gzip ou sem compressão), e cada variante tem seu próprio ETag forte.
+    Cada variante comprimida é gerada na primeira requisição que a pede (e não na
+    criação do payload), para não pesar na inicialização da API.
+
+    Args:
+        body (bytes): Corpo sem compressão.
+        mimetype (str): Tipo de conteúdo da resposta.
+        max_compression (bool): Usa os níveis máximos de compressão (indicado para
+            payloads gerados uma vez por versão dos dados).
+    """
+
+    def __init__(self, body: bytes, mimetype: str = 'application/json', max_compression: bool = False):
+        self.mimetype = mimetype
+        self.etag = hashlib.sha1(body).hexdigest()[:20]
+        self.max_compression = max_compression
+        self.variants: Dict[str, bytes] = {'identity': body}
+
+        # codificações oferecidas (em caso de empate na preferência do cliente, vence a variante menor)
+        self.encodings = ['identity']
+        if len(body) >= COMPRESS_MIN_SIZE:
+            self.encodings = ['br', 'gzip', 'identity'] if brotli is not None else ['gzip', 'identity']
+
+    @classmethod
+    def json(cls, obj: Any, sort_keys: bool = True) -> 'Payload':
+        """Cria um payload JSON (terminado em nova linha, como o `jsonify`) com compressão máxima."""
+        return cls(dumps(obj, sort_keys = sort_keys) + b'\n', max_compression = True)
+
+    @property
+    def body(self) -> bytes:
+        return self.variants['identity']
+
+    def variant(self, encoding: str) -> bytes:
+        """Corpo na codificação informada (comprimido na primeira chamada e guardado)."""
+        data = self.variants.get(encoding)
+
+        if data is None:
+            if encoding == 'gzip':
+                data = gzip.compress(self.body, compresslevel = 9 if self.max_compression else 6, mtime = 0)
+            else:
+                data = brotli.compress(self.body, quality = 11 if self.max_compression else 5)
+
+            # atribuição atômica: no pior caso, duas threads comprimem o mesmo corpo
+            self.variants[encoding] = data
+
+        return data
+
+    def compress_all(self) -> None:
+        """Gera de uma vez todas as variantes comprimidas oferecidas (ex.: antes do fork dos workers)."""
+        for encoding in self.encodings:
+            self.variant(encoding)
+
+    def response(self, status: int = 200) -> Response:
+        """Monta a resposta com a variante mais adequada ao `Accept-Encoding` da requisição."""
+        encoding = request.accept_encodings.best_match(self.encodings, default = 'identity')
+
+        response = Response(self.variant(encoding), status = status, mimetype = self.mimetype)
+        response.vary.add('Accept-Encoding')
+
+        if encoding == 'identity':
+            response.set_etag(self.etag)
+        else:
+            response.headers['Content-Encoding'] = encoding
+            response.set_etag(f"{self.etag}-{encoding}")
+
+        return response
@@ -0,0 +1,520 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import gc
+import io
+import logging
+import os
+import threading
+import time
+from array import array
+from functools import cached_property
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .aggregates import CatalogAggregates
+from .columnar import CATALOG_DTYPES, csv_version, is_current, read_columnar, read_header, write_columnar_from_csv
+from .compact import compact_catalog, dictionary_groups, image_urls, memory_report
+from .search import SearchIndex
+from .serialization import dumps, PackedBytes, Payload
+
+# ----------------------------------------------------------------------------------------------- #
+# Índice id -> posição
+# ----------------------------------------------------------------------------------------------- #
+
+# ids até SPARSE_FACTOR * quantidade de livros usam a tabela densa; acima disso, um dicionário
+SPARSE_FACTOR = 4
+
+class IdIndex:
+    """
+    Índice id -> posição do livro no snapshot.
+
+    Com ids densos (o caso da base), as posições ficam numa tabela contígua
+    indexada pelo próprio id, sem objetos Python por livro; com ids esparsos ou
+    negativos, num dicionário.
+
+    Args:
+        ids (np.ndarray): Ids dos livros, na ordem das posições.
+    """
+
+    def __init__(self, ids: np.ndarray):
+        self.table: Optional[array] = None
+        self.positions: Optional[Dict[int, int]] = None
+
+        if len(ids) and (ids.min() < 0 or ids.max() >= SPARSE_FACTOR * len(ids)):
+            self.positions = {int(book_id): pos for pos, book_id in enumerate(ids)}
+            return
+
+        table = np.full(int(ids.max()) + 1 if len(ids) else 0, -1, dtype = np.int64)
+        table[ids] = np.arange(len(ids))
+        self.table = array('q', table.tobytes())
+
+    def get(self, book_id: int) -> Optional[int]:
+        """Posição do livro com o id informado (ou None, se não existir)."""
+        if self.positions is not None:
+            return self.positions.get(book_id)
+
+        if 0 <= book_id < len(self.table):
+            pos = self.table[book_id]
+            return pos if pos >= 0 else None
+        return None
+
+# ----------------------------------------------------------------------------------------------- #
+# Snapshot imutável do catálogo
+# ----------------------------------------------------------------------------------------------- #
+
+class CatalogSnapshot:
+    """
+    Versão imutável do catálogo, com colunas tipadas e índices construídos sob demanda.
+
+    Todos os índices guardam posições (linhas) do DataFrame, de modo que as rotas
+    consultam o índice adequado e materializam apenas as linhas necessárias.
+
+    O DataFrame fica na representação compacta (ver compact.py): inteiros
+    estreitos, categoria e disponibilidade como dicionário e imagens sem o prefixo
+    comum da URL. Os valores originais são restaurados na serialização.
+
+    Os índices e as respostas pré-serializadas são construídos no primeiro acesso,
+    de modo que a carga do snapshot custa apenas a leitura das colunas; `warm`
+    constrói todos de uma vez (no master do gunicorn e antes da troca numa recarga).
+
+    Args:
+        df (pd.DataFrame): Base de livros já tipada (ver CATALOG_DTYPES).
+        version (str): Identificador da versão dos dados (hash do arquivo de origem).
+    """
+
+    def __init__(self, df: pd.DataFrame, version: str):
+        self.df = compact_catalog(df)
+        self.version = version
+
+        # colunas tipadas
+        self.ids = self.df['id'].to_numpy()
+        self.prices = self.df['price'].to_numpy()
+        self.ratings = self.df['rating'].to_numpy()
+
+        # fragmentos JSON '"campo":valor' por coluna, criados sob demanda para as projeções
+        self._field_json: Dict[str, PackedBytes] = {}
+
+    @cached_property
+    def titles(self) -> List[str]:
+        return self.df['title'].tolist()
+
+    @cached_property
+    def by_id(self) -> IdIndex:
+        """Índice id -> posição."""
+        return IdIndex(self.ids)
+
+    @cached_property
+    def by_category(self) -> Dict[str, np.ndarray]:
+        """Índice categoria -> posições (categorias na ordem em que aparecem na base)."""
+        return dictionary_groups(self.df['category'])
+
+    @cached_property
+    def by_rating(self) -> Dict[int, np.ndarray]:
+        """Índice rating -> posições."""
+        return {int(rating): positions for rating, positions in self.df.groupby('rating').indices.items()}
+
+    @cached_property
+    def categories(self) -> List[str]:
+        return list(self.by_category.keys())
+
+    @cached_property
+    def price_order(self) -> np.ndarray:
+        """Posições ordenadas por preço."""
+        return np.argsort(self.prices, kind = 'stable')
+
+    @cached_property
+    def sorted_prices(self) -> np.ndarray:
+        return self.prices[self.price_order]
+
+    @cached_property
+    def book_json(self) -> PackedBytes:
+        """JSON pré-serializado de cada livro (mesma posição do DataFrame), num buffer contíguo."""
+        return PackedBytes(dumps(record) for record in self.records())
+
+    @cached_property
+    def search(self) -> SearchIndex:
+        """Índice invertido para a busca por título e categoria."""
+        return SearchIndex(self.titles, self.values('category'))
+
+    @cached_property
+    def books_payload(self) -> Payload:
+        """Catálogo completo (id -> título), serializado e comprimido uma vez."""
+        return Payload.json(
+            {str(book_id): title for book_id, title in zip(self.ids.tolist(), self.titles)},
+            sort_keys = False
+        )
+
+    @cached_property
+    def categories_payload(self) -> Payload:
+        return Payload.json({'categories': self.categories})
+
+    @cached_property
+    def aggregates(self) -> CatalogAggregates:
+        """Estatísticas usadas pelas rotas de stats e top-rated."""
+        return CatalogAggregates(self.df, self.by_rating)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def get_json(self, book_id: int) -> Optional[bytes]:
+        """Retorna o JSON pré-serializado do livro com o ID informado (ou None, se não existir)."""
+        pos = self.by_id.get(book_id)
+        return None if pos is None else self.book_json[pos]
+
+    def price_range(self, min_price: Optional[float] = None, max_price: Optional[float] = None) -> np.ndarray:
+        """
+        Retorna as posições dos livros com preço dentro da faixa, já ordenadas por preço.
+
+        A faixa é resolvida com duas buscas binárias sobre os preços ordenados, e o
+        resultado é uma fatia (sem cópia) do índice de preços.
+
+        Args:
+            min_price (Optional[float]): Preço mínimo (inclusivo). None para não limitar.
+            max_price (Optional[float]): Preço máximo (inclusivo). None para não limitar.
+
+        Returns:
+            np.ndarray: Posições dos livros na faixa, em ordem crescente de preço.
+        """
+        start = 0 if min_price is None else np.searchsorted(self.sorted_prices, min_price, side = 'left')
+        stop = len(self) if max_price is None else np.searchsorted(self.sorted_prices, max_price, side = 'right')
+        return self.price_order[start:max(start, stop)]
+
+    def field_json(self, field: str) -> PackedBytes:
+        """Retorna os fragmentos JSON '"campo":valor' de uma coluna, na ordem das posições."""
+        fragments = self._field_json.get(field)
+        if fragments is None:
+            fragments = PackedBytes(dumps({field: value})[1:-1] for value in self.values(field))
+            self._field_json[field] = fragments
+        return fragments
+
+    def warm(self) -> None:
+        """
+        Constrói de uma vez tudo o que o snapshot criaria sob demanda.
+
+        Usado antes do fork dos workers (ver CatalogStore.preload), para que os
+        fragmentos das projeções e as variantes comprimidas dos payloads sejam
+        gerados uma única vez no master e compartilhados, em vez de em cada worker.
+        """
+        for name, attribute in vars(CatalogSnapshot).items():
+            if isinstance(attribute, cached_property):
+                getattr(self, name)
+
+        for field in self.df.columns:
+            self.field_json(field)
+
+        for payload in (
+            self.books_payload, self.categories_payload,
+            self.aggregates.overview_payload, self.aggregates.category_stats_payload
+        ):
+            payload.compress_all()
+
+    def json_list(self, positions: Sequence[int], fields: Optional[Tuple[str, ...]] = None) -> bytes:
+        """
+        Monta uma lista JSON com os livros das posições informadas, sem reserializá-los.
+
+        Args:
+            positions (Sequence[int]): Posições dos livros, na ordem desejada.
+            fields (Optional[Tuple[str, ...]]): Campos a incluir em cada livro (todos, se None).
+
+        Returns:
+            bytes: Lista JSON com as chaves ordenadas, como no `jsonify`.
+        """
+        if fields is None:
+            return b'[' + b','.join(self.book_json[pos] for pos in positions) + b']'
+
+        columns = [self.field_json(field) for field in sorted(fields)]
+        return b'[' + b','.join(b'{' + b','.join(col[pos] for col in columns) + b'}' for pos in positions) + b']'
+
+    def json_map(self, positions: Sequence[int], fields: Optional[Tuple[str, ...]] = None) -> bytes:
+        """
+        Monta um objeto JSON id -> livro com os livros das posições informadas (formato de /books).
+
+        Sem projeção, o valor de cada id é o título (como no catálogo completo, ver
+        `books_payload`); com projeção, é o objeto com os campos solicitados.
+
+        Args:
+            positions (Sequence[int]): Posições dos livros, na ordem desejada.
+            fields (Optional[Tuple[str, ...]]): Campos a incluir em cada livro (apenas o título, se None).
+
+        Returns:
+            bytes: Objeto JSON com os ids (em texto) na ordem das posições.
+        """
+        if fields is None:
+            return dumps({str(self.ids[pos]): self.titles[pos] for pos in positions}, sort_keys = False)
+
+        columns = [self.field_json(field) for field in sorted(fields)]
+        return b'{' + b','.join(
+            b'"%d":{' % self.ids[pos] + b','.join(col[pos] for col in columns) + b'}' for pos in positions
+        ) + b'}'
+
+    def values(self, field: str) -> list:
+        """Valores de uma coluna como objetos Python, no formato servido pela API."""
+        values = self.df[field].tolist()
+        return image_urls(values) if field == 'image' else values
+
+    def rows(self, positions: Sequence[int]) -> pd.DataFrame:
+        """Retorna as linhas do catálogo nas posições informadas (na ordem informada)."""
+        return self.df.iloc[positions]
+
+    def records(self, positions: Optional[Sequence[int]] = None) -> List[dict]:
+        """Converte as linhas informadas (ou todo o catálogo) em uma lista de dicionários."""
+        df = self.df if positions is None else self.rows(positions)
+        records = df.to_dict(orient = 'records')
+
+        if 'image' in df.columns:
+            for record, url in zip(records, image_urls(df['image'].tolist())):
+                record['image'] = url
+
+        return records
+
+    def memory_report(self) -> dict:
+        """Memória ocupada pelo DataFrame do snapshot, comparada com a representação original."""
+        return memory_report(self.df)
+
+# ----------------------------------------------------------------------------------------------- #
+# Store compartilhado entre as rotas
+# ----------------------------------------------------------------------------------------------- #
+
+class CatalogStore:
+    """
+    Ponto único de acesso ao catálogo de livros em memória.
+
+    A base é lida uma única vez por processo e todas as rotas consultam o
+    snapshot corrente (`store.snapshot`), que concentra colunas tipadas e índices.
+
+    Se houver um arquivo colunar (ver columnar.py) correspondente ao CSV, ele é
+    mapeado em memória em vez de fazer o parsing do texto do CSV; se ele não
+    existir, estiver desatualizado ou inválido, a base é lida do CSV.
+
+    Recarga sem reiniciar o processo (`reload`): o novo snapshot, com todos os
+    índices, é construído fora do lock e só então substitui o corrente, numa
+    única atribuição. Requisições em andamento terminam com o snapshot que já
+    obtiveram, e os caches indexados pela versão passam a ignorar as respostas da
+    versão anterior. A recarga pode ser disparada pelo watcher (que verifica
+    periodicamente o mtime dos arquivos), por sinal ou pela rota de admin.
+
+    Configuração (via `app.config`):
+        CATALOG_WATCH_INTERVAL: intervalo (em segundos) de verificação dos arquivos (0 desabilita).
+
+    Args:
+        path (str): Caminho do arquivo CSV da base de livros.
+        columnar_path (Optional[str]): Caminho do arquivo colunar da base.
+    """
+
+    def __init__(self, path: str, columnar_path: Optional[str] = None):
+        self.path = path
+        self.columnar_path = columnar_path
+        self.watch_interval: float = 0
+        self.logger = logging.getLogger(__name__)
+
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._watcher_pid = None
+        self._files_signature = None
+
+    def init_app(self, app) -> None:
+        self.watch_interval = app.config.get('CATALOG_WATCH_INTERVAL', self.watch_interval)
+        self.logger = app.logger
+
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        """Snapshot corrente do catálogo (carregado na primeira consulta, se necessário)."""
+        self._ensure_watching()
+
+        if self._snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._files_signature = self._signature()
+                    self._snapshot = self._build()
+        return self._snapshot
+
+    @property
+    def version(self) -> str:
+        return self.snapshot.version
+
+    def load(self) -> CatalogSnapshot:
+        """
+        Lê o arquivo de dados, constrói um novo snapshot e o torna o snapshot corrente.
+
+        Returns:
+            CatalogSnapshot: O snapshot recém-carregado.
+
+        Raises:
+            OSError: Se o arquivo de dados não puder ser lido.
+        """
+        signature = self._signature()
+        snapshot = self._build()
+        with self._lock:
+            self._snapshot = snapshot
+            self._files_signature = signature
+        return snapshot
+
+    def ensure_columnar(self) -> bool:
+        """
+        Gera o arquivo colunar a partir do CSV se ele estiver ausente ou desatualizado.
+
+        O arquivo colunar não é versionado: é gerado pela ingestão, no deploy
+        (`python -m src.catalog.columnar`) ou no master do gunicorn (ver gunicorn.conf.py).
+        Um arquivo cujo registro de mtime não bate com o CSV local (ex.: copiado de
+        outra máquina) também é regerado, para que as inicializações seguintes não
+        precisem conferir o hash do CSV.
+
+        Returns:
+            bool: True se o arquivo foi gerado (False se já estava atualizado ou se a gravação falhou).
+        """
+        if not self.columnar_path or not os.path.exists(self.path):
+            return False
+
+        try:
+            if is_current(read_header(self.columnar_path), self.path, check_content = False):
+                return False
+        except (OSError, ValueError, KeyError):
+            # ausente ou inválido: é regerado abaixo
+            pass
+
+        try:
+            version = write_columnar_from_csv(self.path, self.columnar_path)
+        except OSError as e:
+            self.logger.warning(f"Não foi possível gerar {self.columnar_path} (a base será lida do CSV): {e}")
+            return False
+
+        # mesmos dados do snapshot corrente: o watcher não deve tratar o novo arquivo como uma alteração
+        with self._lock:
+            if self._snapshot is not None and self._snapshot.version == version:
+                self._files_signature = self._signature()
+
+        self.logger.info(f"Arquivo colunar gerado: {self.columnar_path} (versão {version})")
+        return True
+
+    def preload(self) -> CatalogSnapshot:
+        """
+        Prepara o catálogo para ser compartilhado com os workers criados por fork.
+
+        Chamado no master do gunicorn com `preload_app` (ver gunicorn.conf.py): o
+        snapshot é carregado e aquecido (ver CatalogSnapshot.warm) uma única vez e os
+        objetos existentes são congelados no coletor de lixo (`gc.freeze`), que assim
+        não escreve nas páginas herdadas. Os workers passam a ler as mesmas páginas
+        de memória do master (copy-on-write) em vez de manter cada um a sua cópia.
+
+        Um snapshot recarregado depois disso (ver reload) pertence apenas ao worker que
+        o carregou.
+
+        Returns:
+            CatalogSnapshot: O snapshot compartilhado.
+        """
+        # sem passar pela property snapshot: o watcher deve começar nos workers, e não no master
+        snapshot = self._snapshot or self.load()
+        snapshot.warm()
+        gc.freeze()
+        return snapshot
+
+    def reload(self, force: bool = False) -> Tuple[Optional[str], str]:
+        """
+        Reconstrói o snapshot a partir dos arquivos e o troca pelo corrente.
+
+        A construção acontece sem bloquear as leituras; recargas simultâneas são
+        serializadas. Se os dados não mudaram (mesma versão), o snapshot corrente é
+        mantido, a menos que `force` seja True.
+
+        Args:
+            force (bool): Troca o snapshot mesmo que a versão seja a mesma.
+
+        Returns:
+            Tuple[Optional[str], str]: Versão anterior (None se ainda não havia
+                snapshot) e versão corrente após a recarga.
+
+        Raises:
+            OSError: Se o arquivo de dados não puder ser lido (o snapshot corrente é mantido).
+        """
+        with self._reload_lock:
+            previous = self._snapshot
+            signature = self._signature()
+            start = time.perf_counter()
+            snapshot = self._build()
+            replace = force or previous is None or snapshot.version != previous.version
+            if replace:
+                # índices construídos antes da troca: as requisições seguintes não pagam por eles
+                snapshot.warm()
+
+            with self._lock:
+                self._files_signature = signature
+                if replace:
+                    self._snapshot = snapshot
+
+            previous_version = previous.version if previous is not None else None
+            if self._snapshot is snapshot:
+                self.logger.info(
+                    f"Catálogo recarregado: {previous_version} -> {snapshot.version} "
+                    f"({len(snapshot)} livros, {1000 * (time.perf_counter() - start):.0f} ms)"
+                )
+
+            return previous_version, self._snapshot.version
+
+    def reload_async(self) -> bool:
+        """
+        Dispara a recarga numa thread em segundo plano.
+
+        Returns:
+            bool: False se já havia uma recarga em andamento (nenhuma nova é iniciada).
+        """
+        if self._reload_lock.locked():
+            return False
+
+        threading.Thread(target = self._reload_logging_errors, name = "catalog-reload", daemon = True).start()
+        return True
+
+    def _reload_logging_errors(self) -> None:
+        try:
+            self.reload()
+        except Exception as e:
+            self.logger.error(f"Erro ao recarregar o catálogo (mantida a versão {self.version}): {e}")
+
+    def _signature(self) -> Tuple:
+        # mtime e tamanho dos arquivos de dados (os escritores usam os.replace, então a troca é atômica)
+        signature = []
+        for path in (self.path, self.columnar_path):
+            try:
+                stat = os.stat(path) if path else None
+                signature.append((stat.st_mtime_ns, stat.st_size) if stat else None)
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _ensure_watching(self) -> None:
+        # a thread é criada no próprio processo (ex.: após o fork dos workers do gunicorn)
+        if not self.watch_interval or self._watcher_pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._watcher_pid != os.getpid():
+                threading.Thread(target = self._watch, name = "catalog-watcher", daemon = True).start()
+                self._watcher_pid = os.getpid()
+
+    def _watch(self) -> None:
+        while True:
+            time.sleep(self.watch_interval)
+            if self._snapshot is not None and self._signature() != self._files_signature:
+                self._reload_logging_errors()
+
+    def _build(self) -> CatalogSnapshot:
+        if self.columnar_path and os.path.exists(self.columnar_path):
+            try:
+                if is_current(read_header(self.columnar_path), self.path):
+                    df, header = read_columnar(self.columnar_path)
+                    return CatalogSnapshot(df, header['version'])
+            except (OSError, ValueError, KeyError):
+                # arquivo colunar inválido: segue para o CSV
+                pass
+
+        with open(self.path, 'rb') as f:
+            raw = f.read()
+
+        # a versão é derivada do conteúdo: o mesmo arquivo sempre gera a mesma versão
+        version = csv_version(raw)
+        df = pd.read_csv(io.BytesIO(raw), dtype = CATALOG_DTYPES)
+        return CatalogSnapshot(df, version)
@@ -0,0 +1,103 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+# ----------------------------------------------------------------------------------------------- #
+# Verificar conectividade com o banco de dados
+# ----------------------------------------------------------------------------------------------- #
+
+def check_database(supabase) -> bool:
+    try:
+        supabase.table("api_request_logs").select("id").limit(1).execute()
+        return True
+    except Exception:
+        return False
+
+# ----------------------------------------------------------------------------------------------- #
+# Verificação periódica das dependências em segundo plano
+# ----------------------------------------------------------------------------------------------- #
+
+class HealthProber:
+    """
+    Verifica periodicamente as dependências da API e guarda o último resultado.
+
+    Uma thread em segundo plano consulta o Supabase a cada `interval` segundos e
+    registra status, latência e horário da verificação. As rotas de health apenas
+    leem o último resultado, sem acessar o banco a cada requisição.
+
+    Args:
+        supabase: Cliente do Supabase.
+        interval (float): Intervalo (em segundos) entre verificações.
+    """
+
+    def __init__(self, supabase, interval: float = 30):
+        self.supabase = supabase
+        self.interval = interval
+        self.tz_sp = ZoneInfo("America/Sao_Paulo")
+
+        self._last: Optional[dict] = None
+        self._last_monotonic: Optional[float] = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> None:
+        # a thread é criada no próprio processo (ex.: após o fork dos workers do gunicorn)
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid != os.getpid():
+                threading.Thread(target = self._run, name = "health-prober", daemon = True).start()
+                self._pid = os.getpid()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            self.probe()
+
+    def probe(self) -> dict:
+        """Executa as verificações agora e atualiza o último resultado."""
+        start = time.perf_counter()
+        database_ok = check_database(self.supabase)
+        latency_ms = round((time.perf_counter() - start) * 1000, 1)
+
+        result = {
+            "database": {
+                "status": "ok" if database_ok else "error",
+                "latency_ms": latency_ms,
+                "checked_at": datetime.now(self.tz_sp).isoformat()
+            }
+        }
+
+        self._last = result
+        self._last_monotonic = time.monotonic()
+        return result
+
+    def last(self) -> dict:
+        """
+        Retorna o resultado da última verificação.
+
+        Na primeira chamada do processo, inicia a thread de verificação e executa
+        uma verificação síncrona (ainda não há resultado para servir).
+
+        Returns:
+            dict: Status, latência e horário de cada dependência, mais a idade
+                (em segundos) do resultado.
+        """
+        self._ensure_started()
+
+        if self._last is None:
+            self.probe()
+
+        return {**self._last, "age_seconds": round(time.monotonic() - self._last_monotonic, 1)}
+
+    def is_stale(self) -> bool:
+        """Indica se a última verificação é antiga demais (a thread parou de atualizar)."""
+        return self._last_monotonic is None or time.monotonic() - self._last_monotonic > 3 * self.interval
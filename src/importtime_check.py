@@ -0,0 +1,106 @@
+# ----------------------------------------------------------------------------------------------- #
+# Verificação do tempo de import da aplicação (python -X importtime)
+# ----------------------------------------------------------------------------------------------- #
+"""
+Importa o `main` num processo novo com `python -X importtime` e verifica se a
+inicialização continua rápida:
+
+- o tempo total (import + create_app) fica abaixo do orçamento;
+- módulos pesados que devem ser carregados sob demanda (plotly, supabase) não
+  aparecem no caminho de inicialização.
+
+Uso (na raiz do projeto):
+
+    python -m src.importtime_check [--budget-ms 1000] [--top 15]
+
+Retorna código de saída 1 se alguma verificação falhar.
+"""
+
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import argparse
+import re
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+from config import BASE_DIR
+
+# ----------------------------------------------------------------------------------------------- #
+# Parâmetros
+# ----------------------------------------------------------------------------------------------- #
+
+# pacotes que só devem ser importados no primeiro uso
+LAZY_MODULES = ('plotly', 'supabase', 'postgrest')
+
+# orçamento padrão de inicialização (import do main, incluindo create_app)
+DEFAULT_BUDGET_MS = 1000
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+# ----------------------------------------------------------------------------------------------- #
+# Execução
+# ----------------------------------------------------------------------------------------------- #
+
+def run_importtime() -> Tuple[float, List[Tuple[int, int, str]]]:
+    """
+    Importa o `main` num processo novo com `-X importtime`.
+
+    Returns:
+        Tuple[float, List[Tuple[int, int, str]]]: Tempo total do processo (ms) e os
+            imports no formato (tempo próprio em µs, tempo acumulado em µs, módulo).
+
+    Raises:
+        subprocess.CalledProcessError: Se o import do `main` falhar.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import main'],
+        cwd = BASE_DIR, capture_output = True, text = True, check = True
+    )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    imports = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            imports.append((int(match.group(1)), int(match.group(2)), match.group(4)))
+
+    return elapsed_ms, imports
+
+def main() -> int:
+    args = argparse.ArgumentParser(description = 'Verifica o tempo de import da aplicação.')
+    args.add_argument('--budget-ms', type = float, default = DEFAULT_BUDGET_MS,
+                      help = 'tempo máximo do import do main (ms)')
+    args.add_argument('--top', type = int, default = 15, help = 'quantidade de módulos no ranking')
+    args = args.parse_args()
+
+    elapsed_ms, imports = run_importtime()
+    main_ms = next((cumulative / 1000 for _, cumulative, name in imports if name == 'main'), elapsed_ms)
+
+    print(f"{'acumulado (ms)':>15}{'próprio (ms)':>14}  módulo")
+    for self_us, cumulative_us, name in sorted(imports, key = lambda item: -item[1])[:args.top]:
+        print(f"{cumulative_us / 1000:>15.1f}{self_us / 1000:>14.1f}  {name}")
+
+    print()
+    print(f"import do main: {main_ms:.0f} ms (orçamento: {args.budget_ms:.0f} ms)")
+    print(f"processo completo: {elapsed_ms:.0f} ms")
+
+    failures = []
+    if main_ms > args.budget_ms:
+        failures.append(f"import do main acima do orçamento ({main_ms:.0f} ms > {args.budget_ms:.0f} ms)")
+
+    eager = sorted({name for _, _, name in imports if name.split('.')[0] in LAZY_MODULES})
+    if eager:
+        failures.append(f"módulos que deveriam ser carregados sob demanda: {', '.join(eager)}")
+
+    for failure in failures:
+        print(f"FALHA: {failure}")
+
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
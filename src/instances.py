@@ -5,9 +5,15 @@
 from flasgger import Swagger
 from flask import Blueprint
 from flask_jwt_extended import JWTManager
-from supabase import create_client
 
 from config import Config
+from .catalog.store import CatalogStore
+from .response_cache import ResponseCache
+from .auth_repository import UserRepository
+from .health import HealthProber
+from .metrics import RequestMetrics
+from .profiling import RequestProfiler
+from .supabase_client import LazySupabaseClient
 
 # ----------------------------------------------------------------------------------------------- #
 # Inicializar instâncias
@@ -15,6 +21,10 @@ from config import Config
 
 bp = Blueprint('main', __name__)
 jwt = JWTManager()
+catalog = CatalogStore(Config.CATALOG_PATH, Config.CATALOG_COLUMNAR_PATH)
+response_cache = ResponseCache(lambda: catalog.version)
+metrics = RequestMetrics()
+profiler = RequestProfiler()
 
 swagger = Swagger(
     template = {
@@ -32,4 +42,15 @@ swagger = Swagger(
 # Conectar banco de dados
 # ----------------------------------------------------------------------------------------------- #
 
-supabase = create_client(Config.SUPABASE_URL, Config.SUPABASE_KEY)
\ No newline at end of file
+# o cliente (e o import do pacote supabase) só é criado no primeiro acesso ao banco
+supabase = LazySupabaseClient(Config.SUPABASE_URL, Config.SUPABASE_KEY)
+
+# acesso à tabela de usuários com cache das consultas por username
+users = UserRepository(
+    supabase,
+    ttl = Config.USER_CACHE_TTL,
+    negative_ttl = Config.USER_NEGATIVE_CACHE_TTL
+)
+
+# verificação periódica das dependências (servida pelas rotas de health)
+health = HealthProber(supabase, interval = Config.HEALTH_PROBE_INTERVAL)
@@ -0,0 +1,154 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Optional, Tuple
+
+from flask import Flask, current_app, g, request
+from flask_jwt_extended import verify_jwt_in_request
+from flask_jwt_extended.config import config as jwt_config
+
+# ----------------------------------------------------------------------------------------------- #
+# Cache de tokens já verificados
+# ----------------------------------------------------------------------------------------------- #
+
+class VerifiedTokenCache:
+    """
+    Cache LRU com TTL de tokens JWT cuja assinatura já foi verificada.
+
+    A chave é o hash SHA-256 do token (o token em si não fica em memória) e o valor
+    são o header e as claims decodificados. Uma entrada nunca sobrevive ao `exp`
+    do token, de modo que tokens expirados voltam a passar pela verificação
+    completa (e recebem o erro adequado do Flask-JWT-Extended).
+
+    Configuração (via `app.config`):
+        JWT_VERIFIED_CACHE_SIZE: quantidade máxima de tokens guardados (0 desabilita).
+        JWT_VERIFIED_CACHE_TTL: tempo máximo (em segundos) de uma entrada.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: 'OrderedDict[str, Tuple[float, dict, dict]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        self.max_entries = app.config.get('JWT_VERIFIED_CACHE_SIZE', self.max_entries)
+        self.ttl = app.config.get('JWT_VERIFIED_CACHE_TTL', self.ttl)
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    def get(self, token: str) -> Optional[Tuple[dict, dict]]:
+        """Retorna (header, claims) de um token verificado anteriormente e ainda válido."""
+        key = self._key(token)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] <= time.time():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def put(self, token: str, jwt_header: dict, jwt_data: dict) -> None:
+        """Guarda um token recém-verificado até o menor entre `exp` e o TTL do cache."""
+        if self.max_entries <= 0:
+            return
+
+        valid_until = time.time() + self.ttl
+        if 'exp' in jwt_data:
+            valid_until = min(valid_until, jwt_data['exp'])
+
+        with self._lock:
+            self._entries[self._key(token)] = (valid_until, jwt_header, jwt_data)
+            self._entries.move_to_end(self._key(token))
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last = False)
+
+token_cache = VerifiedTokenCache()
+
+# ----------------------------------------------------------------------------------------------- #
+# Decodificação única do token por requisição
+# ----------------------------------------------------------------------------------------------- #
+
+def _token_from_header() -> Optional[str]:
+    if 'headers' not in jwt_config.token_location:
+        return None
+
+    value = request.headers.get(jwt_config.header_name, '')
+    header_type = jwt_config.header_type
+
+    if not header_type:
+        return value or None
+
+    prefix = f"{header_type} "
+    return value[len(prefix):] if value.startswith(prefix) else None
+
+def _store_in_request(jwt_header: dict, jwt_data: dict) -> None:
+    # mesmos atributos que o Flask-JWT-Extended preenche em verify_jwt_in_request,
+    # lidos por get_jwt_identity(), get_jwt() etc.
+    g._jwt_extended_jwt_user = {"loaded_user": None}
+    g._jwt_extended_jwt_header = jwt_header
+    g._jwt_extended_jwt = jwt_data
+    g._jwt_extended_jwt_location = 'headers'
+
+def load_request_identity() -> None:
+    """
+    Verifica o JWT da requisição (se houver) uma única vez e deixa as claims em `g`.
+
+    Tokens já verificados são servidos pelo `token_cache`, sem nova checagem de
+    assinatura. Tokens inválidos ou expirados propagam a exceção do
+    Flask-JWT-Extended, e a requisição segue sem identidade.
+
+    Raises:
+        flask_jwt_extended.exceptions.JWTExtendedException: Se o token for inválido.
+        jwt.exceptions.PyJWTError: Se o token estiver expirado ou malformado.
+    """
+    if g.get('_jwt_extended_jwt'):
+        return
+
+    token = _token_from_header()
+    cached = token_cache.get(token) if token else None
+
+    if cached is not None:
+        _store_in_request(*cached)
+        return
+
+    verified = verify_jwt_in_request(optional = True)
+
+    if token and verified is not None and g._jwt_extended_jwt_location == 'headers':
+        token_cache.put(token, *verified)
+
+def jwt_required() -> Callable:
+    """
+    Versão do `jwt_required` do Flask-JWT-Extended que reaproveita o token já
+    verificado na requisição (pelo `before_request`), em vez de decodificá-lo de novo.
+
+    Sem token válido em `g`, delega para `verify_jwt_in_request`, que gera a
+    resposta 401 padrão do Flask-JWT-Extended.
+    """
+    def wrapper(fn):
+        @wraps(fn)
+        def decorator(*args, **kwargs):
+            if not g.get('_jwt_extended_jwt'):
+                verify_jwt_in_request()
+            return current_app.ensure_sync(fn)(*args, **kwargs)
+
+        return decorator
+
+    return wrapper
@@ -2,14 +2,22 @@
 # Imports
 # ----------------------------------------------------------------------------------------------- #
 
+import atexit
+import json
 import logging
 import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from flask import Flask, request, g, current_app
 from werkzeug.exceptions import HTTPException
-from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
+from flask_jwt_extended import get_jwt_identity
+
+from .jwt_cache import load_request_identity
+from .metrics import phase
 
 # ----------------------------------------------------------------------------------------------- #
 # Definir nome da pasta de documentação dos logs
@@ -69,12 +77,253 @@ def setup_logging(app: Flask) -> None:
     else:
         app.logger.info("Logger inicializado (stdout / Render)")
 
+# ----------------------------------------------------------------------------------------------- #
+# Fila assíncrona de logs de requisições (supabase)
+# ----------------------------------------------------------------------------------------------- #
+
+class RequestLogQueue:
+    """
+    Fila limitada em memória que envia os logs de requisições ao Supabase em lotes.
+
+    As requisições apenas enfileiram a linha de log; uma thread em segundo plano
+    insere os lotes na tabela `api_request_logs` quando o lote atinge `batch_size`
+    linhas ou quando passam `flush_interval` segundos. Com a fila cheia (ou se o
+    envio de um lote falhar), as linhas são gravadas em um arquivo JSONL local
+    (`overflow = 'spill'`) ou descartadas (`overflow = 'drop'`). A fila é esvaziada
+    no encerramento do processo.
+
+    O arquivo de excedentes é rotacionado ao atingir `spill_max_bytes` (o anterior
+    vira `<arquivo>.1` e o `.1` antigo é descartado, entrando na contagem `dropped`),
+    de modo que o disco ocupado fica limitado a cerca de duas vezes esse tamanho.
+    Depois de um envio bem-sucedido (o Supabase voltou a responder), a thread reenvia
+    as linhas dos arquivos de excedentes, no máximo uma vez a cada `replay_interval`
+    segundos; se o reenvio falhar, as linhas voltam para o arquivo.
+
+    Args:
+        supabase: Cliente do Supabase.
+        logger (logging.Logger): Logger usado para reportar falhas de envio.
+        max_size (int): Quantidade máxima de linhas aguardando envio.
+        batch_size (int): Quantidade máxima de linhas por insert.
+        flush_interval (float): Intervalo máximo (em segundos) entre envios.
+        overflow (str): 'spill' para gravar o excedente em arquivo ou 'drop' para descartá-lo.
+        spill_file (str): Caminho do arquivo JSONL de excedentes.
+        spill_max_bytes (int): Tamanho a partir do qual o arquivo de excedentes é rotacionado (0 desabilita).
+        replay_interval (float): Intervalo mínimo (em segundos) entre reenvios dos excedentes.
+    """
+
+    def __init__(self, supabase, logger: logging.Logger, max_size: int = 10000, batch_size: int = 100,
+                 flush_interval: float = 2.0, overflow: str = 'spill', spill_file: str = f"{LOG_DIR}/request_logs_spill.jsonl",
+                 spill_max_bytes: int = 10 * 1024 * 1024, replay_interval: float = 60.0):
+        self.supabase = supabase
+        self.logger = logger
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.spill_file = spill_file
+        self.spill_max_bytes = spill_max_bytes
+        self.replay_interval = replay_interval
+
+        # contadores expostos no health check
+        self.sent = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.replayed = 0
+        self.failed_batches = 0
+
+        self._next_replay = 0.0
+
+        self._queue: queue.Queue = queue.Queue(maxsize = max_size)
+        self._stop = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+
+        atexit.register(self.close)
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": self.depth,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "spilled": self.spilled,
+            "replayed": self.replayed,
+            "failed_batches": self.failed_batches
+        }
+
+    def _ensure_started(self) -> None:
+        # a thread é criada no próprio processo (ex.: após o fork dos workers do gunicorn)
+        if self._pid == os.getpid():
+            return
+
+        with self._start_lock:
+            if self._pid != os.getpid():
+                self._stop.clear()
+                self._thread = threading.Thread(target = self._run, name = "request-log-flusher", daemon = True)
+                self._thread.start()
+                self._pid = os.getpid()
+
+    def put(self, row: dict) -> None:
+        """Enfileira uma linha de log sem bloquear a requisição."""
+        self._ensure_started()
+
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self._overflow([row])
+
+    def _overflow(self, rows: list) -> None:
+        with self._spill_lock:
+            if self.overflow != 'spill':
+                self.dropped += len(rows)
+                return
+
+            try:
+                os.makedirs(os.path.dirname(self.spill_file) or ".", exist_ok = True)
+                self._rotate_spill()
+                with open(self.spill_file, "a", encoding = "utf-8") as f:
+                    f.writelines(json.dumps(row) + "\n" for row in rows)
+                self.spilled += len(rows)
+            except OSError as e:
+                self.dropped += len(rows)
+                self.logger.error(f"Erro ao gravar logs excedentes em {self.spill_file}: {e}")
+
+    def _rotate_spill(self) -> None:
+        # chamado com o _spill_lock: o arquivo cheio vira .1 e o .1 anterior é descartado
+        if not self.spill_max_bytes or not os.path.exists(self.spill_file):
+            return
+        if os.path.getsize(self.spill_file) < self.spill_max_bytes:
+            return
+
+        rotated = self.spill_file + ".1"
+        if os.path.exists(rotated):
+            with open(rotated, "rb") as f:
+                discarded = sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 20), b""))
+            self.dropped += discarded
+            self.logger.warning(f"{discarded} logs excedentes descartados na rotação de {self.spill_file}")
+
+        os.replace(self.spill_file, rotated)
+
+    def replay_spill(self) -> int:
+        """
+        Reenvia ao Supabase as linhas gravadas nos arquivos de excedentes.
+
+        Cada arquivo é renomeado para um nome exclusivo do processo antes da leitura,
+        de modo que dois workers não reenviam as mesmas linhas. As linhas de um lote
+        que falhar (e as seguintes) voltam para o arquivo de excedentes.
+
+        Returns:
+            int: Quantidade de linhas reenviadas.
+        """
+        replayed = 0
+
+        for path in (self.spill_file + ".1", self.spill_file):
+            pending = f"{path}.replay-{os.getpid()}"
+            with self._spill_lock:
+                try:
+                    os.replace(path, pending)
+                except FileNotFoundError:
+                    continue
+
+            try:
+                with open(pending, encoding = "utf-8") as f:
+                    rows = [json.loads(line) for line in f if line.strip()]
+            except (OSError, ValueError) as e:
+                self.logger.error(f"Erro ao ler logs excedentes em {pending}: {e}")
+                continue
+
+            for start in range(0, len(rows), self.batch_size):
+                batch = rows[start:start + self.batch_size]
+                if not self._send(batch):
+                    self._overflow(rows[start + self.batch_size:])
+                    os.unlink(pending)
+                    self.replayed += replayed
+                    return replayed
+                replayed += len(batch)
+
+            os.unlink(pending)
+
+        self.replayed += replayed
+        return replayed
+
+    def _next_batch(self) -> list:
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout = timeout))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _send(self, batch: list) -> bool:
+        try:
+            self.supabase.table("api_request_logs").insert(batch).execute()
+            self.sent += len(batch)
+            return True
+        except Exception as e:
+            self.failed_batches += 1
+            self.logger.error(f"Erro ao salvar {len(batch)} logs no Supabase: {e}")
+            self._overflow(batch)
+            return False
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            batch = self._next_batch()
+            if not batch or not self._send(batch) or self.overflow != 'spill':
+                continue
+
+            # o Supabase está respondendo: reenvia os excedentes gravados antes
+            if time.monotonic() >= self._next_replay:
+                self._next_replay = time.monotonic() + self.replay_interval
+                self.replay_spill()
+
+    def flush(self) -> None:
+        """Envia imediatamente tudo o que estiver na fila (chamado no encerramento)."""
+        while True:
+            batch = []
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            if not batch:
+                return
+            self._send(batch)
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join(timeout = self.flush_interval + 1)
+        self.flush()
+
 # ----------------------------------------------------------------------------------------------- #
 # Configurar registros de logs (supabase)
 # ----------------------------------------------------------------------------------------------- #
 
 def register_request_logging(app, supabase):
-    tz_sp = ZoneInfo("America/Sao_Paulo")
+    log_queue = RequestLogQueue(
+        supabase,
+        app.logger,
+        max_size = app.config.get("REQUEST_LOG_QUEUE_SIZE", 10000),
+        batch_size = app.config.get("REQUEST_LOG_BATCH_SIZE", 100),
+        flush_interval = app.config.get("REQUEST_LOG_FLUSH_INTERVAL", 2.0),
+        overflow = app.config.get("REQUEST_LOG_OVERFLOW", "spill"),
+        spill_file = app.config.get("REQUEST_LOG_SPILL_FILE", f"{LOG_DIR}/request_logs_spill.jsonl"),
+        spill_max_bytes = app.config.get("REQUEST_LOG_SPILL_MAX_BYTES", 10 * 1024 * 1024),
+        replay_interval = app.config.get("REQUEST_LOG_REPLAY_INTERVAL", 60.0)
+    )
+    app.extensions["request_log_queue"] = log_queue
 
     IGNORED_PATHS = {
         "/flasgger_static/swagger-ui-standalone-preset.js",
@@ -86,6 +335,9 @@ def register_request_logging(app, supabase):
         "/static/styles.css",
         "/static/question_mark.png",
         '/api/v1/health',
+        '/api/v1/health/live',
+        '/api/v1/health/ready',
+        '/metrics',
         '/',
         '/flasgger_static/favicon-32x32.png',
         '/static/favicon.png',
@@ -93,47 +345,71 @@ def register_request_logging(app, supabase):
         '/apidocs'
     }
 
+    # arquivos estáticos com fingerprint (ex.: /assets/plotly.<hash>.min.js)
+    IGNORED_PREFIXES = ("/assets/",)
+
+    # Perfil da requisição (opt-in, ver profiling.py): iniciado antes dos demais hooks da cadeia
+    profiler = app.extensions.get("profiler")
+
+    @app.before_request
+    def start_profiling():
+        if profiler is not None and profiler.should_profile():
+            g.profile = profiler.start()
+            g.profile_start_time = time.perf_counter()
+
+    # registrado antes do log no Supabase: roda depois dele, ao fim da cadeia de after_request
+    @app.after_request
+    def stop_profiling(response):
+        profile = g.pop("profile", None)
+        if profile is not None:
+            profile_id = profiler.stop(profile, response.status_code, time.perf_counter() - g.profile_start_time)
+            if profile_id is not None:
+                response.headers["X-Profile-Id"] = profile_id
+        return response
+
+    # requisição encerrada sem passar pelo after_request: o perfil é descartado
+    @app.teardown_request
+    def discard_profiling(exc):
+        profile = g.pop("profile", None)
+        if profile is not None:
+            profiler.discard(profile)
+
     # Carregar usuário (ANTES do logging e do after_request)
+    # o token é verificado uma única vez aqui e reaproveitado pelo @jwt_required das rotas
     @app.before_request
     def load_user():
         try:
-            verify_jwt_in_request(optional=True)
+            with phase('auth'):
+                load_request_identity()
             g.user_id = get_jwt_identity()
         except Exception:
             g.user_id = None
 
-    # Log simples em stdout
+    # Log simples em stdout (a duração da requisição é medida pelas métricas, ver metrics.py)
     @app.before_request
     def log_request():
-        g.request_start_time = datetime.now(tz_sp)
         current_app.logger.info(
             f"{request.method} {request.path}"
         )
 
-    # Log estruturado no Supabase
-    def log_request_to_supabase_factory(supabase):
+    # Log estruturado no Supabase (enfileirado e enviado em lotes por uma thread)
+    def log_request_to_supabase_factory(log_queue):
         def log_request_to_supabase(response):
-            if request.path in IGNORED_PATHS:
+            if request.path in IGNORED_PATHS or request.path.startswith(IGNORED_PREFIXES):
                 return response
 
-            try:
-                supabase.table("api_request_logs").insert({
-                    "user_id": g.user_id,
-                    "method": request.method,
-                    "path": request.path,
-                    "status_code": response.status_code,
-                }).execute()
-
-            except Exception as e:
-                current_app.logger.error(
-                    f"Erro ao salvar log no Supabase: {e}"
-                )
+            log_queue.put({
+                "user_id": g.get("user_id"),
+                "method": request.method,
+                "path": request.path,
+                "status_code": response.status_code,
+            })
 
             return response
 
         return log_request_to_supabase
 
-    app.after_request(log_request_to_supabase_factory(supabase))
+    app.after_request(log_request_to_supabase_factory(log_queue))
 
     # Tratamento de exceções
     @app.errorhandler(Exception)
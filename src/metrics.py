@@ -0,0 +1,207 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from flask import Flask, g, has_request_context, request
+
+# ----------------------------------------------------------------------------------------------- #
+# Intervalos dos histogramas de latência (em segundos)
+# ----------------------------------------------------------------------------------------------- #
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# rota usada para requisições que não casam com nenhuma rota (ex.: 404), para limitar as séries
+UNMATCHED_ROUTE = '<unmatched>'
+
+# ----------------------------------------------------------------------------------------------- #
+# Fases de uma requisição
+# ----------------------------------------------------------------------------------------------- #
+
+@contextmanager
+def phase(name: str):
+    """
+    Mede o tempo de uma fase da requisição corrente (ex.: 'index', 'serialize', 'db').
+
+    O tempo é acumulado por nome de fase (uma fase pode ocorrer mais de uma vez) e,
+    ao final da requisição, vai para o histograma da fase e para o cabeçalho
+    `Server-Timing`. Fora de uma requisição, apenas executa o bloco.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if has_request_context():
+            elapsed = time.perf_counter() - start
+            phases = g.setdefault('phase_timings', {})
+            phases[name] = phases.get(name, 0.0) + elapsed
+
+# ----------------------------------------------------------------------------------------------- #
+# Histograma
+# ----------------------------------------------------------------------------------------------- #
+
+class Histogram:
+    """Histograma cumulativo no formato do Prometheus (contagem por limite superior, soma e total)."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Pares (limite `le`, contagem acumulada), terminando em '+Inf'."""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            pairs.append(('+Inf' if bound == float('inf') else repr(bound), total))
+        return pairs
+
+# ----------------------------------------------------------------------------------------------- #
+# Métricas das requisições
+# ----------------------------------------------------------------------------------------------- #
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(**labels) -> str:
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+class RequestMetrics:
+    """
+    Contadores e histogramas de latência das requisições, expostos no formato do Prometheus.
+
+    Cada requisição é medida do primeiro `before_request` ao último `after_request`
+    e registrada pela rota (o padrão da URL, ex.: /api/v1/books/<int:id>), método
+    e status. As rotas podem medir fases internas com `phase(...)`; a duração total
+    e a de cada fase vão também para o cabeçalho `Server-Timing` da resposta.
+
+    As métricas são do processo: com vários workers do gunicorn, cada worker
+    responde com os próprios contadores.
+
+    Configuração (via `app.config`):
+        METRICS_ENABLED: habilita a medição das requisições e a rota /metrics.
+        METRICS_SERVER_TIMING: adiciona o cabeçalho `Server-Timing` às respostas.
+
+    Args:
+        buckets (Sequence[float]): Limites (em segundos) dos histogramas de latência.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.enabled = True
+        self.server_timing = True
+
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.errors: Dict[Tuple[str, str], int] = {}
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.phases: Dict[Tuple[str, str], Histogram] = {}
+
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        self.enabled = app.config.get('METRICS_ENABLED', self.enabled)
+        self.server_timing = app.config.get('METRICS_SERVER_TIMING', self.server_timing)
+        app.extensions['metrics'] = self
+
+        if not self.enabled:
+            return
+
+        # registrado antes dos demais hooks: o before_request roda primeiro e o after_request, por último
+        app.before_request(self._start)
+        app.after_request(self._finish)
+
+    def _start(self) -> None:
+        g.request_start_time = time.perf_counter()
+
+    def _finish(self, response):
+        start = g.get('request_start_time')
+        if start is None:
+            return response
+
+        elapsed = time.perf_counter() - start
+        phases = g.get('phase_timings', {})
+        route = request.url_rule.rule if request.url_rule is not None else UNMATCHED_ROUTE
+
+        self.observe(request.method, route, response.status_code, elapsed, phases)
+
+        if self.server_timing:
+            timings = [f'{name};dur={1000 * seconds:.2f}' for name, seconds in phases.items()]
+            timings.append(f'total;dur={1000 * elapsed:.2f}')
+            response.headers['Server-Timing'] = ', '.join(timings)
+
+        return response
+
+    def observe(self, method: str, route: str, status: int, seconds: float,
+                phases: Optional[Dict[str, float]] = None) -> None:
+        """Registra uma requisição concluída (duração total e das fases, em segundos)."""
+        with self._lock:
+            key = (method, route, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+            if status >= 500:
+                self.errors[(method, route)] = self.errors.get((method, route), 0) + 1
+
+            histogram = self.latency.get((method, route))
+            if histogram is None:
+                histogram = self.latency[(method, route)] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+            for name, phase_seconds in (phases or {}).items():
+                histogram = self.phases.get((route, name))
+                if histogram is None:
+                    histogram = self.phases[(route, name)] = Histogram(self.buckets)
+                histogram.observe(phase_seconds)
+
+    def render(self) -> str:
+        """Métricas no formato de texto do Prometheus (versão 0.0.4)."""
+        lines = []
+
+        with self._lock:
+            lines += [
+                '# HELP http_requests_total Requisições atendidas, por rota, método e status.',
+                '# TYPE http_requests_total counter'
+            ]
+            for (method, route, status), count in sorted(self.requests.items()):
+                lines.append(f'http_requests_total{_labels(method = method, route = route, status = status)} {count}')
+
+            lines += [
+                '# HELP http_request_errors_total Requisições com erro do servidor (status 5xx), por rota e método.',
+                '# TYPE http_request_errors_total counter'
+            ]
+            for (method, route), count in sorted(self.errors.items()):
+                lines.append(f'http_request_errors_total{_labels(method = method, route = route)} {count}')
+
+            lines += [
+                '# HELP http_request_duration_seconds Duração das requisições, por rota e método.',
+                '# TYPE http_request_duration_seconds histogram'
+            ]
+            for (method, route), histogram in sorted(self.latency.items()):
+                lines += self._histogram_lines('http_request_duration_seconds', histogram, method = method, route = route)
+
+            lines += [
+                '# HELP http_request_phase_duration_seconds Duração das fases das requisições (ex.: index, serialize, db), por rota.',
+                '# TYPE http_request_phase_duration_seconds histogram'
+            ]
+            for (route, name), histogram in sorted(self.phases.items()):
+                lines += self._histogram_lines('http_request_phase_duration_seconds', histogram, route = route, phase = name)
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _histogram_lines(name: str, histogram: Histogram, **labels) -> List[str]:
+        lines = [f'{name}_bucket{_labels(**labels, le = le)} {count}' for le, count in histogram.cumulative()]
+        lines.append(f'{name}_sum{_labels(**labels)} {histogram.sum!r}')
+        lines.append(f'{name}_count{_labels(**labels)} {histogram.count}')
+        return lines
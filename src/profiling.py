@@ -0,0 +1,187 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import random
+import re
+import threading
+import time
+import uuid
+from typing import List, Optional
+
+from flask import Flask, request
+
+# ----------------------------------------------------------------------------------------------- #
+# Perfis de requisições (cProfile) sob demanda
+# ----------------------------------------------------------------------------------------------- #
+
+# ids gerados por save (uuid4 em hexadecimal): qualquer outro valor é rejeitado antes de tocar no disco
+PROFILE_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+class RequestProfiler:
+    """
+    Perfil (cProfile) de requisições individuais, habilitado sob demanda.
+
+    Com o profiler habilitado, uma requisição é perfilada quando traz o header
+    `X-Profile: 1` junto com o token de admin (`X-Admin-Token`) ou, sem header,
+    por amostragem (`sample_rate`). O perfil cobre toda a cadeia de before_request,
+    rota e after_request, é gravado em disco no formato do pstats (`<id>.prof`, com
+    os dados da requisição em `<id>.json`) e o id vem no header `X-Profile-Id` da
+    resposta. Os perfis ficam disponíveis para download nas rotas de admin.
+
+    Apenas uma requisição por processo é perfilada por vez (o cProfile não admite
+    dois perfis ativos); enquanto isso, as demais seguem sem perfil.
+
+    Configuração (via `app.config`):
+        PROFILING_ENABLED: habilita o profiler (desabilitado por padrão).
+        PROFILING_SAMPLE_RATE: fração das requisições perfiladas sem o header (0 a 1).
+        PROFILING_DIR: pasta onde os perfis são gravados.
+        PROFILING_MAX_FILES: quantidade máxima de perfis guardados (os mais antigos são apagados).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.sample_rate = 0.0
+        self.directory = os.path.join("logs", "profiles")
+        self.max_files = 50
+        self.logger = logging.getLogger(__name__)
+
+        self._active = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        self.enabled = app.config.get('PROFILING_ENABLED', self.enabled)
+        self.sample_rate = app.config.get('PROFILING_SAMPLE_RATE', self.sample_rate)
+        self.directory = app.config.get('PROFILING_DIR', self.directory)
+        self.max_files = app.config.get('PROFILING_MAX_FILES', self.max_files)
+        self.logger = app.logger
+        app.extensions['profiler'] = self
+
+    # ------------------------------------------------------------------------------------------- #
+    # Perfil da requisição corrente
+    # ------------------------------------------------------------------------------------------- #
+
+    def should_profile(self) -> bool:
+        """Indica se a requisição corrente deve ser perfilada (header de admin ou amostragem)."""
+        if not self.enabled:
+            return False
+
+        if request.headers.get('X-Profile') == '1':
+            # import local: as rotas de admin dependem das instâncias, que não devem depender deste módulo
+            from .api.admin_routes import is_admin_request
+            return is_admin_request()
+
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def start(self) -> Optional[cProfile.Profile]:
+        """Inicia o perfil da requisição (None se já houver outra sendo perfilada neste processo)."""
+        if not self._active.acquire(blocking = False):
+            return None
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # outra ferramenta de profiling já está ativa no interpretador
+            self._active.release()
+            return None
+
+        return profile
+
+    def discard(self, profile: cProfile.Profile) -> None:
+        """Encerra um perfil sem gravá-lo (ex.: requisição interrompida antes do after_request)."""
+        profile.disable()
+        self._active.release()
+
+    def stop(self, profile: cProfile.Profile, status_code: int, elapsed: float) -> Optional[str]:
+        """
+        Encerra o perfil da requisição corrente e o grava em disco.
+
+        Args:
+            profile (cProfile.Profile): Perfil retornado por `start`.
+            status_code (int): Status HTTP da resposta.
+            elapsed (float): Duração da requisição (em segundos) até aqui.
+
+        Returns:
+            Optional[str]: Id do perfil gravado (None se a gravação falhar).
+        """
+        self.discard(profile)
+
+        info = {
+            'method': request.method,
+            'path': request.full_path.rstrip('?'),
+            'route': request.url_rule.rule if request.url_rule is not None else None,
+            'status_code': status_code,
+            'duration_ms': round(1000 * elapsed, 2),
+            'created_at': time.time()
+        }
+
+        try:
+            return self.save(profile, info)
+        except OSError as e:
+            self.logger.error(f"Erro ao gravar o perfil de {info['method']} {info['path']}: {e}")
+            return None
+
+    # ------------------------------------------------------------------------------------------- #
+    # Perfis gravados
+    # ------------------------------------------------------------------------------------------- #
+
+    def save(self, profile: cProfile.Profile, info: dict) -> str:
+        """Grava o perfil (formato pstats) e seus dados, apagando os perfis excedentes mais antigos."""
+        os.makedirs(self.directory, exist_ok = True)
+        profile_id = uuid.uuid4().hex
+
+        profile.dump_stats(os.path.join(self.directory, f"{profile_id}.prof"))
+        with open(os.path.join(self.directory, f"{profile_id}.json"), "w", encoding = "utf-8") as f:
+            json.dump({'id': profile_id, **info}, f)
+
+        for old in self.list()[self.max_files:]:
+            for suffix in (".prof", ".json"):
+                try:
+                    os.unlink(os.path.join(self.directory, old['id'] + suffix))
+                except OSError:
+                    pass
+
+        return profile_id
+
+    def list(self) -> List[dict]:
+        """Dados dos perfis gravados, do mais recente para o mais antigo."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+
+        profiles = []
+        for name in names:
+            if not name.endswith(".json") or not PROFILE_ID_PATTERN.match(name[:-5]):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), encoding = "utf-8") as f:
+                    profiles.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+
+        return sorted(profiles, key = lambda info: info.get('created_at', 0), reverse = True)
+
+    def path(self, profile_id: str) -> Optional[str]:
+        """Caminho do arquivo .prof de um perfil (None se o id for inválido ou não existir)."""
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+
+        path = os.path.join(self.directory, f"{profile_id}.prof")
+        return path if os.path.exists(path) else None
+
+    def text(self, profile_id: str, sort: str = 'cumulative', limit: int = 50) -> Optional[str]:
+        """Resumo textual (pstats) de um perfil, com as `limit` funções mais custosas por `sort`."""
+        path = self.path(profile_id)
+        if path is None:
+            return None
+
+        out = io.StringIO()
+        pstats.Stats(path, stream = out).strip_dirs().sort_stats(sort).print_stats(limit)
+        return out.getvalue()
@@ -0,0 +1,183 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from flask import Flask, Response, g, request, make_response
+
+from .catalog.serialization import Payload
+
+# ----------------------------------------------------------------------------------------------- #
+# Cabeçalhos preservados nas respostas guardadas em cache
+# ----------------------------------------------------------------------------------------------- #
+
+CACHED_HEADERS = ('X-Total-Count', 'X-Next-Cursor', 'Link')
+
+# ----------------------------------------------------------------------------------------------- #
+# Entrada do cache
+# ----------------------------------------------------------------------------------------------- #
+
+class CachedResponse:
+    """Payload (corpo, variantes comprimidas e ETag) e cabeçalhos extras de uma resposta."""
+
+    def __init__(self, payload: Payload, headers: Dict[str, str]):
+        self.payload = payload
+        self.headers = headers
+
+    @property
+    def size(self) -> int:
+        """Bytes ocupados pelo corpo e pelas variantes comprimidas (cada uma limitada ao tamanho do corpo)."""
+        return len(self.payload.body) * len(self.payload.encodings)
+
+    def to_response(self) -> Response:
+        response = self.payload.response()
+        response.headers.update(self.headers)
+        return response
+
+# ----------------------------------------------------------------------------------------------- #
+# Cache de respostas versionado pela base de dados
+# ----------------------------------------------------------------------------------------------- #
+
+class ResponseCache:
+    """
+    Cache LRU em memória das respostas GET, com ETag e revalidação condicional.
+
+    A chave combina rota, parâmetros da query string aceitos pela rota (os demais
+    não alteram a resposta e são ignorados) e versão do catálogo. Quando a versão
+    do catálogo muda, o cache é esvaziado, de modo que nenhuma resposta de uma
+    versão anterior é servida. Respostas com status diferente de 200 não são
+    guardadas, nem as maiores que `CACHE_MAX_ENTRY_BYTES`.
+
+    O tamanho de cada entrada conta o corpo e as variantes comprimidas (gzip/brotli)
+    que ela pode vir a guardar; as entradas menos usadas são descartadas quando a
+    quantidade ou o total de bytes passam dos limites.
+
+    As rotas podem retornar um `Payload` pré-serializado (guardado sem cópia);
+    as demais respostas são convertidas em `Payload` na primeira requisição, o que
+    também gera suas variantes comprimidas (gzip/brotli).
+
+    Configuração (via `app.config`):
+        CACHE_TYPE: 'simple' habilita o cache; 'null' desabilita (apenas ETag/304).
+        CACHE_THRESHOLD: quantidade máxima de respostas guardadas.
+        CACHE_MAX_BYTES: total máximo de bytes guardados.
+        CACHE_MAX_ENTRY_BYTES: tamanho máximo de uma resposta guardada.
+
+    Args:
+        version_getter (Callable[[], str]): Função que retorna a versão corrente dos dados.
+    """
+
+    def __init__(self, version_getter: Callable[[], str]):
+        self.version_getter = version_getter
+        self.enabled = True
+        self.max_entries = 500
+        self.max_bytes = 32 * 1024 * 1024
+        self.max_entry_bytes = 1024 * 1024
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: 'OrderedDict[Tuple, CachedResponse]' = OrderedDict()
+        self._version: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        self.enabled = app.config.get('CACHE_TYPE', 'simple') not in ('null', 'NullCache')
+        self.max_entries = app.config.get('CACHE_THRESHOLD', self.max_entries)
+        self.max_bytes = app.config.get('CACHE_MAX_BYTES', self.max_bytes)
+        self.max_entry_bytes = app.config.get('CACHE_MAX_ENTRY_BYTES', self.max_entry_bytes)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _key(self, names: frozenset, version: str) -> Tuple:
+        args = tuple(sorted((name, value) for name, value in request.args.items(multi = True) if name in names))
+        return (request.path, args, version)
+
+    def _get(self, key: Tuple) -> Optional[CachedResponse]:
+        with self._lock:
+            # nova versão dos dados: descarta tudo que foi gerado com a versão anterior
+            if key[-1] != self._version:
+                self._entries.clear()
+                self.bytes = 0
+                self._version = key[-1]
+
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _set(self, key: Tuple, entry: CachedResponse) -> None:
+        with self._lock:
+            if key[-1] != self._version or entry.size > min(self.max_entry_bytes, self.max_bytes):
+                return
+
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous.size
+
+            self._entries[key] = entry
+            self.bytes += entry.size
+
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last = False)
+                self.bytes -= evicted.size
+
+    def cached(self, args: Iterable[str] = ()) -> Callable:
+        """
+        Decorator que guarda a resposta da rota e trata `If-None-Match` (HTTP 304).
+
+        Deve ficar abaixo de decorators de autenticação (ex.: `@jwt_required()`),
+        para que a verificação de acesso ocorra antes da consulta ao cache.
+
+        Args:
+            args (Iterable[str]): Parâmetros da query string lidos pela rota (os únicos
+                que entram na chave do cache).
+        """
+        names = frozenset(args)
+
+        def decorator(view: Callable) -> Callable:
+            return self._wrap(view, names)
+
+        return decorator
+
+    def _wrap(self, view: Callable, names: frozenset) -> Callable:
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = self._key(names, self.version_getter())
+
+            # requisição sendo perfilada (ver profiling.py): a rota é executada mesmo com a resposta em cache
+            entry = self._get(key) if self.enabled and g.get('profile') is None else None
+
+            if entry is None:
+                rv = view(*args, **kwargs)
+
+                if isinstance(rv, Payload):
+                    entry = CachedResponse(rv, {})
+                else:
+                    response = make_response(rv)
+
+                    if response.status_code != 200 or response.direct_passthrough:
+                        return response
+
+                    headers = {h: response.headers[h] for h in CACHED_HEADERS if h in response.headers}
+                    entry = CachedResponse(Payload(response.get_data(), response.mimetype), headers)
+
+                if self.enabled:
+                    self._set(key, entry)
+
+            return entry.to_response().make_conditional(request)
+
+        return wrapper
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Microbenchmark dos backends de parsing das páginas de categoria (ver parsers.py).
+
+Uso (a partir de src/scraping):
+
+    python bench_parsers.py PASTA [--download] [--repeat N]
+
+PASTA contém páginas de categoria salvas (*.html). Com --download, as páginas de
+todas as categorias do site são baixadas para a pasta antes do benchmark. Além do
+tempo de cada backend, o script confere se todos extraem exatamente o mesmo
+conteúdo do parser de referência (bs4).
+"""
+
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import argparse
+import time
+from pathlib import Path
+from typing import List
+
+from books_ingestion import get_dict_categories, get_next_pages, url_books
+from crawler import Crawler
+from parsers import PARSERS, parse_bs4
+
+# ----------------------------------------------------------------------------------------------- #
+# Baixar páginas de exemplo
+# ----------------------------------------------------------------------------------------------- #
+
+def download_pages(pasta: Path) -> None:
+    pasta.mkdir(parents = True, exist_ok = True)
+
+    with Crawler() as crawler:
+        categories = list(get_dict_categories(url_books, crawler).values())
+        start = [((i, 1), url_books + link) for i, link in enumerate(categories)]
+
+        def parse(key, url, response):
+            (pasta / f'cat{key[0]:03d}_page{key[1]:03d}.html').write_text(response.text, encoding = 'utf-8')
+            return parse_bs4(response.text)
+
+        def expand(key, url, pagina):
+            return [((key[0], n), next_url) for n, next_url in get_next_pages(url, key[1], pagina).items()]
+
+        for _ in crawler.crawl(start, parse, expand):
+            pass
+
+# ----------------------------------------------------------------------------------------------- #
+# Benchmark
+# ----------------------------------------------------------------------------------------------- #
+
+def benchmark(pages: List[str], repeat: int) -> None:
+    reference = [parse_bs4(html) for html in pages]
+    n_books = sum(len(pagina.books) for pagina in reference)
+
+    print(f"{len(pages)} páginas, {n_books} livros, {repeat} repetições\n")
+    print(f"{'backend':<12}{'total (s)':>12}{'ms/página':>12}{'speedup':>10}  resultado")
+
+    baseline = None
+    for name, parse in PARSERS.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            result = [parse(html) for html in pages]
+        elapsed = time.perf_counter() - start
+
+        baseline = baseline or elapsed
+        status = 'igual ao bs4' if result == reference else 'DIFERENTE do bs4'
+        print(f"{name:<12}{elapsed:>12.3f}{1000 * elapsed / (repeat * len(pages)):>12.2f}{baseline / elapsed:>9.1f}x  {status}")
+
+if __name__ == '__main__':
+    args = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    args.add_argument('pasta', type = Path, help = 'pasta com as páginas de categoria (*.html)')
+    args.add_argument('--download', action = 'store_true', help = 'baixar as páginas do site para a pasta antes')
+    args.add_argument('--repeat', type = int, default = 3, help = 'repetições de cada backend')
+    args = args.parse_args()
+
+    if args.download:
+        download_pages(args.pasta)
+
+    pages = [path.read_text(encoding = 'utf-8') for path in sorted(args.pasta.glob('*.html'))]
+    if not pages:
+        raise SystemExit(f"Nenhuma página .html em {args.pasta} (use --download)")
+
+    benchmark(pages, args.repeat)
@@ -4,24 +4,55 @@
 # Imports
 # ----------------------------------------------------------------------------------------------- #
 
+import csv
+import json
+import os
+import tempfile
 import requests
 import pandas as pd
 import pytz
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from tqdm import tqdm
-from word2number import w2n
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import sys
 from pathlib import Path
 
-# adicionar o caminho da pasta raiz
-PROJECT_ROOT = Path().resolve().parents[1]
+# adicionar o caminho da pasta raiz e da pasta de scraping
+SCRAPING_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRAPING_DIR.parents[1]
 sys.path.append(str(PROJECT_ROOT))
+sys.path.append(str(SCRAPING_DIR))
 
 from config import url_books
+from src.catalog.columnar import write_columnar_from_csv
+from crawler import Crawler, CrawlState
+from http_cache import HttpCache
+from parsers import RATINGS, CategoryPage, get_parser
+
+# ----------------------------------------------------------------------------------------------- #
+# Configurações do crawling
+# ----------------------------------------------------------------------------------------------- #
+
+CRAWL_CONCURRENCY = 16      # requisições simultâneas
+CRAWL_RATE_LIMIT = None     # requisições por segundo por host (None = sem limite)
+CRAWL_RETRIES = 3           # novas tentativas por requisição (com backoff exponencial)
+CRAWL_TIMEOUT = 10          # segundos
+
+# colunas da base de dados (além do id), na ordem do CSV
+BOOK_COLUMNS = ['title', 'price', 'rating', 'availability', 'category', 'image']
+
+# arquivo de saída da ingestão
+OUTPUT_PATH = PROJECT_ROOT / 'data' / 'base_livros.csv'
+
+# cache de respostas HTTP em disco (ver http_cache.HttpCache)
+CACHE_DIR = PROJECT_ROOT / 'data' / 'http_cache'
+
+# arquivos do modo incremental (estado do crawling anterior e último delta aplicado)
+STATE_PATH = PROJECT_ROOT / 'data' / 'crawl_state.json'
+DELTA_PATH = PROJECT_ROOT / 'data' / 'base_livros_delta.json'
 
 # ----------------------------------------------------------------------------------------------- #
 # Função para printar o horário da execução
@@ -32,11 +63,24 @@ def horario_atual(texto = "Término da execução", gap = 0):
     hora_atual = datetime.now(pytz.timezone("America/Sao_Paulo"))
     print(f"{texto.ljust(gap)}: {hora_atual.strftime('%d/%m/%Y %H:%M:%S')}")
 
+# ----------------------------------------------------------------------------------------------- #
+# Baixar o HTML de uma página
+# ----------------------------------------------------------------------------------------------- #
+
+def fetch_html(url: str, crawler: Optional[Crawler] = None) -> str:
+    """Baixa uma página pelo crawler (sessão compartilhada) ou, sem ele, com uma requisição avulsa."""
+    if crawler is not None:
+        return crawler.fetch(url).text
+
+    response = requests.get(url, timeout = CRAWL_TIMEOUT)
+    response.encoding = response.apparent_encoding
+    return response.text
+
 # ----------------------------------------------------------------------------------------------- #
 # Obter nomes e links das categorias de livros
 # ----------------------------------------------------------------------------------------------- #
 
-def get_dict_categories(url_books: str) -> Dict[str, str]:
+def get_dict_categories(url_books: str, crawler: Optional[Crawler] = None) -> Dict[str, str]:
     """
     Extrai categorias de livros e seus respectivos links a partir de uma URL.
 
@@ -46,6 +90,8 @@ def get_dict_categories(url_books: str) -> Dict[str, str]:
 
     Args:
         url_books (str): A URL da página principal que contém a lista de categorias.
+        crawler (Optional[Crawler]): Cliente HTTP com sessão compartilhada. Se não
+            informado, faz uma requisição avulsa.
 
     Returns:
         Dict[str, str]: Um dicionário onde as chaves são os nomes das categorias 
@@ -58,9 +104,7 @@ def get_dict_categories(url_books: str) -> Dict[str, str]:
     """
 
     # fazer a requisição para obter o conteúdo da página e transformar o conteúdo HTML em um objeto BeautifulSoup para navegação
-    response = requests.get(url_books)
-    response.encoding = response.apparent_encoding
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(fetch_html(url_books, crawler), 'html.parser')
 
     # inicializar dicionário {categoria:link}
     categories_links = {}
@@ -84,7 +128,8 @@ def get_dict_categories(url_books: str) -> Dict[str, str]:
 # Obter informações dos livros
 # ----------------------------------------------------------------------------------------------- #
 
-def get_books_attrs(url_cat: str, cat: str) -> Tuple[pd.DataFrame, BeautifulSoup]:
+def get_books_attrs(url_cat: str, cat: str, crawler: Optional[Crawler] = None,
+                    parser: Optional[str] = None) -> Tuple[pd.DataFrame, CategoryPage]:
     """
     Extrai os atributos de todos os livros presentes em uma página de categoria específica.
 
@@ -97,15 +142,19 @@ def get_books_attrs(url_cat: str, cat: str) -> Tuple[pd.DataFrame, BeautifulSoup
     Args:
         url_cat (str): URL completa da página da categoria a ser raspada.
         cat (str): Nome da categoria correspondente à URL (usado para rotular os dados).
+        crawler (Optional[Crawler]): Cliente HTTP com sessão compartilhada. Se não
+            informado, faz uma requisição avulsa.
+        parser (Optional[str]): Backend de parsing (ver parsers.get_parser). Se não
+            informado, usa o lxml (ver parsers.PREFERRED_PARSERS).
 
     Returns:
-        Tuple[pd.DataFrame, BeautifulSoup]:
+        Tuple[pd.DataFrame, CategoryPage]:
             Uma tupla contendo:
             - pd.DataFrame: DataFrame onde cada linha representa um livro e
               cada coluna representa um atributo extraído (título, preço,
               avaliação, disponibilidade, categoria e imagem).
-            - BeautifulSoup: Objeto BeautifulSoup correspondente ao HTML da
-              página, útil para verificações adicionais como paginação.
+            - CategoryPage: Conteúdo extraído da página, incluindo a paginação
+              (total de páginas e link da próxima).
 
     Raises:
         requests.exceptions.RequestException: Se houver erro na requisição HTTP.
@@ -113,117 +162,433 @@ def get_books_attrs(url_cat: str, cat: str) -> Tuple[pd.DataFrame, BeautifulSoup
     """
     
     # fazer a requisição para a página da categoria
-    response = requests.get(url_cat)
-    response.encoding = response.apparent_encoding
-    soup = BeautifulSoup(response.text, 'html.parser')
+    pagina = get_parser(parser)(fetch_html(url_cat, crawler))
+
+    return pd.DataFrame([normalize_book(livro, cat) for livro in pagina.books]), pagina
+
+# ----------------------------------------------------------------------------------------------- #
+# Normalizar os dados de cada livro
+# ----------------------------------------------------------------------------------------------- #
+
+def normalize_book(livro: Dict[str, str], cat: str) -> Dict[str, object]:
+    """
+    Converte os campos brutos de um livro para os tipos e o formato da base de dados.
 
-    # localizar todos os elementos <article> (livros da página)
-    livros_soup = soup.find_all('article')
+    Args:
+        livro (Dict[str, str]): Livro extraído por um dos parsers (ver parsers.py).
+        cat (str): Nome da categoria do livro.
 
-    # inicializar lista de livros
-    dados = []
+    Returns:
+        Dict[str, object]: Livro com as colunas da base (exceto o id), na ordem de BOOK_COLUMNS.
 
-    # para cada livro, extrair e transformar os dados solicitados
-    for livro in livros_soup:
-        title = livro.find('h3').find('a')['title']
-        price = float(livro.find_all('p')[1].get_text().replace('£', ''))
-        rating = int(w2n.word_to_num(livro.find('p')['class'][1].lower()))
-        availability = livro.find_all('p')[2].get_text(strip=True)
-        image = urljoin(url_books, livro.find('img')['src'])
+    Raises:
+        ValueError: Se a conversão do preço ou da avaliação por extenso falhar.
+    """
+    rating = RATINGS.get(livro['rating'].lower())
+    if rating is None:
+        raise ValueError(f"Avaliação desconhecida: {livro['rating']!r}")
+
+    return {
+        'title': livro['title'],
+        'price': float(livro['price'].replace('£', '')),
+        'rating': rating,
+        'availability': livro['availability'],
+        'category': cat,
+        'image': urljoin(url_books, livro['image'])
+    }
 
-        # consolidar dados em um dicionário
-        dados.append({
-            'title': title,
-            'price': price,
-            'rating': rating,
-            'availability': availability,
-            'category': cat,
-            'image': image
-        })
+# ----------------------------------------------------------------------------------------------- #
+# Descobrir as demais páginas de uma categoria
+# ----------------------------------------------------------------------------------------------- #
 
-    return pd.DataFrame(dados), soup
+def get_next_pages(url_page: str, page: int, pagina: CategoryPage) -> Dict[int, str]:
+    """
+    Retorna as páginas da categoria que devem ser baixadas a partir da página atual.
+
+    Na primeira página, lê o total de páginas ("Page 1 of N") e retorna todas as
+    demais de uma vez, para que sejam baixadas em paralelo. Sem esse texto, segue
+    o botão "next" (uma página por vez).
+
+    Args:
+        url_page (str): URL da página atual.
+        page (int): Número da página atual (começando em 1).
+        pagina (CategoryPage): Conteúdo extraído da página atual.
+
+    Returns:
+        Dict[int, str]: Dicionário número da página -> URL.
+    """
+    if pagina.page_count is not None:
+        if page != 1:
+            return {}
+        return {n: urljoin(url_page, f'page-{n}.html') for n in range(2, pagina.page_count + 1)}
+
+    return {page + 1: urljoin(url_page, pagina.next_href)} if pagina.next_href else {}
+
+# ----------------------------------------------------------------------------------------------- #
+# Baixar as páginas das categorias em ordem
+# ----------------------------------------------------------------------------------------------- #
+
+def iter_category_pages(crawler: Crawler, base_url: str, categories: List[Tuple[str, str]],
+                        state: Optional[CrawlState] = None, parser: Optional[str] = None) -> Iterator[List[Dict[str, object]]]:
+    """
+    Baixa em paralelo todas as páginas das categorias e entrega os livros de cada
+    página na ordem (categoria, página), independentemente da ordem de chegada.
+
+    As páginas que chegam antes da vez ficam num buffer de reordenação, liberado
+    assim que a página esperada chega. Como o crawler prioriza as páginas seguintes
+    da categoria em andamento, o buffer fica limitado a poucas páginas.
+
+    Args:
+        crawler (Crawler): Cliente HTTP usado no download.
+        base_url (str): URL base do catálogo (os links das categorias são relativos a ela).
+        categories (List[Tuple[str, str]]): Pares (categoria, link relativo), na ordem de saída.
+        state (Optional[CrawlState]): Estado do crawling anterior (modo incremental). Se
+            informado, as requisições são condicionais e páginas sem alteração não são
+            parseadas de novo.
+        parser (Optional[str]): Backend de parsing (ver parsers.get_parser).
+
+    Yields:
+        List[Dict[str, object]]: Livros normalizados de uma página.
+    """
+    parse_page = get_parser(parser)
+
+    # a chave de cada página é (índice da categoria, número da página)
+    start = [((i, 1), base_url + link) for i, (cat, link) in enumerate(categories)]
+
+    # última página conhecida de cada categoria (atualizada ao descobrir a paginação)
+    last_page = [1] * len(categories)
+    buffer = {}
+    expected = (0, 1)
+
+    def parse(key, url, response):
+        # página sem alteração desde o crawling anterior (304 ou mesmo conteúdo)
+        if state is not None:
+            unchanged = state.unchanged(url, response)
+            if unchanged is not None:
+                return unchanged
+
+        # parsing, normalização e paginação rodam nas threads do crawler
+        pagina = parse_page(response.text)
+        next_pages = get_next_pages(url, key[1], pagina)
+        livros = [normalize_book(livro, categories[key[0]][0]) for livro in pagina.books]
+
+        if state is not None:
+            state.update(url, response, livros, next_pages)
+
+        return livros, next_pages
+
+    def expand(key, url, result):
+        i, _ = key
+        next_pages = result[1]
+        if next_pages:
+            last_page[i] = max(last_page[i], max(next_pages))
+        return [((i, n), next_url) for n, next_url in next_pages.items()]
+
+    headers = state.headers if state is not None else None
+
+    for key, url, (livros, _) in crawler.crawl(start, parse, expand, headers = headers):
+        buffer[key] = livros
+
+        # liberar, em ordem, as páginas que já chegaram
+        while expected in buffer:
+            yield buffer.pop(expected)
+
+            i, page = expected
+            expected = (i, page + 1) if page < last_page[i] else (i + 1, 1)
+
+# ----------------------------------------------------------------------------------------------- #
+# Remover livros duplicados
+# ----------------------------------------------------------------------------------------------- #
+
+def dedupe_books(livros: Iterable[Dict[str, object]], key: str = 'title') -> Iterator[Dict[str, object]]:
+    """Mantém apenas a primeira ocorrência de cada valor de `key` (como drop_duplicates)."""
+    seen = set()
+
+    for livro in livros:
+        if livro[key] not in seen:
+            seen.add(livro[key])
+            yield livro
+
+# ----------------------------------------------------------------------------------------------- #
+# Salvar a base de dados em CSV
+# ----------------------------------------------------------------------------------------------- #
+
+def write_books_csv(livros: Iterable[Dict[str, object]], path: Union[str, Path], start_id: int = 1) -> int:
+    """
+    Grava os livros no CSV à medida que chegam, numerando os IDs a partir de `start_id`.
+
+    A escrita é feita num arquivo temporário na mesma pasta, que só substitui o
+    arquivo final (com os.replace, atômico) quando todos os livros foram gravados.
+    Se a ingestão falhar no meio, a base anterior continua intacta.
+
+    Args:
+        livros (Iterable[Dict[str, object]]): Livros normalizados, já sem duplicatas.
+            Livros que já têm a chave 'id' mantêm o próprio ID.
+        path (Union[str, Path]): Caminho do CSV de saída.
+        start_id (int): Primeiro ID atribuído aos livros sem 'id'.
+
+    Returns:
+        int: Quantidade de livros gravados.
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir = path.parent, prefix = f'.{path.name}.', suffix = '.tmp')
+    n = 0
+
+    try:
+        with os.fdopen(fd, 'w', encoding = 'utf-8', newline = '') as f:
+            writer = csv.writer(f, lineterminator = '\n')
+            writer.writerow(['id', *BOOK_COLUMNS])
+
+            next_id = start_id
+            for n, livro in enumerate(livros, start = 1):
+                book_id = livro.get('id')
+                if book_id is None:
+                    book_id, next_id = next_id, next_id + 1
+
+                writer.writerow([book_id, *(livro[col] for col in BOOK_COLUMNS)])
+
+        os.chmod(tmp_path, 0o644)  # mkstemp cria o arquivo com 0o600
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    return n
+
+def write_delta_json(delta: Dict[str, List[Dict[str, object]]], path: Union[str, Path]) -> None:
+    """Grava o delta (ver diff_books) em JSON, com a mesma escrita atômica de write_books_csv."""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir = path.parent, prefix = f'.{path.name}.', suffix = '.tmp')
+
+    try:
+        with os.fdopen(fd, 'w', encoding = 'utf-8') as f:
+            json.dump(delta, f, ensure_ascii = False, indent = 2)
+
+        os.chmod(tmp_path, 0o644)  # mkstemp cria o arquivo com 0o600
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def columnar_path(csv_path: Union[str, Path]) -> Path:
+    """Caminho do arquivo colunar gerado ao lado do CSV (ex.: base_livros.csv -> base_livros.columns)."""
+    return Path(csv_path).with_suffix('.columns')
+
+def read_books_csv(path: Union[str, Path]) -> List[Dict[str, object]]:
+    """Lê a base de livros com os mesmos tipos produzidos por normalize_book (e o id)."""
+    with open(path, encoding = 'utf-8', newline = '') as f:
+        return [
+            {**row, 'id': int(row['id']), 'price': float(row['price']), 'rating': int(row['rating'])}
+            for row in csv.DictReader(f)
+        ]
+
+# ----------------------------------------------------------------------------------------------- #
+# Comparar a base atual com um novo crawling (delta)
+# ----------------------------------------------------------------------------------------------- #
+
+def diff_books(base: List[Dict[str, object]], livros: Iterable[Dict[str, object]], key: str = 'title'
+               ) -> Dict[str, List[Dict[str, object]]]:
+    """
+    Compara a base atual com os livros de um novo crawling, identificando cada livro pelo título.
+
+    Livros que continuam na base mantêm o ID; livros novos recebem IDs a partir do
+    maior ID da base + 1, na ordem do crawling.
+
+    Args:
+        base (List[Dict[str, object]]): Base atual (com ids), como retornada por read_books_csv.
+        livros (Iterable[Dict[str, object]]): Livros do novo crawling, já sem duplicatas.
+        key (str): Campo que identifica o livro.
+
+    Returns:
+        Dict[str, List[Dict[str, object]]]: Delta com as chaves "added" (livros novos),
+            "changed" (livros com algum atributo diferente, já com os valores novos) e
+            "removed" (livros que deixaram de existir), todos com o id.
+    """
+    base_by_key = {livro[key]: livro for livro in base}
+    next_id = max((livro['id'] for livro in base), default = 0) + 1
+
+    delta = {'added': [], 'changed': [], 'removed': []}
+    seen = set()
+
+    for livro in livros:
+        seen.add(livro[key])
+        atual = base_by_key.get(livro[key])
+
+        if atual is None:
+            delta['added'].append({'id': next_id, **livro})
+            next_id += 1
+        elif any(atual[col] != livro[col] for col in BOOK_COLUMNS):
+            delta['changed'].append({'id': atual['id'], **livro})
+
+    delta['removed'] = [livro for livro in base if livro[key] not in seen]
+    return delta
+
+def merge_books(base: List[Dict[str, object]], delta: Dict[str, List[Dict[str, object]]]
+                ) -> Iterator[Dict[str, object]]:
+    """Aplica um delta (ver diff_books) à base: atualiza e remove livros pelo id e adiciona os novos ao final."""
+    changed = {livro['id']: livro for livro in delta['changed']}
+    removed = {livro['id'] for livro in delta['removed']}
+
+    for livro in base:
+        if livro['id'] not in removed:
+            yield changed.get(livro['id'], livro)
+
+    yield from delta['added']
 
 # ----------------------------------------------------------------------------------------------- #
 # Adicionar cada livro na tabela do banco de dados
 # ----------------------------------------------------------------------------------------------- #
 
-def populate_books(url_books: str) -> pd.DataFrame:
+def populate_books(url_books: str, output_path: Union[str, Path] = OUTPUT_PATH, concurrency: int = CRAWL_CONCURRENCY,
+                   rate_limit: Optional[float] = CRAWL_RATE_LIMIT, retries: int = CRAWL_RETRIES,
+                   timeout: float = CRAWL_TIMEOUT, parser: Optional[str] = None, cache: Optional[HttpCache] = None) -> int:
     """
     Extrai livros de todas as categorias e consolida os dados em uma base única.
 
-    A função percorre todas as categorias disponíveis no catálogo de livros,
-    acessando cada página de categoria e tratando a paginação quando existente.
-    Para cada página, os dados dos livros são extraídos e acumulados em um
-    DataFrame único, que ao final contém todos os livros encontrados no site.
+    A ingestão é um pipeline em streaming: download (em paralelo, pelo Crawler) →
+    parsing → normalização → remoção de duplicatas (pelo título, mantendo a
+    primeira ocorrência) → gravação incremental no CSV. Os livros são gravados na
+    ordem das categorias e das páginas, de modo que os IDs gerados não dependem da
+    ordem de chegada das respostas, e a memória usada não cresce com o tamanho do
+    catálogo (apenas o conjunto de títulos já vistos fica em memória).
 
     Args:
         url_books (str):
             URL base do catálogo de livros, utilizada para montar os links
             completos das categorias e páginas subsequentes.
+        output_path (Union[str, Path]): Caminho do CSV de saída (substituído de forma atômica).
+        concurrency (int): Quantidade de requisições simultâneas.
+        rate_limit (Optional[float]): Requisições por segundo por host (None = sem limite).
+        retries (int): Quantidade de novas tentativas por requisição.
+        timeout (float): Tempo limite (em segundos) de cada requisição.
+        parser (Optional[str]): Backend de parsing (ver parsers.get_parser). Se não
+            informado, usa o lxml (ver parsers.PREFERRED_PARSERS).
+        cache (Optional[HttpCache]): Cache de respostas em disco. No modo 'replay', a
+            ingestão roda inteiramente a partir do cache, sem acesso à rede.
 
     Returns:
-        pd.DataFrame:
-            DataFrame contendo todos os livros extraídos de todas as categorias,
-            com seus respectivos atributos (título, preço, avaliação,
-            disponibilidade, categoria e imagem).
+        int: Quantidade de livros gravados na base (sem duplicatas).
 
     Note:
         Esta função depende das seguintes funções e objetos auxiliares:
+        - Crawler: para baixar as páginas em paralelo.
         - get_dict_categories: para obter o mapeamento entre categorias e seus links.
-        - get_books_attrs: para extrair os atributos dos livros de cada página.
+        - iter_category_pages: para baixar, extrair (ver parsers.py) e ordenar os livros de cada página.
+        - dedupe_books: para remover livros duplicados.
+        - write_books_csv: para gravar a base de forma incremental e atômica.
         - tqdm: para exibir a barra de progresso durante a iteração.
     """
     gap = 70
     horario_atual('Início da execução', gap = gap)
-    base_livros = pd.DataFrame()
 
-    # gerar o dicionário mapeando nomes de categorias aos seus links
-    horario_atual("Obtendo o dicionário das categorias e respectivos links", gap = gap)
+    with Crawler(concurrency = concurrency, rate_limit = rate_limit, retries = retries, timeout = timeout,
+                 cache = cache) as crawler:
+
+        # gerar o dicionário mapeando nomes de categorias aos seus links
+        horario_atual("Obtendo o dicionário das categorias e respectivos links", gap = gap)
+        print()
+        categories = list(get_dict_categories(url_books, crawler).items())
+
+        # baixar as páginas e gravar os livros à medida que chegam
+        horario_atual("Baixando as páginas das categorias e gravando os livros", gap = gap)
+        livros = tqdm(
+            (livro for pagina in iter_category_pages(crawler, url_books, categories, parser = parser) for livro in pagina),
+            unit = ' livros'
+        )
+        n_livros = write_books_csv(dedupe_books(livros), output_path)
+
+    horario_atual('Término do loop', gap = gap)
     print()
-    categories_links = get_dict_categories(url_books)
+    print(f"Tamanho da base de dados: {livros.n}")
+    print(f"Livros únicos salvos: {n_livros}")
+    horario_atual('Base de dados salva', gap = gap)
+
+    # gerar também o formato colunar (carregado pela API sem parsing de texto)
+    write_columnar_from_csv(str(output_path), str(columnar_path(output_path)))
+    horario_atual('Base de dados colunar salva', gap = gap)
+    print()
+
+    return n_livros
+
+# ----------------------------------------------------------------------------------------------- #
+# Atualizar a base de forma incremental
+# ----------------------------------------------------------------------------------------------- #
+
+def refresh_books(url_books: str, output_path: Union[str, Path] = OUTPUT_PATH, state_path: Union[str, Path] = STATE_PATH,
+                  delta_path: Union[str, Path] = DELTA_PATH, concurrency: int = CRAWL_CONCURRENCY,
+                  rate_limit: Optional[float] = CRAWL_RATE_LIMIT, retries: int = CRAWL_RETRIES,
+                  timeout: float = CRAWL_TIMEOUT, parser: Optional[str] = None,
+                  cache: Optional[HttpCache] = None) -> Dict[str, List[Dict[str, object]]]:
+    """
+    Atualiza a base de livros de forma incremental, a partir do crawling anterior.
 
-    # iterar por categoria
-    horario_atual("Iterando as categorias para obter os dados dos livros", gap = gap)
-    for cat, link in tqdm(categories_links.items()):
+    Cada página é requisitada com If-None-Match / If-Modified-Since (ETag e
+    Last-Modified guardados no estado do crawling anterior). Se o servidor responder
+    304, ou se o conteúdo tiver o mesmo hash da última vez, os livros guardados no
+    estado são reaproveitados sem parsing. O resultado é comparado com a base atual
+    e apenas o delta (livros adicionados, alterados e removidos) é aplicado: os
+    livros existentes mantêm o ID e os novos recebem IDs a partir do maior ID + 1.
 
-        # link completo da categoria
-        url_cat = url_books + link
+    Na primeira execução (sem estado), todas as páginas são parseadas. Sem base
+    existente, todos os livros entram como adicionados.
 
-        # Loop para tratar a paginação dentro de cada categoria
-        while True:
-            # Extrai os dados dos livros da página atual e o HTML parseado
-            tmp, soup_cat = get_books_attrs(url_cat, cat)
+    Args:
+        url_books (str): URL base do catálogo de livros.
+        output_path (Union[str, Path]): Caminho do CSV da base (atualizado de forma atômica).
+        state_path (Union[str, Path]): Caminho do JSON com o estado do crawling.
+        delta_path (Union[str, Path]): Caminho do JSON onde o delta é gravado.
+        concurrency (int): Quantidade de requisições simultâneas.
+        rate_limit (Optional[float]): Requisições por segundo por host (None = sem limite).
+        retries (int): Quantidade de novas tentativas por requisição.
+        timeout (float): Tempo limite (em segundos) de cada requisição.
+        parser (Optional[str]): Backend de parsing (ver parsers.get_parser). Se não
+            informado, usa o lxml (ver parsers.PREFERRED_PARSERS).
+        cache (Optional[HttpCache]): Cache de respostas em disco. No modo 'replay', a
+            ingestão roda inteiramente a partir do cache, sem acesso à rede.
+
+    Returns:
+        Dict[str, List[Dict[str, object]]]: Delta aplicado (ver diff_books).
+    """
+    gap = 70
+    horario_atual('Início da execução', gap = gap)
 
-            # Concatena os dados extraídos ao DataFrame principal
-            base_livros = pd.concat(
-                [base_livros, tmp],
-                ignore_index=True
-            )
+    state = CrawlState(str(state_path))
+    base = read_books_csv(output_path) if os.path.exists(output_path) else []
 
-            # Verifica a existência do botão de próxima página
-            next_button = soup_cat.find('li', class_='next')
+    with Crawler(concurrency = concurrency, rate_limit = rate_limit, retries = retries, timeout = timeout,
+                 cache = cache) as crawler:
 
-            if next_button:
-                # Caso exista, extrai o link da próxima página
-                next_page = next_button.find('a')['href']
+        horario_atual("Obtendo o dicionário das categorias e respectivos links", gap = gap)
+        print()
+        categories = list(get_dict_categories(url_books, crawler).items())
 
-                # Atualiza a URL da categoria para apontar para a próxima página
-                url_cat = urljoin(url_cat, next_page)
-            else:
-                # Encerra o loop quando não há mais páginas na categoria
-                break
+        # baixar as páginas (condicionalmente) e comparar com a base atual
+        horario_atual("Baixando as páginas alteradas e comparando com a base", gap = gap)
+        livros = tqdm(
+            (livro for pagina in iter_category_pages(crawler, url_books, categories, state, parser) for livro in pagina),
+            unit = ' livros'
+        )
+        delta = diff_books(base, dedupe_books(livros))
 
-    horario_atual('Término do loop', gap = gap)
     print()
-    print(f"Tamanho da base de dados: {base_livros.shape[0]}")
+    print(f"Páginas sem alteração (304): {state.stats['not_modified']}")
+    print(f"Páginas sem alteração (mesmo conteúdo): {state.stats['same_hash']}")
+    print(f"Páginas parseadas: {state.stats['parsed']}")
+    print(f"Livros adicionados: {len(delta['added'])} | alterados: {len(delta['changed'])} | removidos: {len(delta['removed'])}")
 
-    # remover livros duplicados
-    base_livros = base_livros.drop_duplicates(subset = 'title').reset_index(drop = True)
+    # gravar a base apenas se algo mudou (o arquivo e a versão do catálogo ficam iguais)
+    if any(delta.values()):
+        write_books_csv(merge_books(base, delta), output_path)
+        horario_atual('Base de dados atualizada', gap = gap)
 
-    # criar coluna de id
-    base_livros = base_livros.reset_index(names = 'id').assign(id = lambda df: df['id'] + 1)
+    if any(delta.values()) or not columnar_path(output_path).exists():
+        write_columnar_from_csv(str(output_path), str(columnar_path(output_path)))
+        horario_atual('Base de dados colunar salva', gap = gap)
 
-    # salvar base de dados
-    base_livros.to_csv('../../data/base_livros.csv', index = False)
-    horario_atual('Base de dados salva', gap = gap)
+    write_delta_json(delta, delta_path)
+
+    state.save()
+    horario_atual('Estado do crawling salvo', gap = gap)
     print()
+
+    return delta
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from http_cache import CacheMiss, HttpCache
+
+# ----------------------------------------------------------------------------------------------- #
+# Limite de requisições por host
+# ----------------------------------------------------------------------------------------------- #
+
+class HostRateLimiter:
+    """
+    Espaça as requisições feitas a um mesmo host (no máximo `rate` requisições por segundo).
+
+    Args:
+        rate (Optional[float]): Requisições por segundo por host. None desativa o limite.
+    """
+
+    def __init__(self, rate: Optional[float] = None):
+        self.interval = 1 / rate if rate else 0
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        if not self.interval:
+            return
+
+        host = urlsplit(url).netloc
+
+        # reservar o próximo horário livre do host e dormir (fora do lock) até ele
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+# ----------------------------------------------------------------------------------------------- #
+# Motor de crawling concorrente
+# ----------------------------------------------------------------------------------------------- #
+
+class Crawler:
+    """
+    Cliente HTTP concorrente para o scraping, com sessão keep-alive compartilhada.
+
+    As requisições usam um pool de conexões reaproveitadas (sem novo handshake
+    TCP/TLS por página), são distribuídas entre `concurrency` threads, respeitam um
+    limite de requisições por segundo por host e são repetidas com backoff
+    exponencial em caso de falha de conexão ou status 429/5xx.
+
+    Args:
+        concurrency (int): Quantidade de requisições simultâneas.
+        rate_limit (Optional[float]): Requisições por segundo por host (None = sem limite).
+        retries (int): Quantidade de novas tentativas por requisição.
+        backoff (float): Fator do backoff exponencial entre tentativas (em segundos).
+        timeout (float): Tempo limite (em segundos) de conexão e de leitura.
+        encoding (Optional[str]): Codificação usada quando o servidor não informa o charset.
+        cache (Optional[HttpCache]): Cache de respostas em disco (gravação ou reprodução offline).
+    """
+
+    def __init__(self, concurrency: int = 16, rate_limit: Optional[float] = None, retries: int = 3,
+                 backoff: float = 0.5, timeout: float = 10, encoding: Optional[str] = 'utf-8',
+                 cache: Optional[HttpCache] = None):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.encoding = encoding
+        self.cache = cache
+        self.rate_limiter = HostRateLimiter(rate_limit)
+
+        retry = Retry(
+            total = retries,
+            backoff_factor = backoff,
+            status_forcelist = (429, 500, 502, 503, 504),
+            allowed_methods = ('GET', 'HEAD'),
+            respect_retry_after_header = True
+        )
+        adapter = HTTPAdapter(pool_connections = concurrency, pool_maxsize = concurrency, max_retries = retry)
+
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def __enter__(self) -> 'Crawler':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def fetch(self, url: str, headers: Optional[dict] = None) -> requests.Response:
+        """
+        Baixa uma URL pela sessão compartilhada (ou a lê do cache em disco, se houver).
+
+        Args:
+            url (str): URL a ser baixada.
+            headers (Optional[dict]): Cabeçalhos adicionais da requisição.
+
+        Returns:
+            requests.Response: Resposta com `encoding` definido.
+
+        Raises:
+            requests.exceptions.RequestException: Se a requisição falhar após as novas tentativas.
+            CacheMiss: Se a URL não estiver no cache no modo replay.
+        """
+        response = self.cache.get(url) if self.cache is not None else None
+
+        if response is None:
+            if self.cache is not None and self.cache.offline:
+                raise CacheMiss(f"URL fora do cache (modo replay): {url}")
+
+            self.rate_limiter.wait(url)
+            response = self.session.get(url, headers = headers, timeout = self.timeout)
+            response.raise_for_status()
+
+            if self.cache is not None:
+                self.cache.put(url, response)
+
+        if self.encoding and 'charset' not in response.headers.get('Content-Type', ''):
+            response.encoding = self.encoding
+
+        return response
+
+    def crawl(self, start: Iterable[Tuple[Hashable, str]],
+              parse: Callable[[Hashable, str, requests.Response], Any],
+              expand: Callable[[Hashable, str, Any], Iterable[Tuple[Hashable, str]]],
+              max_pending: Optional[int] = None,
+              headers: Optional[Callable[[str], Optional[dict]]] = None) -> Iterator[Tuple[Hashable, str, Any]]:
+        """
+        Baixa e processa um conjunto de URLs em paralelo, agendando novas URLs à medida que as páginas chegam.
+
+        O download e o `parse` de cada página rodam nas threads do pool; `expand`
+        roda na thread que consome o iterador. No máximo `max_pending` páginas ficam
+        em andamento (ou prontas e ainda não consumidas) ao mesmo tempo; as demais
+        URLs aguardam numa fila (as geradas por `expand` à frente das iniciais), de
+        modo que a memória usada não cresce com o tamanho do site.
+
+        Args:
+            start (Iterable[Tuple[Hashable, str]]): Pares (chave, url) iniciais.
+            parse (Callable): Recebe (chave, url, resposta) e retorna o conteúdo extraído da página.
+            expand (Callable): Recebe (chave, url, conteúdo extraído) e retorna novos
+                pares (chave, url) a baixar (ex.: próximas páginas).
+            max_pending (Optional[int]): Máximo de páginas em andamento. Padrão: 4 × `concurrency`.
+            headers (Optional[Callable]): Recebe a url e retorna cabeçalhos adicionais da
+                requisição (ex.: If-None-Match para requisições condicionais).
+
+        Yields:
+            Tuple[Hashable, str, Any]: (chave, url, conteúdo extraído), na ordem em que
+                as páginas terminam de ser processadas.
+
+        Raises:
+            requests.exceptions.RequestException: Se alguma página falhar após as novas tentativas.
+        """
+        def task(key, url):
+            return parse(key, url, self.fetch(url, headers(url) if headers else None))
+
+        max_pending = max_pending or 4 * self.concurrency
+        queue = deque(start)
+
+        with ThreadPoolExecutor(max_workers = self.concurrency, thread_name_prefix = 'crawler') as executor:
+            pending = {}
+
+            def submit():
+                while queue and len(pending) < max_pending:
+                    key, url = queue.popleft()
+                    pending[executor.submit(task, key, url)] = (key, url)
+
+            try:
+                submit()
+
+                while pending:
+                    done, _ = wait(pending, return_when = FIRST_COMPLETED)
+
+                    for future in done:
+                        key, url = pending.pop(future)
+                        result = future.result()
+
+                        # novas URLs passam na frente da fila (ex.: demais páginas da mesma
+                        # categoria), para que o crawling avance aproximadamente na ordem de `start`
+                        queue.extendleft(reversed(list(expand(key, url, result))))
+                        submit()
+
+                        yield key, url, result
+            finally:
+                # interrupção (erro ou consumidor parou de iterar): não baixar o que ainda está na fila
+                for future in pending:
+                    future.cancel()
+
+# ----------------------------------------------------------------------------------------------- #
+# Estado do crawling (modo incremental)
+# ----------------------------------------------------------------------------------------------- #
+
+class CrawlState:
+    """
+    Estado de um crawling anterior, usado para requisições condicionais e detecção de mudanças.
+
+    Para cada URL, guarda o ETag e o Last-Modified devolvidos pelo servidor, o hash
+    SHA-1 do conteúdo e o resultado já extraído da página (livros e próximas
+    páginas). No crawling seguinte, as requisições levam If-None-Match /
+    If-Modified-Since e, se o servidor responder 304 ou o conteúdo tiver o mesmo
+    hash, o resultado guardado é reaproveitado sem parsing.
+
+    O estado novo contém apenas as URLs visitadas no crawling atual (páginas que
+    deixaram de existir saem do arquivo) e só é gravado em disco com `save`.
+
+    Args:
+        path (str): Caminho do arquivo JSON do estado.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.stats = {'not_modified': 0, 'same_hash': 0, 'parsed': 0}
+
+        self._previous: Dict[str, dict] = {}
+        self._current: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            with open(path, encoding = 'utf-8') as f:
+                self._previous = json.load(f)
+
+    def headers(self, url: str) -> Optional[dict]:
+        """Cabeçalhos condicionais para a URL, a partir do crawling anterior."""
+        entry = self._previous.get(url)
+        if entry is None:
+            return None
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers or None
+
+    def unchanged(self, url: str, response: requests.Response) -> Optional[Tuple[List[dict], Dict[int, str]]]:
+        """
+        Retorna o resultado guardado da URL se a página não mudou (304 ou mesmo hash).
+
+        Returns:
+            Optional[Tuple[List[dict], Dict[int, str]]]: (livros, próximas páginas) do
+                crawling anterior, ou None se a página precisa ser parseada.
+        """
+        entry = self._previous.get(url)
+        if entry is None:
+            return None
+
+        if response.status_code == 304:
+            stat = 'not_modified'
+        elif hashlib.sha1(response.content).hexdigest() == entry['sha1']:
+            stat = 'same_hash'
+        else:
+            return None
+
+        with self._lock:
+            self.stats[stat] += 1
+            # mantém os validadores mais recentes (o servidor pode ter renovado o ETag)
+            self._current[url] = {**entry, **self._validators(response)}
+
+        next_pages = {int(page): next_url for page, next_url in entry['next_pages'].items()}
+        return entry['books'], next_pages
+
+    def update(self, url: str, response: requests.Response, books: List[dict], next_pages: Dict[int, str]) -> None:
+        """Registra o resultado de uma página parseada no crawling atual."""
+        entry = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'sha1': hashlib.sha1(response.content).hexdigest(),
+            'books': books,
+            'next_pages': {str(page): next_url for page, next_url in next_pages.items()}
+        }
+
+        with self._lock:
+            self.stats['parsed'] += 1
+            self._current[url] = entry
+
+    @staticmethod
+    def _validators(response: requests.Response) -> dict:
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['last_modified'] = response.headers['Last-Modified']
+        return validators
+
+    def save(self) -> None:
+        """Grava o estado do crawling atual (escrita atômica)."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir = directory, prefix = '.crawl_state.', suffix = '.tmp')
+
+        try:
+            with os.fdopen(fd, 'w', encoding = 'utf-8') as f:
+                json.dump(self._current, f, ensure_ascii = False)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# ----------------------------------------------------------------------------------------------- #
+# Modos do cache
+# ----------------------------------------------------------------------------------------------- #
+
+CACHE_MODES = ('record', 'replay')
+
+class CacheMiss(requests.exceptions.RequestException):
+    """URL ausente do cache no modo replay (sem acesso à rede)."""
+
+# ----------------------------------------------------------------------------------------------- #
+# Cache de respostas HTTP em disco
+# ----------------------------------------------------------------------------------------------- #
+
+class HttpCache:
+    """
+    Cache em disco de respostas HTTP (GET, status 200), endereçado por conteúdo.
+
+    Cada URL tem uma entrada em `index/` (status, cabeçalhos, horário e hash do
+    corpo) e os corpos ficam em `blobs/`, com o SHA-256 do conteúdo como nome, de
+    modo que páginas idênticas ocupam espaço uma única vez.
+
+    Modos:
+        record: consulta o cache antes da rede; respostas baixadas são gravadas.
+            Entradas mais antigas que `ttl` são ignoradas (e regravadas).
+        replay: usa apenas o cache (modo offline, `ttl` ignorado); URLs ausentes
+            geram CacheMiss.
+
+    Quando os corpos ultrapassam `max_bytes`, as entradas usadas há mais tempo são
+    removidas. A ordem de uso, as referências e o tamanho de cada corpo ficam num
+    índice em memória (montado uma vez, na criação, a partir do mtime das entradas),
+    de modo que gravar uma entrada não exige reler o índice em disco. O uso também
+    é registrado no mtime da entrada, para que a ordem valha entre execuções.
+
+    Args:
+        directory (Union[str, Path]): Pasta do cache.
+        mode (str): 'record' ou 'replay'.
+        ttl (Optional[float]): Validade (em segundos) das entradas no modo record. None = sem expiração.
+        max_bytes (Optional[int]): Tamanho máximo dos corpos guardados. None = sem limite.
+
+    Raises:
+        ValueError: Se o modo for inválido.
+    """
+
+    def __init__(self, directory: Union[str, Path], mode: str = 'record', ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Modo de cache inválido: '{mode}'. Opções: {', '.join(CACHE_MODES)}")
+
+        self.directory = Path(directory)
+        self.mode = mode
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0, 'evicted': 0}
+
+        self._index_dir = self.directory / 'index'
+        self._blobs_dir = self.directory / 'blobs'
+        self._index_dir.mkdir(parents = True, exist_ok = True)
+        self._blobs_dir.mkdir(parents = True, exist_ok = True)
+
+        self._lock = threading.Lock()
+
+        # índice em memória: entrada -> sha256 do corpo (do uso mais antigo ao mais recente),
+        # referências e tamanho de cada corpo
+        self._entries: 'OrderedDict[str, str]' = OrderedDict()
+        self._refs: Dict[str, int] = {}
+        self._blob_sizes: Dict[str, int] = {}
+        self._size = 0
+        self._load_index()
+
+    def _load_index(self) -> None:
+        for path in self._blobs_dir.glob('*/*'):
+            if not path.name.endswith('.tmp'):
+                self._blob_sizes[path.name] = path.stat().st_size
+        self._size = sum(self._blob_sizes.values())
+
+        entries = []
+        for path in self._index_dir.glob('*.json'):
+            try:
+                entries.append((path.stat().st_mtime_ns, path.name, json.loads(path.read_text(encoding = 'utf-8'))['sha256']))
+            except (OSError, ValueError, KeyError):
+                path.unlink(missing_ok = True)
+
+        for _, name, digest in sorted(entries):
+            self._entries[name] = digest
+            self._refs[digest] = self._refs.get(digest, 0) + 1
+
+        # corpos sem nenhuma entrada (ex.: execução interrompida) não seriam removidos pelo limite
+        for digest in [digest for digest in self._blob_sizes if digest not in self._refs]:
+            self._size -= self._blob_sizes.pop(digest)
+            self._blob_path(digest).unlink(missing_ok = True)
+
+    @property
+    def offline(self) -> bool:
+        return self.mode == 'replay'
+
+    @property
+    def size(self) -> int:
+        """Tamanho (em bytes) dos corpos guardados."""
+        return self._size
+
+    def _index_path(self, url: str) -> Path:
+        return self._index_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self._blobs_dir / digest[:2] / digest
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents = True, exist_ok = True)
+        fd, tmp_path = tempfile.mkstemp(dir = path.parent, suffix = '.tmp')
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def get(self, url: str) -> Optional[requests.Response]:
+        """
+        Retorna a resposta guardada da URL, ou None se não houver entrada válida.
+
+        Args:
+            url (str): URL requisitada.
+
+        Returns:
+            Optional[requests.Response]: Resposta reconstruída a partir do disco.
+        """
+        index_path = self._index_path(url)
+
+        try:
+            entry = json.loads(index_path.read_text(encoding = 'utf-8'))
+            body = self._blob_path(entry['sha256']).read_bytes()
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self.stats['misses'] += 1
+            return None
+
+        if not self.offline and self.ttl is not None and time.time() - entry['stored_at'] > self.ttl:
+            with self._lock:
+                self.stats['misses'] += 1
+            return None
+
+        # registrar o uso (a remoção por tamanho começa pelas entradas usadas há mais tempo)
+        try:
+            os.utime(index_path)
+        except OSError:
+            pass
+
+        with self._lock:
+            self.stats['hits'] += 1
+            if index_path.name in self._entries:
+                self._entries.move_to_end(index_path.name)
+
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.reason = 'OK'
+        response.url = url
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = body
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def put(self, url: str, response: requests.Response) -> None:
+        """Grava uma resposta 200 no cache (demais status são ignorados)."""
+        if response.status_code != 200:
+            return
+
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(digest)
+
+        # cabeçalhos de transporte não valem para o corpo já decodificado
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() not in ('content-encoding', 'content-length', 'transfer-encoding', 'connection')
+        }
+        entry = {'url': url, 'status': response.status_code, 'headers': headers, 'sha256': digest, 'stored_at': time.time()}
+
+        index_path = self._index_path(url)
+
+        with self._lock:
+            if digest not in self._blob_sizes:
+                self._write_atomic(blob_path, body)
+                self._blob_sizes[digest] = len(body)
+                self._size += len(body)
+
+            self._write_atomic(index_path, json.dumps(entry).encode('utf-8'))
+            self.stats['stored'] += 1
+
+            # a URL pode já ter uma entrada (com outro corpo): a referência antiga é liberada
+            previous = self._entries.pop(index_path.name, None)
+            self._entries[index_path.name] = digest
+            self._refs[digest] = self._refs.get(digest, 0) + 1
+            if previous is not None:
+                self._release(previous)
+
+            if self.max_bytes is not None:
+                self._evict()
+
+    def _release(self, digest: str) -> None:
+        # o corpo só sai do disco quando nenhuma URL aponta para ele (chamado com o lock)
+        self._refs[digest] -= 1
+        if self._refs[digest] > 0:
+            return
+
+        del self._refs[digest]
+        self._size -= self._blob_sizes.pop(digest, 0)
+        self._blob_path(digest).unlink(missing_ok = True)
+
+    def _evict(self) -> None:
+        # remover as entradas usadas há mais tempo até caber no limite (chamado com o lock)
+        while self._size > self.max_bytes and self._entries:
+            name, digest = self._entries.popitem(last = False)
+            (self._index_dir / name).unlink(missing_ok = True)
+            self.stats['evicted'] += 1
+            self._release(digest)
+
+    def clear(self) -> None:
+        """Remove todas as entradas do cache."""
+        with self._lock:
+            for path in [*self._index_dir.glob('*.json'), *self._blobs_dir.glob('*/*')]:
+                path.unlink(missing_ok = True)
+            self._entries.clear()
+            self._refs.clear()
+            self._blob_sizes.clear()
+            self._size = 0
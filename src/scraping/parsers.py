@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import re
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from bs4 import BeautifulSoup
+
+# lxml é dependência do projeto (requirements.txt); sem ele, a ingestão usa os parsers em Python puro
+try:
+    import lxml.html
+except ImportError:  # pragma: no cover - ambiente sem as dependências fixadas
+    lxml = None
+
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:  # pragma: no cover - backend opcional
+    SelectolaxParser = None
+
+# ----------------------------------------------------------------------------------------------- #
+# Constantes
+# ----------------------------------------------------------------------------------------------- #
+
+# avaliação por extenso (classe CSS "star-rating <Nota>") -> número
+RATINGS = {'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5}
+
+# texto de paginação das categorias (ex.: "Page 1 of 8")
+PAGE_COUNT_PATTERN = re.compile(r'Page\s+\d+\s+of\s+(\d+)')
+
+# ----------------------------------------------------------------------------------------------- #
+# Resultado do parsing de uma página de categoria
+# ----------------------------------------------------------------------------------------------- #
+
+class CategoryPage(NamedTuple):
+    """
+    Conteúdo extraído de uma página de categoria.
+
+    Attributes:
+        books (List[Dict[str, str]]): Campos brutos de cada livro (título, preço,
+            avaliação por extenso, disponibilidade e link relativo da imagem).
+        page_count (Optional[int]): Total de páginas da categoria ("Page 1 of N"), se houver.
+        next_href (Optional[str]): Link relativo do botão "next", se houver.
+    """
+    books: List[Dict[str, str]]
+    page_count: Optional[int]
+    next_href: Optional[str]
+
+def _page_count(text: Optional[str]) -> Optional[int]:
+    match = PAGE_COUNT_PATTERN.search(text) if text else None
+    return int(match.group(1)) if match else None
+
+def _book(title: str, price: str, rating_class: str, availability: str, image: str) -> Dict[str, str]:
+    # a nota é a segunda classe do <p class="star-rating <Nota>">
+    classes = rating_class.split()
+    return {
+        'title': title,
+        'price': price,
+        'rating': classes[1] if len(classes) > 1 else '',
+        'availability': availability,
+        'image': image
+    }
+
+# ----------------------------------------------------------------------------------------------- #
+# Backend: BeautifulSoup + html.parser (referência)
+# ----------------------------------------------------------------------------------------------- #
+
+def parse_bs4(html: str) -> CategoryPage:
+    """Parser de referência (BeautifulSoup com o html.parser, em Python puro)."""
+    soup = BeautifulSoup(html, 'html.parser')
+    books = []
+
+    for livro in soup.find_all('article'):
+        paragrafos = livro.find_all('p')
+        books.append(_book(
+            title = livro.find('h3').find('a')['title'],
+            price = paragrafos[1].get_text(),
+            rating_class = ' '.join(paragrafos[0]['class']),
+            availability = paragrafos[2].get_text(strip = True),
+            image = livro.find('img')['src']
+        ))
+
+    current = soup.find('li', class_ = 'current')
+    next_button = soup.find('li', class_ = 'next')
+
+    return CategoryPage(
+        books = books,
+        page_count = _page_count(current.get_text() if current else None),
+        next_href = next_button.find('a')['href'] if next_button else None
+    )
+
+# ----------------------------------------------------------------------------------------------- #
+# Backend: html.parser da biblioteca padrão, sem árvore (passada única)
+# ----------------------------------------------------------------------------------------------- #
+
+class _CategoryPageHandler(HTMLParser):
+    """
+    Extrai os livros e a paginação em uma única passada pelos eventos do HTML, sem
+    montar a árvore de elementos (o custo principal do BeautifulSoup).
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs = True)
+        self.books: List[Dict[str, str]] = []
+        self.pager_text: Optional[str] = None
+        self.next_href: Optional[str] = None
+
+        self._article: Optional[dict] = None
+        self._in_h3 = False
+        self._p_index = -1
+        self._p_text: Optional[List[str]] = None
+        self._li: Optional[str] = None
+        self._li_text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'article':
+            self._article = {'p': []}
+            self._p_index = -1
+        elif self._article is not None:
+            if tag == 'p':
+                attrs = dict(attrs)
+                self._p_index += 1
+                self._p_text = []
+                self._article['p'].append({'class': attrs.get('class') or '', 'text': self._p_text})
+            elif tag == 'h3':
+                self._in_h3 = True
+            elif tag == 'a' and self._in_h3 and 'title' not in self._article:
+                self._article['title'] = dict(attrs).get('title')
+            elif tag == 'img' and 'image' not in self._article:
+                self._article['image'] = dict(attrs).get('src')
+        elif tag == 'li':
+            classes = (dict(attrs).get('class') or '').split()
+            self._li = 'current' if 'current' in classes else 'next' if 'next' in classes else None
+            self._li_text = []
+        elif tag == 'a' and self._li == 'next' and self.next_href is None:
+            self.next_href = dict(attrs).get('href')
+
+    def handle_endtag(self, tag):
+        if tag == 'article' and self._article is not None:
+            paragrafos = self._article['p']
+            self.books.append(_book(
+                title = self._article.get('title'),
+                price = ''.join(paragrafos[1]['text']),
+                rating_class = paragrafos[0]['class'],
+                availability = ''.join(paragrafos[2]['text']).strip(),
+                image = self._article.get('image')
+            ))
+            self._article = None
+            self._p_text = None
+        elif tag == 'p':
+            self._p_text = None
+        elif tag == 'h3':
+            self._in_h3 = False
+        elif tag == 'li':
+            if self._li == 'current' and self.pager_text is None:
+                self.pager_text = ''.join(self._li_text)
+            self._li = None
+
+    def handle_data(self, data):
+        if self._p_text is not None:
+            self._p_text.append(data)
+        elif self._li is not None:
+            self._li_text.append(data)
+
+def parse_stdlib(html: str) -> CategoryPage:
+    """Parser de passada única sobre o html.parser da biblioteca padrão (sem dependências)."""
+    handler = _CategoryPageHandler()
+    handler.feed(html)
+    handler.close()
+
+    return CategoryPage(
+        books = handler.books,
+        page_count = _page_count(handler.pager_text),
+        next_href = handler.next_href
+    )
+
+# ----------------------------------------------------------------------------------------------- #
+# Backend: lxml (parser em C, padrão)
+# ----------------------------------------------------------------------------------------------- #
+
+def parse_lxml(html: str) -> CategoryPage:
+    """Parser sobre o lxml (libxml2). Requer o pacote `lxml`."""
+    doc = lxml.html.fromstring(html)
+    books = []
+
+    for livro in doc.iter('article'):
+        title = image = None
+        paragrafos = []
+
+        # passada única pelos elementos do <article>
+        for el in livro.iter('p', 'a', 'img'):
+            if el.tag == 'p':
+                paragrafos.append(el)
+            elif el.tag == 'a' and title is None and el.getparent().tag == 'h3':
+                title = el.get('title')
+            elif el.tag == 'img' and image is None:
+                image = el.get('src')
+
+        books.append(_book(
+            title = title,
+            price = paragrafos[1].text_content(),
+            rating_class = paragrafos[0].get('class', ''),
+            availability = paragrafos[2].text_content().strip(),
+            image = image
+        ))
+
+    current = next(iter(doc.find_class('current')), None)
+    next_button = next(iter(doc.find_class('next')), None)
+    next_link = next_button.find('a') if next_button is not None else None
+
+    return CategoryPage(
+        books = books,
+        page_count = _page_count(current.text_content() if current is not None else None),
+        next_href = next_link.get('href') if next_link is not None else None
+    )
+
+# ----------------------------------------------------------------------------------------------- #
+# Backend: selectolax (parser em C, opcional)
+# ----------------------------------------------------------------------------------------------- #
+
+def parse_selectolax(html: str) -> CategoryPage:
+    """Parser sobre o selectolax (Modest/Lexbor). Requer o pacote `selectolax`."""
+    tree = SelectolaxParser(html)
+    books = []
+
+    for livro in tree.css('article'):
+        paragrafos = livro.css('p')
+        books.append(_book(
+            title = livro.css_first('h3 a').attributes.get('title'),
+            price = paragrafos[1].text(deep = True),
+            rating_class = paragrafos[0].attributes.get('class') or '',
+            availability = paragrafos[2].text(deep = True).strip(),
+            image = livro.css_first('img').attributes.get('src')
+        ))
+
+    current = tree.css_first('li.current')
+    next_link = tree.css_first('li.next a')
+
+    return CategoryPage(
+        books = books,
+        page_count = _page_count(current.text(deep = True) if current is not None else None),
+        next_href = next_link.attributes.get('href') if next_link is not None else None
+    )
+
+# ----------------------------------------------------------------------------------------------- #
+# Registro dos backends
+# ----------------------------------------------------------------------------------------------- #
+
+PARSERS: Dict[str, Callable[[str], CategoryPage]] = {'bs4': parse_bs4, 'stdlib': parse_stdlib}
+
+if lxml is not None:
+    PARSERS['lxml'] = parse_lxml
+
+if SelectolaxParser is not None:
+    PARSERS['selectolax'] = parse_selectolax
+
+# ordem de escolha do padrão: o lxml (fixado no requirements.txt) e, se ele não estiver instalado,
+# o selectolax (opcional) ou o parser de passada única da biblioteca padrão
+PREFERRED_PARSERS = ('lxml', 'selectolax', 'stdlib', 'bs4')
+
+def get_parser(name: Optional[str] = None) -> Callable[[str], CategoryPage]:
+    """
+    Retorna a função de parsing de páginas de categoria.
+
+    Args:
+        name (Optional[str]): Nome do backend ('selectolax', 'lxml', 'stdlib' ou 'bs4').
+            Se não informado, usa o lxml (ou o primeiro disponível de PREFERRED_PARSERS).
+
+    Returns:
+        Callable[[str], CategoryPage]: Função que recebe o HTML e retorna a página extraída.
+
+    Raises:
+        ValueError: Se o backend não existir ou não estiver instalado.
+    """
+    if name is None:
+        name = next(parser for parser in PREFERRED_PARSERS if parser in PARSERS)
+
+    if name not in PARSERS:
+        raise ValueError(f"Parser '{name}' indisponível. Opções: {', '.join(sorted(PARSERS))}")
+
+    return PARSERS[name]
@@ -0,0 +1,46 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import threading
+from typing import Any, Optional
+
+# ----------------------------------------------------------------------------------------------- #
+# Cliente do Supabase criado sob demanda
+# ----------------------------------------------------------------------------------------------- #
+
+class LazySupabaseClient:
+    """
+    Proxy do cliente do Supabase que só importa a biblioteca e cria o cliente no primeiro uso.
+
+    O pacote `supabase` (com postgrest, httpx, realtime, storage etc.) é o import
+    mais pesado da API. Com o proxy, a aplicação sobe sem ele, e o cliente é
+    criado na primeira chamada (`supabase.table(...)` etc.), uma única vez por processo.
+
+    Args:
+        url (str): URL do projeto no Supabase.
+        key (str): Chave de acesso do Supabase.
+    """
+
+    def __init__(self, url: str, key: str):
+        self._url = url
+        self._key = key
+        self._client: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> Any:
+        """Cliente do Supabase (criado na primeira chamada)."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    from supabase import create_client
+                    self._client = create_client(self._url, self._key)
+        return self._client
+
+    @property
+    def initialized(self) -> bool:
+        return self._client is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
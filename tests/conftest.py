@@ -0,0 +1,66 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# os módulos de scraping importam uns aos outros pelo nome (ver books_ingestion.py)
+sys.path.append(os.path.join(ROOT, "src", "scraping"))
+
+from config import Config
+
+CSV_PATH = os.path.join(ROOT, "data", "base_livros.csv")
+
+# ----------------------------------------------------------------------------------------------- #
+# Configuração de testes
+# ----------------------------------------------------------------------------------------------- #
+
+class TestConfig(Config):
+    TESTING = True
+    SECRET_KEY = "test-secret-key-with-at-least-32-bytes"
+    ADMIN_TOKEN = "test-admin-token"
+
+    # apenas o CSV, sem recarga automática
+    CATALOG_COLUMNAR_PATH = None
+    CATALOG_WATCH_INTERVAL = 0
+
+    # sem banco de dados nos testes: os logs de requisições são descartados
+    REQUEST_LOG_OVERFLOW = "drop"
+
+# ----------------------------------------------------------------------------------------------- #
+# Fixtures
+# ----------------------------------------------------------------------------------------------- #
+
+@pytest.fixture(scope = "session")
+def baseline_df() -> pd.DataFrame:
+    """Base de livros lida como nas rotas originais (DataFrame sem índices)."""
+    return pd.read_csv(CSV_PATH)
+
+@pytest.fixture(scope = "session")
+def app(tmp_path_factory):
+    TestConfig.REQUEST_LOG_SPILL_FILE = str(tmp_path_factory.mktemp("logs") / "spill.jsonl")
+
+    import main
+    app = main.create_app(TestConfig)
+    yield app
+
+    # envia (e descarta, sem banco) os logs pendentes enquanto a saída dos testes ainda está aberta
+    app.extensions["request_log_queue"].close()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def auth_headers(app):
+    from flask_jwt_extended import create_access_token
+
+    with app.app_context():
+        return {"Authorization": f"Bearer {create_access_token(identity = '1')}"}
@@ -0,0 +1,189 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import hashlib
+import html
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+# ----------------------------------------------------------------------------------------------- #
+# Páginas no formato do books.toscrape.com
+# ----------------------------------------------------------------------------------------------- #
+
+RATING_CLASSES = {1: 'One', 2: 'Two', 3: 'Three', 4: 'Four', 5: 'Five'}
+
+def book(title: str, price: float = 10.0, rating: int = 3, image: str = 'aa/bb/cover.jpg') -> dict:
+    """Livro de uma página de categoria (campos como publicados pelo site)."""
+    return {'title': title, 'price': price, 'rating': rating, 'image': image}
+
+def category_slug(name: str, index: int) -> str:
+    return f"catalogue/category/books/{name.lower().replace(' ', '-')}_{index + 2}/"
+
+def index_page(categories: List[str]) -> str:
+    links = ''.join(
+        f'<li><a href="{category_slug(name, i)}index.html">{html.escape(name)}</a></li>'
+        for i, name in enumerate(categories)
+    )
+    return (
+        '<html><body><ul class="nav nav-list">'
+        '<li><a href="catalogue/category/books_1/index.html">Books</a><ul>' + links + '</ul></li>'
+        '</ul></body></html>'
+    )
+
+def category_page(books: List[dict], page: int, page_count: int, pager_text: bool = True) -> str:
+    articles = ''.join(
+        '<li><article class="product_pod">'
+        f'<div class="image_container"><a href="#"><img src="../../../../media/cache/{livro["image"]}" alt="" class="thumbnail"></a></div>'
+        f'<p class="star-rating {RATING_CLASSES[livro["rating"]]}"><i class="icon-star"></i></p>'
+        f'<h3><a href="#" title="{html.escape(livro["title"])}">{html.escape(livro["title"][:20])}</a></h3>'
+        f'<div class="product_price"><p class="price_color">£{livro["price"]:.2f}</p>'
+        '<p class="instock availability"><i class="icon-ok"></i>\n    In stock\n</p></div>'
+        '</article></li>'
+        for livro in books
+    )
+
+    pager = ''
+    if page_count > 1:
+        current = f'<li class="current">Page {page} of {page_count}</li>' if pager_text else ''
+        following = f'<li class="next"><a href="page-{page + 1}.html">next</a></li>' if page < page_count else ''
+        pager = f'<ul class="pager">{current}{following}</ul>'
+
+    return f'<html><body><section><ol class="row">{articles}</ol>{pager}</section></body></html>'
+
+def build_site(catalog: Dict[str, List[List[dict]]], pager_text: bool = True) -> Dict[str, str]:
+    """
+    Monta as páginas de um site de livros: índice com as categorias e páginas de cada categoria.
+
+    Args:
+        catalog (Dict[str, List[List[dict]]]): Categoria -> páginas (cada uma, a lista de livros).
+        pager_text (bool): Publica o texto "Page 1 of N" (sem ele, o crawler segue o botão "next").
+
+    Returns:
+        Dict[str, str]: Caminho da URL -> HTML.
+    """
+    pages = {'/': index_page(list(catalog))}
+
+    for i, (name, category_pages) in enumerate(catalog.items()):
+        slug = '/' + category_slug(name, i)
+        for n, books in enumerate(category_pages, start = 1):
+            path = slug if n == 1 else f'{slug}page-{n}.html'
+            pages[path] = category_page(books, n, len(category_pages), pager_text)
+
+    return pages
+
+# ----------------------------------------------------------------------------------------------- #
+# Servidor HTTP local
+# ----------------------------------------------------------------------------------------------- #
+
+class FixtureServer:
+    """
+    Servidor HTTP local (http.server numa thread) que serve páginas fixas.
+
+    Cada resposta tem ETag (hash do corpo) e responde 304 a um If-None-Match igual
+    (`etags = False` desliga os dois). Falhas (status 5xx) e atrasos podem ser
+    programados por caminho, e todas as requisições ficam registradas (caminho,
+    cabeçalhos, status e porta do cliente, que identifica a conexão TCP).
+
+    Args:
+        pages (Dict[str, str]): Caminho da URL -> HTML.
+    """
+
+    def __init__(self, pages: Dict[str, str]):
+        self.pages = dict(pages)
+        self.failures: Dict[str, int] = {}
+        self.delays: Dict[str, float] = {}
+        self.requests: List[dict] = []
+        self.etags = True
+        self.max_in_flight = 0
+
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self._server.server_address[1]}/'
+
+    def start(self) -> 'FixtureServer':
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # HTTP/1.1: a conexão fica aberta entre requisições (keep-alive)
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                fixture._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target = self._server.serve_forever, daemon = True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'FixtureServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def paths(self) -> List[str]:
+        with self._lock:
+            return [request['path'] for request in self.requests]
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        path = handler.path
+        request = {'path': path, 'headers': dict(handler.headers), 'port': handler.client_address[1], 'status': None}
+        with self._lock:
+            self.requests.append(request)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            failing = self.failures.get(path, 0) > 0
+            if failing:
+                self.failures[path] -= 1
+
+        try:
+            time.sleep(self.delays.get(path, 0))
+
+            page = self.pages.get(path)
+
+            if failing:
+                request['status'], body, headers = 503, b'', {}
+            elif page is None:
+                request['status'], body, headers = 404, b'', {}
+            else:
+                body = page.encode('utf-8')
+                headers = {'Content-Type': 'text/html; charset=utf-8'}
+                if self.etags:
+                    headers['ETag'] = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+
+                if self.etags and handler.headers.get('If-None-Match') == headers['ETag']:
+                    request['status'], body, headers = 304, b'', {'ETag': headers['ETag']}
+                else:
+                    request['status'] = 200
+
+            self._send(handler, request['status'], body, headers)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, status: int, body: bytes, headers: Optional[dict] = None) -> None:
+        try:
+            handler.send_response(status)
+            for name, value in (headers or {}).items():
+                handler.send_header(name, value)
+            handler.send_header('Content-Length', str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # o cliente desistiu (ex.: timeout do teste)
+            pass
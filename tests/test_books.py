@@ -0,0 +1,20 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import pytest
+
+# ----------------------------------------------------------------------------------------------- #
+# Livro por id comparado com o filtro original
+# ----------------------------------------------------------------------------------------------- #
+
+@pytest.mark.parametrize('book_id', [1, 2, 500, 999])
+def test_book_by_id_matches_baseline(client, baseline_df, book_id):
+    expected = baseline_df[baseline_df['id'] == book_id].to_dict(orient = 'records')
+    assert client.get(f'/api/v1/books/{book_id}').get_json() == expected
+
+@pytest.mark.parametrize('book_id', [0, 1000, 123456])
+def test_unknown_book_returns_404(client, book_id):
+    response = client.get(f'/api/v1/books/{book_id}')
+    assert response.status_code == 404
+    assert response.get_json() == {'message': 'Livro não encontrado'}
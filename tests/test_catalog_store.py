@@ -0,0 +1,168 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import os
+import threading
+import time
+
+import pytest
+
+from conftest import CSV_PATH
+from src.catalog.columnar import csv_version
+from src.catalog.store import CatalogStore
+
+# ----------------------------------------------------------------------------------------------- #
+# Fixtures
+# ----------------------------------------------------------------------------------------------- #
+
+ORIGINAL = open(CSV_PATH, 'rb').read()
+CHANGED = ORIGINAL.replace(b"It's Only the Himalayas", b"Reloaded Himalayas", 1)
+
+# título do livro 1 em cada versão do catálogo
+TITLES = {csv_version(ORIGINAL): b"It's Only the Himalayas", csv_version(CHANGED): b"Reloaded Himalayas"}
+
+def replace_file(path, data: bytes) -> None:
+    # como os escritores da base (ingestão, columnar.py): arquivo temporário + os.replace
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "base_livros.csv"
+    path.write_bytes(ORIGINAL)
+    return path
+
+@pytest.fixture
+def store(csv_path):
+    store = CatalogStore(str(csv_path))
+    yield store
+
+    # sem snapshot, o watcher (thread daemon, se iniciado) deixa de verificar os arquivos
+    store._snapshot = None
+
+def wait_for(condition, timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+# ----------------------------------------------------------------------------------------------- #
+# Recarga sem alteração nos dados
+# ----------------------------------------------------------------------------------------------- #
+
+def test_unchanged_file_keeps_snapshot(store, csv_path):
+    snapshot = store.load()
+
+    assert store.reload() == (snapshot.version, snapshot.version)
+    assert store.snapshot is snapshot
+
+    # mesmo conteúdo com outro mtime (ex.: checkout): mesma versão, mesmo snapshot
+    stat = csv_path.stat()
+    os.utime(csv_path, ns = (stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert store.reload() == (snapshot.version, snapshot.version)
+    assert store.snapshot is snapshot
+
+def test_forced_reload_replaces_snapshot_with_same_version(store):
+    snapshot = store.load()
+
+    assert store.reload(force = True) == (snapshot.version, snapshot.version)
+    assert store.snapshot is not snapshot
+    assert store.snapshot.version == snapshot.version
+
+def test_admin_reload_of_unchanged_catalog(client):
+    response = client.post('/api/v1/admin/reload', headers = {"X-Admin-Token": "test-admin-token"})
+
+    assert response.status_code == 200
+    assert response.get_json()['reloaded'] is False
+    assert response.get_json()['previous_version'] == response.get_json()['version']
+
+# ----------------------------------------------------------------------------------------------- #
+# Troca atômica do snapshot
+# ----------------------------------------------------------------------------------------------- #
+
+def check_consistent(snapshot) -> None:
+    """Dados e índices de um snapshot pertencem todos à mesma versão."""
+    title = TITLES[snapshot.version]
+    assert title in snapshot.get_json(1)
+    assert 0 in snapshot.search.search(title = title.decode())
+    assert (snapshot.search.search(title = "Reloaded") or []) == ([0] if title.startswith(b"Reloaded") else [])
+
+def test_in_flight_request_finishes_with_its_snapshot(store, csv_path):
+    store.load()
+    started, reloaded = threading.Event(), threading.Event()
+    result = {}
+
+    def request():
+        snapshot = store.snapshot
+        started.set()
+        reloaded.wait(5)
+        result['version'] = snapshot.version
+        result['book'] = snapshot.get_json(1)
+
+    thread = threading.Thread(target = request)
+    thread.start()
+    started.wait(5)
+
+    replace_file(csv_path, CHANGED)
+    previous, version = store.reload()
+    reloaded.set()
+    thread.join(5)
+
+    assert previous != version == store.snapshot.version
+    assert result['version'] == previous
+    assert TITLES[previous] in result['book']
+    assert TITLES[version] in store.snapshot.get_json(1)
+
+def test_readers_never_see_a_partial_snapshot(store, csv_path):
+    store.load()
+    stop = threading.Event()
+    seen, errors = set(), []
+
+    def reader():
+        while not stop.is_set():
+            try:
+                snapshot = store.snapshot
+                check_consistent(snapshot)
+                seen.add(snapshot.version)
+            except Exception as e:
+                errors.append(e)
+                return
+
+    readers = [threading.Thread(target = reader) for _ in range(2)]
+    for thread in readers:
+        thread.start()
+
+    for data in (CHANGED, ORIGINAL, CHANGED):
+        replace_file(csv_path, data)
+        store.reload()
+        time.sleep(0.02)
+
+    stop.set()
+    for thread in readers:
+        thread.join(5)
+
+    assert not errors
+    assert seen == set(TITLES)
+
+# ----------------------------------------------------------------------------------------------- #
+# Watcher de arquivos
+# ----------------------------------------------------------------------------------------------- #
+
+def test_watcher_reloads_changed_file(store, csv_path):
+    store.watch_interval = 0.05
+    snapshot = store.snapshot
+
+    # mesmo conteúdo: o watcher recarrega, mas mantém o snapshot
+    stat = csv_path.stat()
+    os.utime(csv_path, ns = (stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert wait_for(lambda: store._files_signature == store._signature())
+    assert store.snapshot is snapshot
+
+    replace_file(csv_path, CHANGED)
+    assert wait_for(lambda: store.snapshot.version == csv_version(CHANGED))
+    check_consistent(store.snapshot)
@@ -0,0 +1,117 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import io
+import os
+
+import pandas as pd
+import pytest
+
+from conftest import CSV_PATH
+from src.catalog import store as catalog_store
+from src.catalog.columnar import CATALOG_DTYPES, read_columnar, write_columnar
+from src.catalog.store import CatalogSnapshot, CatalogStore
+
+# ----------------------------------------------------------------------------------------------- #
+# Arquivo colunar gerado a partir do CSV (não versionado)
+# ----------------------------------------------------------------------------------------------- #
+
+def test_ensure_columnar_builds_missing_file(tmp_path, baseline_df):
+    columnar_path = str(tmp_path / "base_livros.columns")
+    store = CatalogStore(CSV_PATH, columnar_path)
+
+    assert store.ensure_columnar()
+    assert not store.ensure_columnar()
+
+    df, header = read_columnar(columnar_path)
+    assert header['version'] == store.load().version
+    assert df['title'].tolist() == baseline_df['title'].tolist()
+
+def test_ensure_columnar_rebuilds_after_checkout(tmp_path):
+    # checkout/cópia: mesmo conteúdo, mtime diferente do registrado na conversão
+    csv_path = tmp_path / "base_livros.csv"
+    csv_path.write_bytes(open(CSV_PATH, 'rb').read())
+    store = CatalogStore(str(csv_path), str(tmp_path / "base_livros.columns"))
+    assert store.ensure_columnar()
+
+    stat = csv_path.stat()
+    os.utime(csv_path, ns = (stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert store.ensure_columnar()
+    assert not store.ensure_columnar()
+
+# ----------------------------------------------------------------------------------------------- #
+# Valores ausentes
+# ----------------------------------------------------------------------------------------------- #
+
+def test_missing_values_round_trip(tmp_path):
+    rows = ["1,,1.0,3,In stock,,", "2,B,2.0,4,,Poetry,b.jpg"]
+    rows += [f"{n},T{n},1.0,3,In stock,Poetry,{n}.jpg" for n in range(3, 20)]
+    df = pd.read_csv(io.StringIO("id,title,price,rating,availability,category,image\n" + "\n".join(rows)), dtype = CATALOG_DTYPES)
+
+    path = str(tmp_path / "base_livros.columns")
+    write_columnar(df, path, "v1")
+    loaded, header = read_columnar(path)
+
+    # título e imagem: colunas de texto; categoria e disponibilidade: dicionário
+    assert {column['name']: column['kind'] for column in header['columns']}['title'] == 'str'
+    assert {column['name']: column['kind'] for column in header['columns']}['category'] == 'dict'
+    pd.testing.assert_frame_equal(loaded, df, check_dtype = False, check_categorical = False)
+    assert loaded['title'].isna().tolist() == df['title'].isna().tolist()
+
+def test_non_text_values_are_rejected(tmp_path):
+    df = pd.read_csv(CSV_PATH, dtype = CATALOG_DTYPES)
+    df['title'] = df['title'].astype(object)
+    df.loc[3, 'title'] = 42
+
+    with pytest.raises(ValueError, match = "apenas texto"):
+        write_columnar(df, str(tmp_path / "base_livros.columns"), "v1")
+
+    assert not os.listdir(tmp_path)
+
+# ----------------------------------------------------------------------------------------------- #
+# Carga do snapshot: índices construídos sob demanda
+# ----------------------------------------------------------------------------------------------- #
+
+LAZY_ATTRIBUTES = ['book_json', 'books_payload', 'by_id', 'price_order', 'search', 'titles']
+
+def test_snapshot_builds_indexes_on_first_use(tmp_path, monkeypatch, baseline_df):
+    store = CatalogStore(CSV_PATH, str(tmp_path / "base_livros.columns"))
+    store.ensure_columnar()
+
+    def unexpected(*args, **kwargs):
+        raise AssertionError("índice de busca construído na carga")
+
+    monkeypatch.setattr(catalog_store, 'SearchIndex', unexpected)
+    snapshot = store.load()
+    assert not set(LAZY_ATTRIBUTES) & set(vars(snapshot))
+
+    # a consulta por id constrói apenas o que usa
+    book = baseline_df.iloc[10]
+    assert b'"id":%d' % book['id'] in snapshot.get_json(int(book['id']))
+    assert 'search' not in vars(snapshot)
+
+    monkeypatch.undo()
+    snapshot.warm()
+    assert set(LAZY_ATTRIBUTES) <= set(vars(snapshot))
+    assert 10 in snapshot.search.search(title = book['title'])
+
+def test_reload_builds_indexes_before_swapping(tmp_path):
+    csv_path = tmp_path / "base_livros.csv"
+    csv_path.write_bytes(open(CSV_PATH, 'rb').read())
+    store = CatalogStore(str(csv_path))
+    store.load()
+
+    csv_path.write_bytes(csv_path.read_bytes().replace(b'Poetry', b'Poems'))
+    store.reload()
+    assert set(LAZY_ATTRIBUTES) <= set(vars(store.snapshot))
+
+def test_lazy_snapshot_matches_warm_snapshot(baseline_df):
+    lazy = CatalogSnapshot(baseline_df, "v1")
+    warm = CatalogSnapshot(baseline_df, "v1")
+    warm.warm()
+
+    positions = lazy.price_range(20, 30)
+    assert positions.tolist() == warm.price_range(20, 30).tolist()
+    assert lazy.json_list(positions) == warm.json_list(positions)
+    assert lazy.books_payload.etag == warm.books_payload.etag
@@ -0,0 +1,101 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import random
+import time
+
+import pytest
+import requests
+
+from crawler import Crawler
+from books_ingestion import iter_category_pages
+from fixture_site import FixtureServer, book, build_site
+
+# ----------------------------------------------------------------------------------------------- #
+# Crawler contra um servidor HTTP local
+# ----------------------------------------------------------------------------------------------- #
+
+def simple_pages(count):
+    return {f'/page-{n}.html': f'<html><body>pagina {n}</body></html>' for n in range(count)}
+
+def crawl_pages(crawler, server, count):
+    start = [(n, f'{server.url}page-{n}.html') for n in range(count)]
+    results = crawler.crawl(start, parse = lambda key, url, response: response.text, expand = lambda *args: [])
+    return {key: text for key, url, text in results}
+
+def test_fetches_run_concurrently():
+    with FixtureServer(simple_pages(8)) as server:
+        server.delays = {path: 0.3 for path in server.pages}
+
+        with Crawler(concurrency = 8, retries = 0) as crawler:
+            start = time.perf_counter()
+            pages = crawl_pages(crawler, server, 8)
+            elapsed = time.perf_counter() - start
+
+    assert pages == {n: f'<html><body>pagina {n}</body></html>' for n in range(8)}
+    assert server.max_in_flight > 1
+    # sequencial levaria 8 x 0,3 s
+    assert elapsed < 1.5
+
+def test_pooled_session_reuses_connections():
+    with FixtureServer(simple_pages(40)) as server:
+        with Crawler(concurrency = 4, retries = 0) as crawler:
+            crawl_pages(crawler, server, 40)
+            crawler.fetch(server.url + 'page-0.html')
+
+        ports = {request['port'] for request in server.requests}
+
+    # no máximo uma conexão TCP por thread do pool, e não uma por página
+    assert len(server.requests) == 41
+    assert len(ports) <= 4
+
+def test_retries_server_errors():
+    with FixtureServer(simple_pages(1)) as server:
+        server.failures = {'/page-0.html': 2}
+
+        with Crawler(concurrency = 1, retries = 3, backoff = 0) as crawler:
+            response = crawler.fetch(server.url + 'page-0.html')
+
+    assert response.status_code == 200
+    assert server.paths() == ['/page-0.html'] * 3
+
+def test_gives_up_after_retries():
+    with FixtureServer(simple_pages(1)) as server:
+        server.failures = {'/page-0.html': 5}
+
+        with Crawler(concurrency = 1, retries = 2, backoff = 0) as crawler:
+            with pytest.raises(requests.exceptions.RequestException):
+                crawler.fetch(server.url + 'page-0.html')
+
+    assert server.paths() == ['/page-0.html'] * 3
+
+def test_times_out_slow_responses():
+    with FixtureServer(simple_pages(1)) as server:
+        server.delays = {'/page-0.html': 2}
+
+        with Crawler(concurrency = 1, retries = 0, timeout = 0.2) as crawler:
+            start = time.perf_counter()
+            with pytest.raises(requests.exceptions.RequestException):
+                crawler.fetch(server.url + 'page-0.html')
+
+    assert time.perf_counter() - start < 1.5
+
+@pytest.mark.parametrize('pager_text', [True, False])
+def test_pages_come_out_in_category_and_page_order(pager_text):
+    catalog = {
+        name: [[book(f'{name} {page}-{n}') for n in range(3)] for page in range(1, pages + 1)]
+        for name, pages in (('Travel', 4), ('Mystery', 1), ('Poetry', 3))
+    }
+
+    with FixtureServer(build_site(catalog, pager_text)) as server:
+        # atrasos aleatórios: as respostas chegam fora de ordem
+        rng = random.Random(7)
+        server.delays = {path: rng.uniform(0, 0.05) for path in server.pages}
+
+        categories = [(name, f'catalogue/category/books/{name.lower()}_{i + 2}/') for i, name in enumerate(catalog)]
+        with Crawler(concurrency = 8, retries = 0) as crawler:
+            pages = list(iter_category_pages(crawler, server.url, categories, parser = 'stdlib'))
+
+    titles = [[livro['title'] for livro in pagina] for pagina in pages]
+    assert titles == [[livro['title'] for livro in books] for category in catalog.values() for books in category]
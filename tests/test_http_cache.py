@@ -0,0 +1,107 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+from pathlib import Path
+
+import pytest
+import requests
+
+from books_ingestion import populate_books
+from crawler import Crawler
+from fixture_site import FixtureServer, book, build_site
+from http_cache import CacheMiss, HttpCache
+
+# ----------------------------------------------------------------------------------------------- #
+# Limite de tamanho (remoção das entradas usadas há mais tempo)
+# ----------------------------------------------------------------------------------------------- #
+
+def response(body: bytes) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.headers['Content-Type'] = 'text/html; charset=utf-8'
+    resp._content = body
+    return resp
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    cache = HttpCache(tmp_path, max_bytes = 250)
+
+    for name in 'abc':
+        cache.put(f'http://site/{name}', response(name.encode() * 100))
+    assert cache.get('http://site/a') is None
+
+    cache.get('http://site/b')
+    cache.put('http://site/d', response(b'd' * 100))
+
+    # c foi a entrada usada há mais tempo
+    assert cache.get('http://site/c') is None
+    assert cache.get('http://site/b').content == b'b' * 100
+    assert cache.size <= 250
+    assert cache.size == sum(path.stat().st_size for path in (tmp_path / 'blobs').glob('*/*'))
+
+def test_put_does_not_reread_the_index(tmp_path, monkeypatch):
+    cache = HttpCache(tmp_path, max_bytes = 1000)
+
+    reads = []
+    original = Path.read_text
+    monkeypatch.setattr(Path, 'read_text', lambda self, *args, **kwargs: reads.append(self) or original(self, *args, **kwargs))
+
+    for n in range(200):
+        cache.put(f'http://site/{n}', response(b'%05d' % n * 20))
+
+    assert reads == []
+    assert cache.stats['evicted'] == 190
+    assert len(list((tmp_path / 'index').glob('*.json'))) == 10
+
+def test_shared_bodies_are_kept_while_referenced(tmp_path):
+    cache = HttpCache(tmp_path, max_bytes = 150)
+
+    cache.put('http://site/a', response(b'x' * 100))
+    cache.put('http://site/b', response(b'x' * 100))
+    assert cache.size == 100
+
+    # sobrescrever a e b com outro corpo libera o corpo compartilhado
+    cache.put('http://site/a', response(b'y' * 100))
+    cache.put('http://site/b', response(b'y' * 100))
+    assert cache.size == 100
+    assert cache.get('http://site/a').content == b'y' * 100
+
+def test_index_is_rebuilt_from_disk(tmp_path):
+    cache = HttpCache(tmp_path)
+    cache.put('http://site/a', response(b'a' * 100))
+    cache.put('http://site/b', response(b'b' * 100))
+
+    reopened = HttpCache(tmp_path, max_bytes = 150)
+    reopened.put('http://site/c', response(b'c' * 100))
+
+    assert reopened.size <= 150
+    assert reopened.get('http://site/c') is not None
+
+# ----------------------------------------------------------------------------------------------- #
+# Gravação e reprodução offline contra um servidor HTTP local
+# ----------------------------------------------------------------------------------------------- #
+
+def test_record_then_replay_with_server_stopped(tmp_path):
+    with FixtureServer({'/a.html': '<p>página á</p>', '/b.html': '<p>b</p>'}) as server:
+        urls = [server.url + 'a.html', server.url + 'b.html']
+        with Crawler(concurrency = 2, retries = 0, cache = HttpCache(tmp_path, 'record')) as crawler:
+            recorded = [crawler.fetch(url).text for url in urls]
+
+    with Crawler(concurrency = 2, retries = 0, timeout = 1, cache = HttpCache(tmp_path, 'replay')) as crawler:
+        assert [crawler.fetch(url).text for url in urls] == recorded == ['<p>página á</p>', '<p>b</p>']
+
+        with pytest.raises(CacheMiss):
+            crawler.fetch(urls[0].replace('a.html', 'c.html'))
+
+def test_ingestion_replays_offline(tmp_path):
+    catalog = {'Travel': [[book('Travel 1'), book('Travel 2')], [book('Travel 3')]], 'Poetry': [[book('Poetry 1')]]}
+
+    with FixtureServer(build_site(catalog)) as server:
+        url = server.url
+        populate_books(url, tmp_path / 'recorded.csv', concurrency = 4, cache = HttpCache(tmp_path / 'cache', 'record'))
+
+    # servidor parado: a ingestão roda inteiramente a partir do cache
+    populate_books(url, tmp_path / 'replayed.csv', concurrency = 4, cache = HttpCache(tmp_path / 'cache', 'replay'))
+
+    assert (tmp_path / 'replayed.csv').read_bytes() == (tmp_path / 'recorded.csv').read_bytes()
+    assert (tmp_path / 'replayed.csv').read_text(encoding = 'utf-8').count('\n') == 5
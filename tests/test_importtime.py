@@ -0,0 +1,43 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import subprocess
+import sys
+
+from conftest import ROOT
+from src.importtime_check import DEFAULT_BUDGET_MS, LAZY_MODULES, run_importtime
+
+# ----------------------------------------------------------------------------------------------- #
+# Inicialização da API (cada teste importa o main num processo novo)
+# ----------------------------------------------------------------------------------------------- #
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd = ROOT, capture_output = True, text = True, timeout = 120)
+
+def test_importtime_check_passes():
+    # orçamento de inicialização e módulos carregados sob demanda (ver src/importtime_check.py)
+    result = run_python('-m', 'src.importtime_check', '--top', '0')
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert f"orçamento: {DEFAULT_BUDGET_MS} ms" in result.stdout
+
+def test_heavy_modules_are_not_imported_at_startup():
+    _, imports = run_importtime()
+    names = {name for _, _, name in imports}
+
+    assert 'main' in names
+    assert not sorted(name for name in names if name.split('.')[0] in LAZY_MODULES)
+
+def test_plotly_is_imported_on_first_render():
+    script = (
+        "import sys\n"
+        "import main\n"
+        "print('plotly:', 'plotly' in sys.modules)\n"
+        "assert main.app.test_client().get('/').status_code == 200\n"
+        "print('plotly:', 'plotly' in sys.modules)\n"
+    )
+    result = run_python('-c', script)
+
+    assert result.returncode == 0, result.stderr
+    # o main registra logs na saída padrão
+    assert [line for line in result.stdout.splitlines() if line.startswith('plotly:')] == ['plotly: False', 'plotly: True']
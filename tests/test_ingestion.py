@@ -0,0 +1,137 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import json
+
+import pytest
+
+from books_ingestion import diff_books, merge_books, read_books_csv, refresh_books
+from fixture_site import FixtureServer, book, build_site
+
+# ----------------------------------------------------------------------------------------------- #
+# Delta entre a base e um novo crawling
+# ----------------------------------------------------------------------------------------------- #
+
+def livro(title, price = 10.0, **extra):
+    return {'title': title, 'price': price, 'rating': 3, 'availability': 'In stock', 'category': 'Travel',
+            'image': 'cover.jpg', **extra}
+
+def test_diff_books_classifies_and_numbers_new_books():
+    base = [livro('A', id = 1), livro('B', id = 2), livro('C', id = 5)]
+    delta = diff_books(base, [livro('A'), livro('C', price = 12.0), livro('D'), livro('E')])
+
+    assert delta['added'] == [livro('D', id = 6), livro('E', id = 7)]
+    assert delta['changed'] == [livro('C', price = 12.0, id = 5)]
+    assert delta['removed'] == [livro('B', id = 2)]
+
+def test_merge_books_keeps_ids_and_order():
+    base = [livro('A', id = 1), livro('B', id = 2), livro('C', id = 5)]
+    delta = diff_books(base, [livro('A'), livro('C', price = 12.0), livro('D')])
+
+    assert list(merge_books(base, delta)) == [livro('A', id = 1), livro('C', price = 12.0, id = 5), livro('D', id = 6)]
+
+def test_unchanged_crawl_produces_empty_delta():
+    base = [livro('A', id = 1), livro('B', id = 2)]
+    assert diff_books(base, [livro('A'), livro('B')]) == {'added': [], 'changed': [], 'removed': []}
+
+# ----------------------------------------------------------------------------------------------- #
+# Atualização incremental contra um servidor HTTP local
+# ----------------------------------------------------------------------------------------------- #
+
+def catalog_v1():
+    return {
+        'Travel': [[book('Travel 1'), book('Travel 2')], [book('Travel 3')]],
+        'Poetry': [[book('Poetry 1', price = 20.5), book('Poetry 2')]]
+    }
+
+@pytest.fixture
+def paths(tmp_path):
+    return {
+        'output_path': tmp_path / 'base_livros.csv',
+        'state_path': tmp_path / 'crawl_state.json',
+        'delta_path': tmp_path / 'delta.json'
+    }
+
+def refresh(server, paths):
+    return refresh_books(server.url, concurrency = 4, parser = 'stdlib', **paths)
+
+def ids_by_title(paths):
+    return {row['title']: row['id'] for row in read_books_csv(paths['output_path'])}
+
+def test_first_refresh_adds_every_book(paths):
+    with FixtureServer(build_site(catalog_v1())) as server:
+        delta = refresh(server, paths)
+
+    assert [livro['title'] for livro in delta['added']] == ['Travel 1', 'Travel 2', 'Travel 3', 'Poetry 1', 'Poetry 2']
+    assert ids_by_title(paths) == {'Travel 1': 1, 'Travel 2': 2, 'Travel 3': 3, 'Poetry 1': 4, 'Poetry 2': 5}
+    assert json.loads(paths['delta_path'].read_text(encoding = 'utf-8')) == delta
+
+def test_not_modified_pages_are_skipped(paths):
+    with FixtureServer(build_site(catalog_v1())) as server:
+        refresh(server, paths)
+        csv_before = paths['output_path'].read_bytes()
+        first_run = len(server.requests)
+
+        delta = refresh(server, paths)
+        second_run = server.requests[first_run:]
+
+    # índice sem validadores (não é guardado no estado); páginas de categoria com If-None-Match -> 304
+    category_requests = [request for request in second_run if request['path'] != '/']
+    assert category_requests and all(request['status'] == 304 for request in category_requests)
+    assert all('If-None-Match' in request['headers'] for request in category_requests)
+
+    assert delta == {'added': [], 'changed': [], 'removed': []}
+    assert paths['output_path'].read_bytes() == csv_before
+
+def test_same_content_without_validators_is_not_reparsed(paths, monkeypatch):
+    with FixtureServer(build_site(catalog_v1())) as server:
+        server.etags = False
+        refresh(server, paths)
+
+        # sem ETag, a página volta com 200: o hash do conteúdo evita o parsing
+        import parsers
+        monkeypatch.setitem(parsers.PARSERS, 'stdlib', lambda html: pytest.fail('página sem alteração parseada de novo'))
+        delta = refresh(server, paths)
+
+    assert delta == {'added': [], 'changed': [], 'removed': []}
+
+def test_changes_apply_delta_and_keep_ids(paths):
+    with FixtureServer(build_site(catalog_v1())) as server:
+        refresh(server, paths)
+
+        catalog = catalog_v1()
+        catalog['Travel'][0] = [book('Travel 1', price = 99.99), book('Travel 4')]   # alterado, removido e novo
+        server.pages = build_site(catalog)
+        first_run = len(server.requests)
+
+        delta = refresh(server, paths)
+        statuses = {request['path']: request['status'] for request in server.requests[first_run:]}
+
+    assert [livro['title'] for livro in delta['added']] == ['Travel 4']
+    assert [(livro['id'], livro['title'], livro['price']) for livro in delta['changed']] == [(1, 'Travel 1', 99.99)]
+    assert [(livro['id'], livro['title']) for livro in delta['removed']] == [(2, 'Travel 2')]
+
+    # apenas a página alterada foi baixada de novo
+    assert sorted(status for path, status in statuses.items() if path != '/') == [200, 304, 304]
+
+    assert ids_by_title(paths) == {'Travel 1': 1, 'Travel 3': 3, 'Poetry 1': 4, 'Poetry 2': 5, 'Travel 4': 6}
+    assert json.loads(paths['delta_path'].read_text(encoding = 'utf-8')) == delta
+
+def test_delta_file_is_replaced_atomically(paths, monkeypatch):
+    import books_ingestion
+
+    with FixtureServer(build_site(catalog_v1())) as server:
+        refresh(server, paths)
+        previous = paths['delta_path'].read_text(encoding = 'utf-8')
+
+        def failing_dump(*args, **kwargs):
+            raise RuntimeError('falha no meio da gravação')
+
+        monkeypatch.setattr(books_ingestion.json, 'dump', failing_dump)
+        with pytest.raises(RuntimeError):
+            refresh(server, paths)
+
+    # o delta anterior continua intacto e não sobra arquivo temporário
+    assert paths['delta_path'].read_text(encoding = 'utf-8') == previous
+    assert not [path for path in paths['delta_path'].parent.iterdir() if path.name.endswith('.tmp')]
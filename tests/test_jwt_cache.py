@@ -0,0 +1,113 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import base64
+import json
+from datetime import timedelta
+
+import jwt as pyjwt
+import pytest
+from flask_jwt_extended import create_access_token
+
+from src import jwt_cache
+from src.jwt_cache import token_cache
+
+# ----------------------------------------------------------------------------------------------- #
+# Fixtures
+# ----------------------------------------------------------------------------------------------- #
+
+@pytest.fixture
+def verifications(monkeypatch):
+    """Conta as verificações completas de token (assinatura e claims) feitas pelas rotas."""
+    calls = []
+    verify = jwt_cache.verify_jwt_in_request
+
+    def counting(*args, **kwargs):
+        calls.append(kwargs)
+        return verify(*args, **kwargs)
+
+    monkeypatch.setattr(jwt_cache, 'verify_jwt_in_request', counting)
+    return calls
+
+def make_token(app, **kwargs) -> str:
+    with app.app_context():
+        return create_access_token(identity = '1', **kwargs)
+
+def bearer(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+# ----------------------------------------------------------------------------------------------- #
+# Tokens já verificados
+# ----------------------------------------------------------------------------------------------- #
+
+def test_cached_token_is_not_verified_again(app, client, verifications):
+    token = make_token(app)
+    hits = token_cache.hits
+
+    first = client.get('/protected', headers = bearer(token))
+    second = client.get('/protected', headers = bearer(token))
+
+    assert first.status_code == second.status_code == 200
+    assert first.get_json() == second.get_json()
+    assert "ID 1" in second.get_json()['msg']
+
+    # a primeira requisição verifica o token (no before_request); a segunda vem do cache
+    assert len(verifications) == 1
+    assert token_cache.hits == hits + 1
+
+def test_request_without_token_is_rejected(client):
+    assert client.get('/protected').status_code == 401
+
+# ----------------------------------------------------------------------------------------------- #
+# Tokens expirados ou adulterados continuam rejeitados
+# ----------------------------------------------------------------------------------------------- #
+
+def test_expired_token_returns_401(app, client, verifications):
+    token = make_token(app, expires_delta = timedelta(seconds = -10))
+
+    for _ in range(2):
+        response = client.get('/protected', headers = bearer(token))
+        assert response.status_code == 401
+        assert 'expired' in response.get_json()['msg']
+
+    assert len(verifications) == 4  # before_request e @jwt_required, nas duas requisições
+
+def test_token_expired_while_cached_is_verified_again(app, client, verifications):
+    token = make_token(app, expires_delta = timedelta(seconds = -10))
+
+    # token guardado enquanto ainda era válido: a entrada não sobrevive ao exp
+    claims = pyjwt.decode(token, options = {'verify_signature': False})
+    token_cache.put(token, pyjwt.get_unverified_header(token), claims)
+
+    assert client.get('/protected', headers = bearer(token)).status_code == 401
+    assert verifications
+
+def encode_segment(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b'=').decode()
+
+def tampered_tokens(token: str) -> list:
+    header, payload, signature = token.split('.')
+    claims = pyjwt.decode(token, options = {'verify_signature': False})
+
+    middle = len(signature) // 2
+    forged_signature = signature[:middle] + ('A' if signature[middle] != 'A' else 'B') + signature[middle + 1:]
+
+    return [
+        f"{header}.{encode_segment({**claims, 'sub': '2'})}.{signature}",
+        f"{header}.{payload}.{forged_signature}",
+    ]
+
+def test_tampered_token_returns_422(app, client, verifications):
+    token = make_token(app)
+    assert client.get('/protected', headers = bearer(token)).status_code == 200
+
+    for forged in tampered_tokens(token):
+        response = client.get('/protected', headers = bearer(forged))
+        assert response.status_code == 422
+        assert 'Signature' in response.get_json()['msg']
+
+    # o token original continua servido pelo cache
+    calls = len(verifications)
+    assert client.get('/protected', headers = bearer(token)).status_code == 200
+    assert len(verifications) == calls
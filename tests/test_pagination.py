@@ -0,0 +1,88 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import pytest
+
+# ----------------------------------------------------------------------------------------------- #
+# Paginação por cursor nas rotas de listagem
+# ----------------------------------------------------------------------------------------------- #
+
+LIST_ROUTES = [
+    ('/api/v1/books/search', {'title': 'the'}),
+    ('/api/v1/books/top-rated', {}),
+    ('/api/v1/books/price-range', {'min': '20', 'max': '30'})
+]
+
+def follow_cursors(client, url, filters, limit, max_pages = 1000):
+    """Percorre todas as páginas de uma listagem seguindo o X-Next-Cursor."""
+    books, cursor, pages = [], None, 0
+
+    while True:
+        params = {**filters, 'limit': limit}
+        if cursor:
+            params['cursor'] = cursor
+
+        response = client.get(url, query_string = params)
+        assert response.status_code == 200
+        books += response.get_json()
+        pages += 1
+        assert pages <= max_pages, 'a paginação não terminou'
+
+        cursor = response.headers.get('X-Next-Cursor')
+        if cursor is None:
+            return books, pages
+
+@pytest.mark.parametrize('url, filters', LIST_ROUTES)
+@pytest.mark.parametrize('limit', [1, 7, 1000])
+def test_cursor_pages_concatenate_to_full_result(client, url, filters, limit):
+    full = client.get(url, query_string = filters).get_json()
+    books, pages = follow_cursors(client, url, filters, limit)
+
+    assert books == full
+    assert pages == max(1, -(-len(full) // limit))
+
+@pytest.mark.parametrize('url, filters', LIST_ROUTES)
+def test_total_count_and_link_headers(client, url, filters):
+    full = client.get(url, query_string = filters).get_json()
+    response = client.get(url, query_string = {**filters, 'limit': 5})
+
+    assert int(response.headers['X-Total-Count']) == len(full)
+    assert 'cursor=' in response.headers['Link'] and 'rel="next"' in response.headers['Link']
+
+@pytest.mark.parametrize('limit', ['0', '-1', 'abc'])
+def test_invalid_limit_is_rejected(client, limit):
+    response = client.get('/api/v1/books/top-rated', query_string = {'limit': limit})
+    assert response.status_code == 400
+    assert 'X-Next-Cursor' not in response.headers
+
+def test_cursor_from_another_query_is_rejected(client):
+    cursor = client.get('/api/v1/books/search', query_string = {'title': 'the', 'limit': 2}).headers['X-Next-Cursor']
+    response = client.get('/api/v1/books/search', query_string = {'title': 'love', 'limit': 2, 'cursor': cursor})
+    assert response.status_code == 400
+
+def test_offset_on_price_range(client):
+    full = client.get('/api/v1/books/price-range?min=20&max=30').get_json()
+    page = client.get('/api/v1/books/price-range?min=20&max=30&offset=10&limit=5').get_json()
+    assert page == full[10:15]
+
+def test_fields_projection(client):
+    books = client.get('/api/v1/books/top-rated', query_string = {'fields': 'title,id'}).get_json()
+    assert books and all(set(book) == {'id', 'title'} for book in books)
+
+    assert client.get('/api/v1/books/top-rated', query_string = {'fields': 'nope'}).status_code == 400
+
+def test_books_pages_share_the_full_catalog_shape(client, auth_headers):
+    full = client.get('/api/v1/books', headers = auth_headers)
+    page = client.get('/api/v1/books', query_string = {'limit': 5}, headers = auth_headers)
+    assert page.status_code == 200
+    assert page.content_type == full.content_type
+    assert page.get_json() == dict(list(full.get_json().items())[:5])
+    # mesmo serializador do catálogo completo: texto em UTF-8, sem escapes \uXXXX
+    assert b'\\u' not in page.data and '’'.encode() in page.data
+
+def test_books_fields_projection_keeps_id_keys(client, auth_headers):
+    full = client.get('/api/v1/books', headers = auth_headers).get_json()
+    books = client.get('/api/v1/books', query_string = {'limit': 5, 'fields': 'title,price'}, headers = auth_headers).get_json()
+    assert list(books) == list(full)[:5]
+    assert all(set(book) == {'title', 'price'} and book['title'] == full[key] for key, book in books.items())
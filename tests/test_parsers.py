@@ -0,0 +1,38 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import os
+
+import pytest
+
+from parsers import PARSERS, get_parser, parse_bs4, parse_lxml
+
+FIXTURE_PAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "category_page.html")
+
+# ----------------------------------------------------------------------------------------------- #
+# Backends de parsing comparados com o parser de referência (bs4)
+# ----------------------------------------------------------------------------------------------- #
+
+@pytest.fixture(scope = "module")
+def category_html():
+    with open(FIXTURE_PAGE, encoding = "utf-8") as f:
+        return f.read()
+
+def test_lxml_is_the_default_parser():
+    assert get_parser() is parse_lxml
+
+def test_lxml_matches_bs4_on_saved_category_page(category_html):
+    expected = parse_bs4(category_html)
+
+    assert len(expected.books) == 12
+    assert expected.page_count == 2 and expected.next_href == 'page-2.html'
+    assert parse_lxml(category_html) == expected
+
+@pytest.mark.parametrize('name', sorted(PARSERS))
+def test_every_installed_backend_matches_bs4(category_html, name):
+    assert PARSERS[name](category_html) == parse_bs4(category_html)
+
+def test_unknown_parser_is_rejected():
+    with pytest.raises(ValueError):
+        get_parser('nope')
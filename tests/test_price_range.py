@@ -0,0 +1,58 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import pytest
+
+# ----------------------------------------------------------------------------------------------- #
+# Faixa de preço comparada com o filtro original (price >= min e <= max, ordenado por preço)
+# ----------------------------------------------------------------------------------------------- #
+
+def baseline_price_range(df, min_price = None, max_price = None):
+    """Filtro das rotas originais sobre o DataFrame (vírgula aceita como separador decimal)."""
+    if min_price:
+        df = df[df['price'] >= float(min_price.replace(',', '.'))]
+    if max_price:
+        df = df[df['price'] <= float(max_price.replace(',', '.'))]
+    return df.sort_values('price').to_dict(orient = 'records')
+
+@pytest.mark.parametrize('min_price, max_price', [
+    ('20', '30'),
+    ('10', '59.99'),
+    ('51.77', '51.77'),
+    ('13,99', '14,5'),
+    ('50', None),
+    (None, '12'),
+    (None, None),
+    ('0', '1000'),
+    ('  25 ', '26'),
+    ('1e1', '1.1e1'),
+    ('-inf', 'inf')
+])
+def test_price_range_matches_baseline(client, baseline_df, min_price, max_price):
+    args = {name: value for name, value in (('min', min_price), ('max', max_price)) if value is not None}
+    response = client.get('/api/v1/books/price-range', query_string = args)
+
+    expected = baseline_price_range(baseline_df, min_price, max_price)
+    books = response.get_json()
+
+    assert response.status_code == 200
+    # o sort original não era estável: entre preços iguais, a ordem é comparada sem posição
+    assert [book['price'] for book in books] == [book['price'] for book in expected]
+    assert sorted(books, key = lambda book: book['id']) == sorted(expected, key = lambda book: book['id'])
+
+@pytest.mark.parametrize('args', [{'min': '70'}, {'max': '5'}, {'min': '30', 'max': '20'}, {'min': 'nan'}])
+def test_price_range_without_books_returns_404(client, args):
+    response = client.get('/api/v1/books/price-range', query_string = args)
+    assert response.status_code == 404
+    assert response.get_json() == {'message': 'Nenhum livro encontrado'}
+
+@pytest.mark.parametrize('args', [{'min': 'abc'}, {'max': '10;20'}, {'min': '10', 'max': 'x'}])
+def test_price_range_invalid_value_keeps_original_status(client, args):
+    response = client.get('/api/v1/books/price-range', query_string = args)
+    assert response.status_code == 500
+    assert response.get_json() == {'message': 'Formato de valor inválido'}
+
+def test_empty_bound_is_ignored(client, baseline_df):
+    books = client.get('/api/v1/books/price-range?min=&max=11').get_json()
+    assert sorted(book['id'] for book in books) == sorted(book['id'] for book in baseline_price_range(baseline_df, None, '11'))
@@ -0,0 +1,101 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import os
+import pstats
+
+import pytest
+
+from src.instances import profiler, response_cache
+
+# ----------------------------------------------------------------------------------------------- #
+# Fixtures
+# ----------------------------------------------------------------------------------------------- #
+
+URL = '/api/v1/books/top-rated'
+ADMIN = {'X-Admin-Token': 'test-admin-token'}
+
+@pytest.fixture
+def profiles(tmp_path, monkeypatch):
+    """Profiler habilitado, sem amostragem, gravando numa pasta temporária."""
+    monkeypatch.setattr(profiler, 'enabled', True)
+    monkeypatch.setattr(profiler, 'sample_rate', 0.0)
+    monkeypatch.setattr(profiler, 'directory', str(tmp_path))
+    return tmp_path
+
+@pytest.fixture
+def cache():
+    response_cache.clear()
+    yield response_cache
+    response_cache.clear()
+
+def profiled_functions(directory, profile_id: str) -> set:
+    stats = pstats.Stats(os.path.join(directory, f"{profile_id}.prof"))
+    return {name for _, _, name in stats.stats}
+
+# ----------------------------------------------------------------------------------------------- #
+# Quando uma requisição é perfilada
+# ----------------------------------------------------------------------------------------------- #
+
+def test_disabled_profiler_ignores_admin_header(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(profiler, 'directory', str(tmp_path))
+    assert not profiler.enabled
+
+    response = client.get(URL, headers = {'X-Profile': '1', **ADMIN})
+
+    assert response.status_code == 200
+    assert 'X-Profile-Id' not in response.headers
+    assert not os.listdir(tmp_path)
+
+@pytest.mark.parametrize('headers', [
+    {'X-Profile': '1'},
+    {'X-Profile': '1', 'X-Admin-Token': 'wrong-token'},
+    ADMIN,
+])
+def test_profile_requires_header_and_admin_token(client, profiles, headers):
+    response = client.get(URL, headers = headers)
+
+    assert response.status_code == 200
+    assert 'X-Profile-Id' not in response.headers
+    assert not os.listdir(profiles)
+
+def test_profile_requires_configured_admin_token(app, client, profiles, monkeypatch):
+    monkeypatch.setitem(app.config, 'ADMIN_TOKEN', None)
+
+    response = client.get(URL, headers = {'X-Profile': '1', **ADMIN})
+    assert 'X-Profile-Id' not in response.headers
+
+def test_admin_request_is_profiled(client, profiles):
+    response = client.get(URL, headers = {'X-Profile': '1', **ADMIN})
+    profile_id = response.headers['X-Profile-Id']
+
+    assert response.status_code == 200
+    assert sorted(os.listdir(profiles)) == [f"{profile_id}.json", f"{profile_id}.prof"]
+
+    listed = client.get('/api/v1/admin/profiles', headers = ADMIN).get_json()
+    assert [info['id'] for info in listed['profiles']] == [profile_id]
+
+def test_sampled_request_is_profiled(client, profiles, monkeypatch):
+    monkeypatch.setattr(profiler, 'sample_rate', 1.0)
+    assert 'X-Profile-Id' in client.get(URL).headers
+
+# ----------------------------------------------------------------------------------------------- #
+# Requisições perfiladas não são servidas pelo cache de respostas
+# ----------------------------------------------------------------------------------------------- #
+
+def test_profiled_request_bypasses_response_cache(client, profiles, cache):
+    first = client.get(URL)
+    assert client.get(URL).data == first.data
+    hits = cache.hits
+
+    profiled = client.get(URL, headers = {'X-Profile': '1', **ADMIN})
+
+    # a rota foi executada (e aparece no perfil), com a mesma resposta do cache
+    assert profiled.data == first.data
+    assert cache.hits == hits
+    assert 'get_top_rated' in profiled_functions(profiles, profiled.headers['X-Profile-Id'])
+
+    # requisições sem perfil continuam vindo do cache
+    assert client.get(URL).data == first.data
+    assert cache.hits == hits + 1
@@ -0,0 +1,85 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import json
+import logging
+
+from src.logging_config import RequestLogQueue
+
+# ----------------------------------------------------------------------------------------------- #
+# Logs excedentes: rotação e reenvio ao Supabase
+# ----------------------------------------------------------------------------------------------- #
+
+class FakeSupabase:
+    """Cliente mínimo do Supabase: guarda as linhas inseridas ou falha, conforme `available`."""
+
+    def __init__(self):
+        self.available = True
+        self.rows = []
+
+    def table(self, name):
+        return self
+
+    def insert(self, rows):
+        self._pending = rows
+        return self
+
+    def execute(self):
+        if not self.available:
+            raise ConnectionError("supabase fora do ar")
+        self.rows += self._pending
+
+def make_queue(tmp_path, supabase, **kwargs):
+    return RequestLogQueue(supabase, logging.getLogger("test"), batch_size = 10,
+                           spill_file = str(tmp_path / "spill.jsonl"), **kwargs)
+
+def spill(log_queue, rows):
+    for row in rows:
+        log_queue._queue.put_nowait(row)
+    log_queue.flush()
+
+def rows(count, start = 0):
+    return [{"user_id": None, "method": "GET", "path": f"/p/{i}", "status_code": 200} for i in range(start, start + count)]
+
+def test_failed_batches_are_spilled_and_replayed(tmp_path):
+    supabase = FakeSupabase()
+    log_queue = make_queue(tmp_path, supabase)
+
+    supabase.available = False
+    spill(log_queue, rows(25))
+    assert log_queue.spilled == 25 and supabase.rows == []
+
+    supabase.available = True
+    assert log_queue.replay_spill() == 25
+    assert supabase.rows == rows(25)
+    assert log_queue.replayed == 25
+    assert list(tmp_path.iterdir()) == []
+
+def test_failed_replay_keeps_rows_in_spill_file(tmp_path):
+    supabase = FakeSupabase()
+    log_queue = make_queue(tmp_path, supabase)
+
+    supabase.available = False
+    spill(log_queue, rows(25))
+    assert log_queue.replay_spill() == 0
+
+    with open(tmp_path / "spill.jsonl", encoding = "utf-8") as f:
+        assert sorted(json.loads(line)["path"] for line in f) == sorted(row["path"] for row in rows(25))
+
+def test_spill_file_is_rotated_at_max_bytes(tmp_path):
+    supabase = FakeSupabase()
+    supabase.available = False
+    log_queue = make_queue(tmp_path, supabase, spill_max_bytes = 2000)
+
+    spill(log_queue, rows(200))
+
+    assert (tmp_path / "spill.jsonl").stat().st_size < 2000 + 1000
+    assert (tmp_path / "spill.jsonl.1").stat().st_size < 2000 + 1000
+    assert log_queue.dropped > 0
+
+    # as linhas guardadas são as mais recentes, sem duplicatas nem perdas além das contadas
+    supabase.available = True
+    replayed = log_queue.replay_spill()
+    assert replayed + log_queue.dropped == 200
+    assert supabase.rows == rows(200)[-replayed:]
@@ -0,0 +1,59 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import pytest
+
+from src.instances import response_cache
+
+# ----------------------------------------------------------------------------------------------- #
+# Cache de respostas: ETag/304, chave e limites de memória
+# ----------------------------------------------------------------------------------------------- #
+
+@pytest.fixture
+def cache():
+    response_cache.clear()
+    yield response_cache
+    response_cache.clear()
+
+def test_etag_revalidation_returns_304(client, cache):
+    response = client.get('/api/v1/books/top-rated')
+    assert response.status_code == 200 and response.headers['ETag']
+
+    revalidated = client.get('/api/v1/books/top-rated', headers = {'If-None-Match': response.headers['ETag']})
+    assert revalidated.status_code == 304
+    assert revalidated.data == b''
+
+def test_cached_response_keeps_page_headers(client, cache):
+    url = '/api/v1/books/search?title=the&limit=3'
+    first, second = client.get(url), client.get(url)
+    assert cache.hits >= 1
+    assert first.data == second.data
+    assert first.headers['X-Next-Cursor'] == second.headers['X-Next-Cursor']
+
+def test_unknown_args_do_not_create_entries(client, cache):
+    base = client.get('/api/v1/books/price-range?min=20&max=30')
+    entries = len(cache)
+
+    for junk in range(20):
+        response = client.get(f'/api/v1/books/price-range?min=20&max=30&x={junk}')
+        assert response.data == base.data
+
+    assert len(cache) == entries
+
+def test_cache_is_bounded_by_bytes(client, cache, monkeypatch):
+    monkeypatch.setattr(cache, 'max_bytes', 200_000)
+    monkeypatch.setattr(cache, 'max_entry_bytes', 100_000)
+
+    for low in range(10, 60, 5):
+        client.get('/api/v1/books/price-range', query_string = {'min': low, 'max': low + 10})
+        assert cache.bytes <= cache.max_bytes
+
+    assert cache.bytes == sum(entry.size for entry in cache._entries.values())
+
+def test_large_responses_are_not_cached(client, cache, monkeypatch):
+    monkeypatch.setattr(cache, 'max_entry_bytes', 1_000)
+
+    response = client.get('/api/v1/books/price-range?min=0&max=100')
+    assert response.status_code == 200
+    assert len(cache) == 0
@@ -0,0 +1,60 @@
+# ----------------------------------------------------------------------------------------------- #
+# Imports
+# ----------------------------------------------------------------------------------------------- #
+
+import pytest
+
+from src.catalog.search import tokenize
+
+# ----------------------------------------------------------------------------------------------- #
+# Busca comparada com o filtro original (trecho do título/categoria, sem diferenciar maiúsculas)
+# ----------------------------------------------------------------------------------------------- #
+
+def baseline_ids(df, column, text):
+    return set(df[df[column].str.lower().str.contains(text.lower(), regex = False)]['id'])
+
+def search_ids(client, **params):
+    response = client.get('/api/v1/books/search', query_string = params)
+    assert response.status_code == 200
+    return [book['id'] for book in response.get_json()]
+
+@pytest.mark.parametrize('text', ['love', 'the', 'harry', 'potter', 'a', '-', '(', "'s", 'é', "king's", 'zzzz'])
+def test_title_search_matches_baseline(client, baseline_df, text):
+    assert set(search_ids(client, title = text)) == baseline_ids(baseline_df, 'title', text)
+
+@pytest.mark.parametrize('text', ['fic', 'Travel', 'science fiction', 'y'])
+def test_category_search_matches_baseline(client, baseline_df, text):
+    assert set(search_ids(client, category = text)) == baseline_ids(baseline_df, 'category', text)
+
+def test_title_and_category_intersect(client, baseline_df):
+    expected = baseline_ids(baseline_df, 'title', 'the') & baseline_ids(baseline_df, 'category', 'fiction')
+    assert set(search_ids(client, title = 'the', category = 'fiction')) == expected
+
+@pytest.mark.parametrize('text', ['-', '(', '!!', "'", '  '])
+def test_filter_without_tokens_never_returns_whole_catalog(client, baseline_df, text):
+    ids = search_ids(client, title = text)
+    assert len(ids) < len(baseline_df)
+    assert set(ids) == baseline_ids(baseline_df, 'title', text)
+
+def test_no_filter_returns_whole_catalog(client, baseline_df):
+    assert search_ids(client) == baseline_df['id'].tolist()
+
+def test_two_letter_terms_match_word_prefixes(client, baseline_df):
+    ids = set(search_ids(client, title = 'ha'))
+    assert ids and ids <= baseline_ids(baseline_df, 'title', 'ha')
+
+def test_results_are_ranked_by_relevance(client):
+    # correspondência exata da palavra vem antes de prefixo e trecho
+    ids = search_ids(client, title = 'love', fields = 'id,title')
+    first = client.get(f'/api/v1/books/{ids[0]}').get_json()[0]
+    assert 'love' in tokenize(first['title'])
+
+@pytest.mark.parametrize('text', ['a light in the attic', 'vol. 1', 'the a', "king's", 'of the r', 'ing a'])
+def test_literal_search_uses_index_candidates(client, baseline_df, monkeypatch, text):
+    from src.catalog.search import FieldIndex
+
+    def scan(self, text):
+        raise AssertionError(f"busca por {text!r} percorreu o catálogo inteiro")
+
+    monkeypatch.setattr(FieldIndex, 'scan', scan)
+    assert set(search_ids(client, title = text)) == baseline_ids(baseline_df, 'title', text)
@@ -0,0 +1,36 @@
+# ----------------------------------------------------------------------------------------------- #
+# Estatísticas, categorias e top-rated comparados com os cálculos originais sobre o DataFrame
+# ----------------------------------------------------------------------------------------------- #
+
+def test_overview_matches_baseline(client, baseline_df):
+    overview = client.get('/api/v1/stats/overview').get_json()
+
+    assert overview == {
+        'total_books': baseline_df.shape[0],
+        'mean_price': round(baseline_df['price'].mean(), 2),
+        'ratings_distribution': {str(rating): count for rating, count in baseline_df['rating'].value_counts().items()}
+    }
+
+def test_category_stats_match_baseline(client, baseline_df):
+    expected = (
+        baseline_df.groupby('category')
+        .agg(
+            n_books = ('title', 'count'),
+            price_min = ('price', 'min'),
+            price_max = ('price', 'max'),
+            price_mean = ('price', 'mean'),
+            rating_mean = ('rating', 'mean')
+        )
+        .round(2)
+        .to_dict(orient = 'index')
+    )
+
+    assert client.get('/api/v1/stats/categories').get_json() == expected
+
+def test_categories_keep_first_appearance_order(client, baseline_df):
+    categories = client.get('/api/v1/categories').get_json()
+    assert categories == {'categories': list(baseline_df['category'].unique())}
+
+def test_top_rated_matches_baseline(client, baseline_df):
+    expected = baseline_df[baseline_df['rating'] == baseline_df['rating'].max()].to_dict(orient = 'records')
+    assert client.get('/api/v1/books/top-rated').get_json() == expected